@@ -14,28 +14,35 @@ Input (18) -> Encoder (12) -> Latent (6) -> Decoder (12) -> Output (18)
 """
 import numpy as np
 import os
+from typing import Optional
+
+from shunollo_core.utils.precision import DTypeLike, float_dtype
 
 class Autoencoder:
-    def __init__(self, input_size: int = 18, hidden_size: int = 12, latent_size: int = 6):
+    def __init__(self, input_size: int = 18, hidden_size: int = 12, latent_size: int = 6,
+                 dtype: Optional[DTypeLike] = None):
         self.input_size = input_size
         self.learning_rate = 0.05 # Increased learning rate for faster convergence
+        # Working precision (None follows config.precision)
+        self.dtype = float_dtype(dtype)
         
         # Xavier/He-like Initialization (Better variance handling)
+        # Draws stay float64 so both precisions share the same initial weights
         np.random.seed(42)
         scale1 = np.sqrt(2.0 / (input_size + hidden_size))
-        self.W_enc1 = np.random.randn(hidden_size, input_size) * scale1
-        self.b_enc1 = np.zeros((hidden_size, 1))
+        self.W_enc1 = (np.random.randn(hidden_size, input_size) * scale1).astype(self.dtype)
+        self.b_enc1 = np.zeros((hidden_size, 1), dtype=self.dtype)
         
         scale2 = np.sqrt(2.0 / (hidden_size + latent_size))
-        self.W_enc2 = np.random.randn(latent_size, hidden_size) * scale2
-        self.b_enc2 = np.zeros((latent_size, 1))
+        self.W_enc2 = (np.random.randn(latent_size, hidden_size) * scale2).astype(self.dtype)
+        self.b_enc2 = np.zeros((latent_size, 1), dtype=self.dtype)
         
         # Decoder Weights
-        self.W_dec1 = np.random.randn(hidden_size, latent_size) * scale2
-        self.b_dec1 = np.zeros((hidden_size, 1))
+        self.W_dec1 = (np.random.randn(hidden_size, latent_size) * scale2).astype(self.dtype)
+        self.b_dec1 = np.zeros((hidden_size, 1), dtype=self.dtype)
         
-        self.W_dec2 = np.random.randn(input_size, hidden_size) * scale1
-        self.b_dec2 = np.zeros((input_size, 1))
+        self.W_dec2 = (np.random.randn(input_size, hidden_size) * scale1).astype(self.dtype)
+        self.b_dec2 = np.zeros((input_size, 1), dtype=self.dtype)
 
     def _sigmoid(self, x):
         return 1.0 / (1.0 + np.exp(-np.clip(x, -15, 15)))
@@ -49,6 +56,7 @@ class Autoencoder:
         Pass x through Encoder -> Latent -> Decoder.
         Returns: (reconstruction, latent_vector)
         """
+        x = np.asarray(x, dtype=self.dtype)
         if x.ndim == 1: x = x.reshape(-1, 1)
         
         # Input validation: Replace NaN/Inf with zeros for numerical stability
@@ -78,6 +86,7 @@ class Autoencoder:
         High Error = Anomaly.
         """
         recon, _ = self.forward(x)
+        x = np.asarray(x, dtype=self.dtype)
         if x.ndim == 1: x = x.reshape(-1, 1)
         loss = np.mean((x - recon) ** 2)
         return float(loss)
@@ -88,6 +97,7 @@ class Autoencoder:
         Simple Backpropagation (SGD).
         """
         recon, _ = self.forward(x)
+        x = np.asarray(x, dtype=self.dtype)
         if x.ndim == 1: x = x.reshape(-1, 1)
         
         # 1. Output Layer Error (MSE Gradient)
@@ -148,14 +158,14 @@ class Autoencoder:
         
         try:
             with np.load(path) as data:
-                self.W_enc1 = data["W_enc1"]
-                self.b_enc1 = data["b_enc1"]
-                self.W_enc2 = data["W_enc2"]
-                self.b_enc2 = data["b_enc2"]
-                self.W_dec1 = data["W_dec1"]
-                self.b_dec1 = data["b_dec1"]
-                self.W_dec2 = data["W_dec2"]
-                self.b_dec2 = data["b_dec2"]
+                self.W_enc1 = data["W_enc1"].astype(self.dtype)
+                self.b_enc1 = data["b_enc1"].astype(self.dtype)
+                self.W_enc2 = data["W_enc2"].astype(self.dtype)
+                self.b_enc2 = data["b_enc2"].astype(self.dtype)
+                self.W_dec1 = data["W_dec1"].astype(self.dtype)
+                self.b_dec1 = data["b_dec1"].astype(self.dtype)
+                self.W_dec2 = data["W_dec2"].astype(self.dtype)
+                self.b_dec2 = data["b_dec2"].astype(self.dtype)
         except Exception as e:
             print(f"Error loading Imagination state from {path}: {e}")
 
@@ -13,40 +13,46 @@ import numpy as np
 import os
 from typing import Tuple, Optional
 
+from shunollo_core.utils.precision import DTypeLike, float_dtype
+
 class LinearAssociativeMemory:
     """
     A simple specialized neural associative memory.
     Maps an Input Vector (18-dim Sensation) -> Output Scalar (Anomaly Probability).
     """
-    def __init__(self, input_size: int = 18, reservoir_size: int = 100, spectral_radius: float = 0.9):
+    def __init__(self, input_size: int = 18, reservoir_size: int = 100, spectral_radius: float = 0.9,
+                 dtype: Optional[DTypeLike] = None):
         self.input_size = input_size
         self.reservoir_size = reservoir_size
         self.learning_rate = 0.05 # Faster learning with better separation
+        # Working precision (None follows config.precision)
+        self.dtype = float_dtype(dtype)
         
         # 1. Fixed Recurrent Weights (The "Structure" of the Brain)
+        # Spectral scaling runs in float64; only the final weights are cast
         np.random.seed(42) # Deterministic
-        self.W_res = np.random.randn(reservoir_size, reservoir_size)
+        W_res = np.random.randn(reservoir_size, reservoir_size)
         
-        rhoW = max(abs(np.linalg.eigvals(self.W_res)))
-        self.W_res = self.W_res * (spectral_radius / rhoW)
+        rhoW = max(abs(np.linalg.eigvals(W_res)))
+        self.W_res = (W_res * (spectral_radius / rhoW)).astype(self.dtype)
         
         # 2. Input Weights (Sensory Projection)
-        self.W_in = np.random.uniform(-1, 1, (reservoir_size, input_size))
+        self.W_in = np.random.uniform(-1, 1, (reservoir_size, input_size)).astype(self.dtype)
         
         # 3. Fixed Reservoir Bias (To ensure separability of low magnitude inputs)
         # Mimics "Baseline Firing Rate"
-        self.W_bias = np.random.uniform(-1, 1, (reservoir_size, 1))
+        self.W_bias = np.random.uniform(-1, 1, (reservoir_size, 1)).astype(self.dtype)
         
         # 4. Trainable Output Weights (Synapses)
-        self.W_out = np.zeros((1, reservoir_size))
+        self.W_out = np.zeros((1, reservoir_size), dtype=self.dtype)
         self.bias = 0.0 # Trainable output threshold
         
         # State vector (Short-term memory)
-        self.state = np.zeros((reservoir_size, 1))
+        self.state = np.zeros((reservoir_size, 1), dtype=self.dtype)
 
     def reset(self):
         """Clear short-term memory (Sleep/Reset)."""
-        self.state = np.zeros((self.reservoir_size, 1))
+        self.state = np.zeros((self.reservoir_size, 1), dtype=self.dtype)
 
     def forward(self, u: np.ndarray) -> dict:
         """
@@ -54,6 +60,7 @@ class LinearAssociativeMemory:
         u: Input vector (shape [18] or [18, 1])
         Returns: Dict containing 'classification_score' (0.0-1.0) and 'anomaly_score' (Reconstruction error or similar)
         """
+        u = np.asarray(u, dtype=self.dtype)
         if u.ndim == 1:
             u = u.reshape(-1, 1)
         
@@ -137,14 +144,14 @@ class LinearAssociativeMemory:
         
         try:
             with np.load(path) as data:
-                self.W_in = data["W_in"]
-                self.W_res = data["W_res"]
-                self.W_bias = data.get("W_bias", np.zeros((self.reservoir_size, 1)))
-                self.W_out = data["W_out"]
+                self.W_in = data["W_in"].astype(self.dtype)
+                self.W_res = data["W_res"].astype(self.dtype)
+                self.W_bias = data.get("W_bias", np.zeros((self.reservoir_size, 1))).astype(self.dtype)
+                self.W_out = data["W_out"].astype(self.dtype)
                 # Unwrap scalar
                 bias_val = data.get("bias", 0.0)
                 self.bias = float(bias_val) if np.ndim(bias_val) == 0 else float(bias_val[0])
-                self.state = data["state"]
+                self.state = data["state"].astype(self.dtype)
         except Exception as e:
             print(f"Error loading Brain state from {path}: {e}")
 
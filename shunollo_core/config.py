@@ -17,7 +17,21 @@ DEFAULT_CONFIG = {
         "codon_memory_path": "shunollo_core/data/codon_memory.json",
         "last_summary_path": "data/last_summary.json",
         "firewall_rules_path": "data/firewall_rules.yaml",
-        "retention_seconds": 3600
+        # Episodic retention is opt-in: episodes are kept forever unless this is
+        # set (e.g. storage: {retention_seconds: 86400} in shunollo.yaml), after
+        # which sealed segments older than it are deleted every compact_interval_seconds
+        "retention_seconds": None,
+        "compact_interval_seconds": 300,
+        "episodic_write_behind": True,   # group-commit Hippocampus writes off the perception loop
+        "episodic_durability": "flush"   # "none" | "flush" | "fsync" per group commit
+    },
+    "nervous_system": {
+        # Bounded ingress: policy is "block" | "drop_newest" | "drop_oldest" |
+        # "drop_lowest_priority" | "ras" (salience-guided sampling above high_water)
+        "ingress": {"maxsize": 10000, "policy": "drop_oldest", "high_water": 0.5,
+                    # "priority" lets salient signals overtake; aging stops starvation
+                    "scheduling": "priority", "aging_seconds": 0.5},
+        "stages": {}  # per-stage overrides, e.g. {"visual": {"workers": 4, "queue_size": 512}}
     },
     "perception_matrix": {
         "enabled": True,
@@ -32,6 +46,9 @@ DEFAULT_CONFIG = {
         "script_dir": "scripts/responses",
         "allowed_scripts": ["echo_alert.py"]
     },
+    "precision": {
+        "dtype": "float64"  # "float32" runs memory/brain hot paths in single precision
+    },
     "tts": {
         "enabled": True,
         "engine": "pyttsx3",
@@ -103,6 +120,9 @@ class ConfigManager:
     @property
     def storage(self): return self._config["storage"]
 
+    @property
+    def nervous_system(self): return self._config.get("nervous_system", {})
+
     @property
     def perception_matrix(self): return self._config.get("perception_matrix", self._config.get("sensorium", {}))
 
@@ -111,6 +131,9 @@ class ConfigManager:
         # Deprecated: use perception_matrix
         return self.perception_matrix
 
+    @property
+    def precision(self): return self._config.get("precision", {})
+
     @property
     def security(self): return self._config.get("security", {})
 
@@ -26,6 +26,12 @@ Universal Domain Adapter for Shunollo
        action = agent.minimize_surprise(qualia_to_vector(qualia))
    ```
 
+3. **BATCH MODE**: Columnar frames (many hosts/sensors per call)
+   ```python
+   qualia = adapter.process_batch({"bytes": bytes_col, "latency_ms": latency_col})
+   hot = qualia[qualia["energy"] > 0.8]   # structured array, one row per sample
+   ```
+
 ## Supported Normalization Schemes:
 
 - **unipolar** [0, 1]: Standard intensity (brightness, pressure, load)
@@ -40,9 +46,10 @@ Any data source can be adapted:
 - Financial data (prices, volumes, order flow)
 - Any time-series or event stream
 """
-from typing import Dict, Any, Optional, Callable, Literal
+from typing import Dict, Any, Optional, Callable, Literal, List, Mapping, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 import math
+import numpy as np
 from shunollo_core.physics import (
     calculate_entropy,
     calculate_energy,
@@ -62,6 +69,28 @@ from shunollo_core.physics import (
 # Normalization scheme type
 NormScheme = Literal["unipolar", "bipolar", "log", "unbounded"]
 
+# One row of process_batch() output: the scalar qualia of process()
+QUALIA_DTYPE = np.dtype([
+    ("energy", np.float64),
+    ("roughness", np.float64),
+    ("flux", np.float64),
+    ("viscosity", np.float64),
+    ("salience", np.float64),
+    ("dissonance", np.float64),
+    ("harmony", np.float64),
+    ("volatility", np.float64),
+    ("action", np.float64),
+    ("hamiltonian", np.float64),
+    ("distortion_detected", np.bool_),
+])
+
+# Relative von Mises stress above which a frame counts as distorted
+# (StressTensor.is_distortion_anomaly default)
+DISTORTION_THRESHOLD = 0.1
+
+# Columnar input: (n, m) array with metric names, or metric -> (n,) array
+BatchInput = Union[np.ndarray, Mapping[str, Any]]
+
 
 @dataclass
 class DomainConfig:
@@ -80,6 +109,37 @@ class DomainConfig:
     
     # Custom normalizers (optional)
     normalizers: Dict[str, Callable[[float], float]] = field(default_factory=dict)
+    
+    # Compiled plans per metric set (see plan()); rebuilt by recompile()
+    _plans: Dict[Tuple[str, ...], "NormalizationPlan"] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    
+    # Bound on cached plans: raw dicts with ever-changing key sets must not leak
+    MAX_PLANS = 256
+    
+    def __post_init__(self) -> None:
+        # The declared metrics are the common frame: compile them up front
+        self.plan(tuple(self.bounds))
+    
+    def plan(self, metrics: Sequence[str]) -> "NormalizationPlan":
+        """
+        Compiled normalization for one metric set, in column order.
+        
+        Plans are cached, so repeated frames with the same metrics pay for
+        the scheme and bounds lookups once.
+        """
+        key = tuple(metrics)
+        plan = self._plans.get(key)
+        if plan is None:
+            if len(self._plans) >= self.MAX_PLANS:
+                self._plans.pop(next(iter(self._plans)))  # evict the oldest
+            plan = self._plans[key] = NormalizationPlan(self, key)
+        return plan
+    
+    def recompile(self) -> None:
+        """Drop compiled plans. Call after editing bounds, schemes, exponents or normalizers."""
+        self._plans.clear()
 
 
 def normalize_value(
@@ -151,6 +211,175 @@ def normalize_value(
         return max(0.0, min(1.0, normalized))
 
 
+# Scheme codes in a NormalizationPlan
+SCHEME_UNIPOLAR, SCHEME_BIPOLAR, SCHEME_LOG, SCHEME_UNBOUNDED, SCHEME_CONSTANT, SCHEME_CUSTOM = range(6)
+
+
+class NormalizationPlan:
+    """
+    A DomainConfig compiled for one metric set: normalize_value() with the
+    per-metric lookups, scheme dispatch and degenerate-bound checks resolved
+    once, and the Stevens exponents gathered into a vector.
+    
+    Every scheme reduces to clip((f(x) - offset) / divisor, lo, hi), with
+    f = log10 for "log" and a tanh squash after the division for
+    "unbounded". Degenerate bounds become constant columns.
+    
+    Attributes:
+        metrics: Column order
+        codes: (m,) scheme code per column (SCHEME_*)
+        offset, divisor, lo, hi: (m,) affine and clip parameters
+        fill: (m,) value of constant columns
+        exponents: (m,) Stevens exponents (1.0 where none is defined)
+        scalar: Per-column normalizers for single samples
+    """
+    
+    def __init__(self, config: DomainConfig, metrics: Tuple[str, ...]):
+        m = len(metrics)
+        self.metrics = metrics
+        self.index = {metric: j for j, metric in enumerate(metrics)}
+        self.codes = np.empty(m, dtype=np.int8)
+        self.offset = np.zeros(m)
+        self.divisor = np.ones(m)
+        self.lo = np.full(m, -np.inf)
+        self.hi = np.full(m, np.inf)
+        self.fill = np.zeros(m)
+        self.exponents = np.ones(m)
+        scalar = []
+        for j, metric in enumerate(metrics):
+            scalar.append(self._compile_column(config, metric, j))
+            if metric in config.exponents:
+                self.exponents[j] = config.exponents[metric]
+        self.scalar: Tuple[Callable[[float], float], ...] = tuple(scalar)
+        
+        def columns(*codes: int) -> np.ndarray:
+            return np.flatnonzero(np.isin(self.codes, codes))
+        
+        self.log_cols = columns(SCHEME_LOG)
+        self.tanh_cols = columns(SCHEME_UNBOUNDED)
+        self.const_cols = columns(SCHEME_CONSTANT)
+        self.custom_cols = columns(SCHEME_CUSTOM)
+        # Columns whose scalar clamp sends NaN to the upper bound
+        self.nan_to_hi = np.isin(self.codes, (SCHEME_UNIPOLAR, SCHEME_BIPOLAR))
+        self.scaled_cols = np.flatnonzero([metric in config.exponents for metric in metrics])
+        self._scaled = tuple(
+            (int(j), float(self.exponents[j])) for j in self.scaled_cols
+        )
+        self._custom = tuple((int(j), scalar[j]) for j in self.custom_cols)
+    
+    def __repr__(self) -> str:
+        return f"NormalizationPlan(metrics={list(self.metrics)})"
+    
+    def _compile_column(self, config: DomainConfig, metric: str, j: int) -> Callable[[float], float]:
+        """
+        Fill column j's parameters; returns its scalar normalizer. The
+        arithmetic is normalize_value()'s; clamps are written as conditionals
+        (NaN still clamps to the upper bound, as max(lo, min(hi, nan)) does).
+        """
+        if metric in config.normalizers:
+            self.codes[j] = SCHEME_CUSTOM
+            return config.normalizers[metric]
+        
+        scheme = config.schemes.get(metric, "unipolar")
+        low, high = config.bounds.get(metric, (0, 100))  # Default: [0, 100]
+        
+        def constant(value_: float) -> Callable[[float], float]:
+            self.codes[j], self.fill[j] = SCHEME_CONSTANT, value_
+            return lambda value: value_
+        
+        if high == low:
+            return constant(0.5 if scheme == "unipolar" else 0.0)
+        
+        if scheme == "bipolar":
+            midpoint, half_range = (low + high) / 2, (high - low) / 2
+            self.codes[j], self.offset[j], self.divisor[j] = SCHEME_BIPOLAR, midpoint, half_range
+            self.lo[j], self.hi[j] = -1.0, 1.0
+            def bipolar(value: float) -> float:
+                x = (value - midpoint) / half_range
+                return -1.0 if x < -1.0 else (x if x <= 1.0 else 1.0)
+            return bipolar
+        
+        if scheme == "log":
+            log_low = math.log10(max(1e-10, low))
+            log_span = math.log10(max(1e-10, high)) - log_low
+            if log_span == 0:
+                return constant(0.5)
+            self.codes[j], self.offset[j], self.divisor[j] = SCHEME_LOG, log_low, log_span
+            self.lo[j], self.hi[j] = 0.0, 1.0
+            log10 = math.log10
+            
+            def log(value: float) -> float:
+                x = (log10(value if value > 1e-10 else 1e-10) - log_low) / log_span
+                return 0.0 if x < 0.0 else (x if x <= 1.0 else 1.0)
+            return log
+        
+        if scheme == "unbounded":
+            midpoint, scale = (low + high) / 2, (high - low) / 4
+            if scale <= 0:
+                return constant(0.0)
+            self.codes[j], self.offset[j], self.divisor[j] = SCHEME_UNBOUNDED, midpoint, scale
+            tanh = math.tanh
+            return lambda value: (tanh((value - midpoint) / scale) + 1) / 2
+        
+        # unipolar (and unknown schemes)
+        span = high - low
+        self.codes[j], self.offset[j], self.divisor[j] = SCHEME_UNIPOLAR, low, span
+        self.lo[j], self.hi[j] = 0.0, 1.0
+        def unipolar(value: float) -> float:
+            x = (value - low) / span
+            return 0.0 if x < 0.0 else (x if x <= 1.0 else 1.0)
+        return unipolar
+    
+    # --- Single samples ---
+    
+    def normalize_row(self, values: Sequence[float]) -> List[float]:
+        """Normalize one sample given in column order."""
+        return [normalize(value) for normalize, value in zip(self.scalar, values)]
+    
+    def perceive_row(self, normalized: Sequence[float]) -> List[float]:
+        """Apply the Stevens exponents to one normalized sample."""
+        perceived = list(normalized)
+        for j, exponent in self._scaled:
+            perceived[j] = perceived[j] ** exponent
+        return perceived
+    
+    # --- Blocks ---
+    
+    def normalize_block(self, raw: np.ndarray) -> np.ndarray:
+        """
+        Normalize an (n, m) block; returns a new float64 array. NaN inputs
+        come out as normalize_row() gives them: the upper bound for
+        unipolar/bipolar, the floor value for log, NaN for unbounded.
+        """
+        x = np.array(raw, dtype=np.float64)
+        if self.log_cols.size:
+            # fmax, like the scalar max(1e-10, value), replaces NaN with the floor
+            x[:, self.log_cols] = np.log10(np.fmax(x[:, self.log_cols], 1e-10))
+        x -= self.offset
+        x /= self.divisor
+        if self.tanh_cols.size:
+            x[:, self.tanh_cols] = (np.tanh(x[:, self.tanh_cols]) + 1) / 2
+        np.clip(x, self.lo, self.hi, out=x)
+        nan = np.isnan(x)
+        if nan.any():
+            rows, cols = np.nonzero(nan & self.nan_to_hi)
+            x[rows, cols] = self.hi[cols]
+        if self.const_cols.size:
+            x[:, self.const_cols] = self.fill[self.const_cols]
+        for j, normalize in self._custom:
+            x[:, j] = np.frompyfunc(normalize, 1, 1)(raw[:, j])
+        return x
+    
+    def perceive_block(self, normalized: np.ndarray) -> np.ndarray:
+        """Apply the Stevens exponents to an (n, m) normalized block; returns a new array."""
+        perceived = normalized.copy()
+        if self.scaled_cols.size:
+            perceived[:, self.scaled_cols] = np.power(
+                normalized[:, self.scaled_cols], self.exponents[self.scaled_cols]
+            )
+        return perceived
+
+
 # Pre-configured domains
 DOMAIN_CONFIGS = {
     "network": DomainConfig(
@@ -304,20 +533,8 @@ class UniversalAdapter:
         Returns:
             Normalized value (range depends on scheme)
         """
-        # Check for custom normalizer
-        if metric in self.config.normalizers:
-            return self.config.normalizers[metric](value)
-        
-        # Get scheme (default to unipolar)
-        scheme = self.config.schemes.get(metric, "unipolar")
-        
-        # Use bounds if defined
-        if metric in self.config.bounds:
-            low, high = self.config.bounds[metric]
-            return normalize_value(value, low, high, scheme)
-        else:
-            # Default: assume [0, 100] range for unipolar
-            return normalize_value(value, 0, 100, scheme)
+        # Unknown metrics default to unipolar over [0, 100]
+        return self.config.plan((metric,)).scalar[0](value)
     
     def apply_perceptual_scaling(self, metric: str, normalized: float) -> float:
         """
@@ -345,15 +562,14 @@ class UniversalAdapter:
         Returns:
             Physics profile (energy, roughness, viscosity, etc.)
         """
+        plan = self.config.plan(raw_data.keys())
+        
         # Step 1: Normalize all inputs
-        normalized = {}
-        for metric, value in raw_data.items():
-            normalized[metric] = self.normalize(metric, value)
+        norm_values = plan.normalize_row(raw_data.values())
+        normalized = dict(zip(plan.metrics, norm_values))
         
         # Step 2: Apply perceptual scaling
-        perceived = {}
-        for metric, value in normalized.items():
-            perceived[metric] = self.apply_perceptual_scaling(metric, value)
+        perceived = dict(zip(plan.metrics, plan.perceive_row(norm_values)))
         
         # Step 3: Map to physics qualia
         qualia = self._compute_qualia(raw_data, normalized, perceived)
@@ -365,6 +581,121 @@ class UniversalAdapter:
         
         return qualia
     
+    def _as_columns(self, data: BatchInput, metrics: Optional[Sequence[str]]) -> Tuple[List[str], np.ndarray]:
+        """Coerce batch input to (metric names, (n, m) float64 block)."""
+        if isinstance(data, Mapping) or getattr(getattr(data, "dtype", None), "names", None):
+            names = list(metrics or (data.keys() if isinstance(data, Mapping) else data.dtype.names))
+            if not names:
+                return [], np.empty((0, 0))
+            columns = [np.asarray(data[name], dtype=np.float64) for name in names]
+            n = columns[0].shape[0] if columns[0].ndim else 1
+            if any(column.shape != (n,) for column in columns):
+                raise ValueError("Every metric column must be a 1-D array of the same length")
+            block = np.empty((n, len(names)))
+            for j, column in enumerate(columns):
+                block[:, j] = column
+            return names, block
+        
+        block = np.asarray(data, dtype=np.float64)
+        if block.ndim != 2:
+            raise ValueError(f"Expected a 2-D (samples, metrics) array, got {block.ndim}-D")
+        if metrics is None or len(metrics) != block.shape[1]:
+            raise ValueError("A 2-D array needs one metric name per column")
+        return list(metrics), block
+    
+    def perceive_batch(
+        self,
+        data: BatchInput,
+        metrics: Optional[Sequence[str]] = None
+    ) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """
+        Columnar normalize() + apply_perceptual_scaling().
+        
+        Args:
+            data: (n, m) array with `metrics` naming its columns, a mapping of
+                  metric -> (n,) array, or a structured array
+            metrics: Column names (optional for mappings: selects and orders them)
+        
+        Returns:
+            (metric names, (n, m) normalized, (n, m) perceived)
+        
+        Raises:
+            ValueError: If the input shape and metric names disagree
+        """
+        names, raw = self._as_columns(data, metrics)
+        plan = self.config.plan(names)
+        normalized = plan.normalize_block(raw)
+        return names, normalized, plan.perceive_block(normalized)
+    
+    def process_batch(
+        self,
+        data: BatchInput,
+        metrics: Optional[Sequence[str]] = None,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Columnar process(): one row of qualia per sample.
+        
+        Each row equals the scalar fields of process() on that sample (the
+        per-sample "normalized"/"perceived" dicts are available as blocks
+        from perceive_batch()). The last rows are appended to the trend
+        history, as process() would.
+        
+        Args:
+            data: (n, m) array with `metrics` naming its columns, a mapping of
+                  metric -> (n,) array, or a structured array
+            metrics: Column names (optional for mappings)
+            out: Preallocated (n,) QUALIA_DTYPE array to fill (reused across frames)
+        
+        Returns:
+            (n,) structured array of QUALIA_DTYPE
+        
+        Raises:
+            ValueError: If the input shape, metric names or `out` disagree
+        """
+        _, _, perceived = self.perceive_batch(data, metrics)
+        n, m = perceived.shape
+        if out is None:
+            out = np.empty(n, dtype=QUALIA_DTYPE)
+        elif out.dtype != QUALIA_DTYPE or out.shape != (n,):
+            raise ValueError(f"out must be a ({n},) array of QUALIA_DTYPE")
+        if n == 0:
+            return out
+        
+        if m:
+            avg = perceived.mean(axis=1)
+            peak = perceived.max(axis=1)
+            variance = perceived.var(axis=1) if m > 1 else np.zeros(n)
+        else:
+            avg = peak = variance = np.zeros(n)
+        
+        # Von Mises stress over the first three channels (zero-padded)
+        s = np.zeros((n, 3))
+        s[:, :min(m, 3)] = perceived[:, :3]
+        a, b, c = s[:, 0], s[:, 1], s[:, 2]
+        von_mises = np.sqrt(0.5 * ((a - b) ** 2 + (b - c) ** 2 + (c - a) ** 2))
+        mean_pressure = s.mean(axis=1)
+        relative = np.divide(von_mises, mean_pressure, out=von_mises.copy(), where=mean_pressure > 0)
+        
+        out["energy"] = peak
+        out["roughness"] = variance * 2.0
+        out["flux"] = variance
+        out["viscosity"] = avg
+        out["salience"] = peak
+        out["dissonance"] = von_mises
+        out["harmony"] = 1.0 - von_mises
+        out["volatility"] = variance
+        out["action"] = avg
+        out["hamiltonian"] = avg + variance
+        out["distortion_detected"] = relative > DISTORTION_THRESHOLD
+        
+        # Trend history keeps process()'s bounded window
+        tail = out[-self._max_history:]
+        self._history.extend(dict(zip(QUALIA_DTYPE.names, row.tolist())) for row in tail)
+        if len(self._history) > self._max_history:
+            self._history = self._history[-self._max_history:]
+        return out
+    
     def _compute_qualia(
         self, 
         raw: Dict[str, float], 
@@ -0,0 +1,359 @@
+"""
+Episodic Index (Pattern Completion)
+-----------------------------------
+Biological Role: CA3 auto-association. A partial cue reactivates the
+stored episodes whose activity pattern is closest to it.
+Cybernetic Role: Nearest-neighbour search over the 18-dim normalized
+physics fingerprints (ShunolloSignal.to_vector) for Physics-RAG.
+
+The index mirrors the Hippocampus cache: it holds a sliding window of the
+newest `capacity` vectors, and positions returned by search() are indices
+into that window (oldest = 0), i.e. into the cache list.
+
+Backends:
+- ExactIndex: brute force, O(n) per query, exact.
+- IVFIndex: k-means coarse quantizer (inverted file). Only the nprobe
+  cells nearest the cue are scanned, like the dentate gyrus routing a
+  cue to a sparse subset of CA3; trades a little recall@k for speed.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple, Type
+import numpy as np
+
+__all__ = ['ExactIndex', 'IVFIndex', 'create_episodic_index', 'kmeans', 'recall_at_k']
+
+EPISODE_DIM = 18
+
+# Rows per chunk when assigning vectors to centroids (bounds temporaries)
+_ASSIGN_CHUNK = 65536
+
+
+class ExactIndex:
+    """
+    Brute-force L2 index over a contiguous (n, 18) float32 matrix.
+
+    Appends are amortized O(1): rows live in a buffer with head room and
+    the window is compacted to the front only when the buffer fills.
+    A query is one vectorized distance pass plus argpartition top-k.
+    """
+
+    def __init__(self, capacity: int = 10000, dim: int = EPISODE_DIM) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.dim = dim
+        self._buf = np.empty((min(capacity, 1024), dim), dtype=np.float32)
+        self._lo = 0
+        self._hi = 0
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(size={len(self)}, capacity={self.capacity})"
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """(n, dim) view of the indexed window, oldest first."""
+        return self._buf[self._lo:self._hi]
+
+    def add(self, vector: Sequence[float]) -> None:
+        """Append one vector, evicting the oldest beyond capacity."""
+        self.add_batch(np.asarray(vector, dtype=np.float32).reshape(1, self.dim))
+
+    def add_batch(self, vectors: np.ndarray) -> None:
+        """Append (m, dim) vectors, evicting the oldest beyond capacity."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if len(vectors) > self.capacity:
+            vectors = vectors[-self.capacity:]
+        m = len(vectors)
+        if m == 0:
+            return
+
+        if self._hi + m > len(self._buf):
+            keep = min(len(self), self.capacity - m)
+            window = self._buf[self._hi - keep:self._hi]
+            rows = len(self._buf)
+            if 2 * (keep + m) > rows:
+                # Keep at least half the buffer free after compaction (up to 2x capacity)
+                rows = min(max(2 * rows, 2 * (keep + m)), 2 * self.capacity)
+            buf = np.empty((rows, self.dim), dtype=np.float32) if rows != len(self._buf) else self._buf
+            buf[:keep] = window
+            self._buf, self._lo, self._hi = buf, 0, keep
+
+        self._buf[self._hi:self._hi + m] = vectors
+        self._hi += m
+        if len(self) > self.capacity:
+            self._lo = self._hi - self.capacity
+
+    def distances(self, query: Sequence[float]) -> np.ndarray:
+        """Euclidean distance from the query to every indexed vector."""
+        q = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        diff = self.vectors - q
+        return np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int,
+        threshold: float = float("inf")
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest vectors within threshold.
+
+        Returns:
+            (positions, distances), closest first; ties keep insertion order
+        """
+        if len(self) == 0 or k <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        dist = self.distances(query)
+        candidates = np.flatnonzero(dist <= threshold)
+        if len(candidates) > k:
+            nearest = np.argpartition(dist[candidates], k - 1)[:k]
+            candidates = np.sort(candidates[nearest])
+        order = np.argsort(dist[candidates], kind="stable")
+        positions = candidates[order]
+        return positions, dist[positions]
+
+    def clear(self) -> None:
+        """Forget every vector."""
+        self._lo = self._hi = 0
+
+
+def nearest_centroid(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """Nearest centroid per row, via |x|^2 - 2x.c + |c|^2 in chunks."""
+    c_sq = np.einsum("ij,ij->i", centroids, centroids)
+    labels = np.empty(len(vectors), dtype=np.intp)
+    for start in range(0, len(vectors), _ASSIGN_CHUNK):
+        block = vectors[start:start + _ASSIGN_CHUNK]
+        scores = c_sq - 2.0 * (block @ centroids.T)
+        labels[start:start + len(block)] = np.argmin(scores, axis=1)
+    return labels
+
+
+def kmeans(
+    data: np.ndarray,
+    k: int,
+    n_iter: int = 10,
+    rng: Optional[np.random.Generator] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Lloyd's k-means over float32 rows.
+
+    Centroids start on random data points; cells that empty out are
+    reseeded on random points.
+
+    Returns:
+        (centroids (k, dim), labels (n,)) with labels from the final centroids
+    """
+    data = np.asarray(data, dtype=np.float32)
+    rng = rng or np.random.default_rng(0)
+    k = min(k, len(data))
+    centroids = data[rng.choice(len(data), k, replace=False)].copy()
+    for _ in range(n_iter):
+        labels = nearest_centroid(data, centroids)
+        counts = np.bincount(labels, minlength=k)
+        sums = np.stack([
+            np.bincount(labels, weights=data[:, j], minlength=k)
+            for j in range(data.shape[1])
+        ], axis=1)
+        empty = counts == 0
+        centroids = (sums / np.maximum(counts, 1)[:, None]).astype(np.float32)
+        if empty.any():
+            # Reseed dead cells on random training points
+            centroids[empty] = data[rng.choice(len(data), int(empty.sum()))]
+    return centroids, nearest_centroid(data, centroids)
+
+
+class IVFIndex(ExactIndex):
+    """
+    Approximate L2 index: inverted lists over a k-means coarse quantizer.
+
+    Vectors are stored in the same sliding window as ExactIndex. Until
+    train_size vectors have arrived, queries fall back to exact search;
+    then k-means (Lloyd) learns nlist centroids and every vector is filed
+    under its nearest centroid. A query scans only the nprobe closest
+    lists, so its cost is roughly n * nprobe / nlist.
+
+    Inverted lists hold global sequence numbers, which are monotonic per
+    list, so evicted entries are dropped with one searchsorted.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        dim: int = EPISODE_DIM,
+        nlist: int = 256,
+        nprobe: int = 8,
+        train_size: Optional[int] = None,
+        n_iter: int = 10,
+        seed: int = 0
+    ) -> None:
+        """
+        Args:
+            capacity: Sliding window size (newest vectors kept)
+            dim: Vector dimension
+            nlist: Number of k-means cells
+            nprobe: Cells scanned per query (nprobe = nlist is exact)
+            train_size: Vectors required before training (default 32 * nlist)
+            n_iter: Lloyd iterations
+            seed: RNG seed for centroid initialization
+        """
+        super().__init__(capacity, dim)
+        if nlist <= 0 or nprobe <= 0:
+            raise ValueError(f"nlist and nprobe must be positive, got {nlist}, {nprobe}")
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.train_size = train_size or 32 * nlist
+        self.n_iter = n_iter
+        self._rng = np.random.default_rng(seed)
+        self.centroids: Optional[np.ndarray] = None
+        self._lists: List[List[np.ndarray]] = []
+        self._listed = 0  # entries held in _lists, including evicted ones
+        self._count = 0   # vectors ever added; next sequence number
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(size={len(self)}, capacity={self.capacity}, "
+            f"nlist={self.nlist}, nprobe={self.nprobe}, trained={self.is_trained})"
+        )
+
+    @property
+    def is_trained(self) -> bool:
+        return self.centroids is not None
+
+    def add_batch(self, vectors: np.ndarray) -> None:
+        """Append (m, dim) vectors, filing them under their nearest cell."""
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(-1, self.dim)
+        if len(vectors) > self.capacity:
+            self._count += len(vectors) - self.capacity
+            vectors = vectors[-self.capacity:]
+        if len(vectors) == 0:
+            return
+        super().add_batch(vectors)
+        first_seq = self._count
+        self._count += len(vectors)
+
+        if self.is_trained:
+            self._file(self._assign(vectors), first_seq)
+        elif len(self) >= self.train_size:
+            self.train()
+
+    def train(self) -> None:
+        """Learn the coarse quantizer from the current window and file it."""
+        data = self.vectors
+        if len(data) == 0:
+            raise ValueError("Cannot train an empty index")
+        nlist = min(self.nlist, len(data))
+        sample_size = min(len(data), 64 * nlist)
+        sample = data[self._rng.choice(len(data), sample_size, replace=False)]
+        self.centroids, _ = kmeans(sample, nlist, self.n_iter, self._rng)
+        self._lists = [[] for _ in range(nlist)]
+        self._listed = 0
+        self._file(self._assign(data), self._count - len(data))
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return nearest_centroid(vectors, self.centroids)
+
+    def _file(self, labels: np.ndarray, first_seq: int) -> None:
+        """Append sequence numbers first_seq.. to the lists named by labels."""
+        order = np.argsort(labels, kind="stable")
+        seqs = first_seq + order
+        bounds = np.searchsorted(labels[order], np.arange(len(self._lists) + 1))
+        for cell in np.flatnonzero(np.diff(bounds)):
+            self._lists[cell].append(seqs[bounds[cell]:bounds[cell + 1]])
+        self._listed += len(labels)
+        if self._listed > 2 * self.capacity:
+            # Drop evicted entries from lists that are rarely probed
+            for cell in range(len(self._lists)):
+                self._live(cell)
+            self._listed = sum(len(c[0]) for c in self._lists if c)
+
+    def _live(self, cell: int) -> np.ndarray:
+        """Sequence numbers in a list that are still inside the window."""
+        chunks = self._lists[cell]
+        if not chunks:
+            return np.empty(0, dtype=np.int64)
+        seqs = chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+        seqs = seqs[np.searchsorted(seqs, self._count - len(self)):]
+        self._lists[cell] = [seqs]
+        return seqs
+
+    def search(
+        self,
+        query: Sequence[float],
+        k: int,
+        threshold: float = float("inf")
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate k nearest vectors within threshold.
+
+        Returns:
+            (positions, distances), closest first; ties keep insertion order
+        """
+        if not self.is_trained or len(self) == 0 or k <= 0:
+            return super().search(query, k, threshold)
+        q = np.asarray(query, dtype=np.float32).reshape(self.dim)
+        cell_dist = np.einsum("ij,ij->i", self.centroids - q, self.centroids - q)
+        nprobe = min(self.nprobe, len(cell_dist))
+        probes = np.argpartition(cell_dist, nprobe - 1)[:nprobe]
+
+        seqs = np.concatenate([self._live(cell) for cell in probes])
+        positions = seqs - (self._count - len(self))
+        diff = self._buf[self._lo + positions] - q
+        dist = np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+        keep = dist <= threshold
+        positions, dist = positions[keep], dist[keep]
+        if len(positions) > k:
+            nearest = np.argpartition(dist, k - 1)[:k]
+            positions, dist = positions[nearest], dist[nearest]
+        order = np.lexsort((positions, dist))
+        return positions[order], dist[order]
+
+    def clear(self) -> None:
+        """Forget every vector and the trained quantizer."""
+        super().clear()
+        self.centroids = None
+        self._lists = []
+        self._listed = 0
+        self._count = 0
+
+
+EPISODIC_INDEXES: Dict[str, Type[ExactIndex]] = {
+    "exact": ExactIndex,
+    "ivf": IVFIndex,
+}
+
+
+def create_episodic_index(kind: str = "exact", capacity: int = 10000, **params) -> ExactIndex:
+    """
+    Factory for episodic index backends.
+
+    Args:
+        kind: "exact" or "ivf"
+        capacity: Sliding window size
+        **params: Backend options (e.g. nlist, nprobe for "ivf")
+    """
+    if kind not in EPISODIC_INDEXES:
+        raise ValueError(f"Unknown episodic index '{kind}', expected one of {sorted(EPISODIC_INDEXES)}")
+    return EPISODIC_INDEXES[kind](capacity=capacity, **params)
+
+
+def recall_at_k(index: ExactIndex, queries: np.ndarray, k: int) -> float:
+    """
+    Mean fraction of the exact k nearest neighbours an index returns.
+
+    Ground truth is a brute-force scan of the same window, so this is 1.0
+    for ExactIndex and measures the approximation loss of other backends.
+    """
+    queries = np.asarray(queries, dtype=np.float32).reshape(-1, index.dim)
+    if len(queries) == 0 or len(index) == 0:
+        return 1.0
+    hits = 0
+    total = 0
+    for q in queries:
+        truth, _ = ExactIndex.search(index, q, k)
+        found, _ = index.search(q, k)
+        hits += len(np.intersect1d(truth, found))
+        total += len(truth)
+    return hits / total
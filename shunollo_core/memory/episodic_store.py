@@ -0,0 +1,577 @@
+"""
+Episodic Store (Long-Term Consolidation)
+----------------------------------------
+Biological Role: Cortical long-term storage. Episodes consolidated by the
+hippocampus are laid down in compact, fixed-width traces that can be
+reactivated without re-parsing the original experience.
+Cybernetic Role: Segment-based binary log of ShunolloSignals, a faster
+alternative to the JSONL episodic log.
+
+Layout (one pair of files per segment, `segment_size` rows each):
+
+    episodes-000000.seg         64-byte header, then columns:
+                                  float64 timestamp[capacity]  (epoch s, NaN = None)
+                                  float32 <field>[capacity]    x 18 physics fields
+    episodes-000000.meta.jsonl  one {"input_type", "metadata"} line per row
+
+Segments roll over when full or, with segment_seconds, when they get too
+old. Retention works on whole segments: drop_before() deletes segments
+whose newest episode is past the cutoff, and consolidate() downsamples
+old segments into k-means centroid episodes (a "gist" of the period)
+stored in a `episodes-NNNNNN.cK.seg` segment in their place.
+
+The header holds magic, capacity, the committed row count and the
+segment creation time. Appends
+write the side file, then the columns, then bump the count, so a crash
+mid-append leaves only uncommitted side-file lines, which are truncated
+when the store is next opened. Reads memory-map the segments.
+
+Physics values are stored in float32 (~7 significant digits).
+"""
+import json
+import os
+import struct
+import threading
+import time
+from collections.abc import Sequence as SequenceABC
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from shunollo_core.models import PHYSICS_FIELDS, ShunolloSignal
+from shunollo_core.memory.episodic_index import kmeans
+from shunollo_core.utils.file_lock import lock_file, unlock_file
+from shunollo_core.memory.journal import check_durability
+
+__all__ = [
+    'ColumnarEpisodicStore',
+    'EpisodeCache',
+    'EpisodeColumns',
+    'episode_rows',
+    'migrate_jsonl',
+    'normalize_physics',
+]
+
+_MAGIC = b"SHEPIS01"
+_HEADER = struct.Struct("<8sII")  # magic, capacity, count
+_CREATED = struct.Struct("<d")     # creation time (epoch s), right after _HEADER
+_HEADER_SIZE = 64
+_FIELD_NAMES = tuple(name for name, _, _ in PHYSICS_FIELDS)
+_LOW = np.array([lo for _, lo, _ in PHYSICS_FIELDS], dtype=np.float64)
+_SPAN = np.array([hi - lo for _, lo, hi in PHYSICS_FIELDS], dtype=np.float64)
+# Windows cannot delete a mapped file, so reads there copy out of the map
+# rather than letting cached views pin segments that retention removes
+_COPY_READS = os.name == "nt"
+
+# One serialized episode: (18 physics values, epoch timestamp or NaN, metadata JSON)
+EpisodeRow = Tuple[List[float], float, str]
+
+
+class EpisodeColumns(NamedTuple):
+    """A block of episodes in columnar form, oldest first."""
+    physics: np.ndarray      # (n, 18) float32 raw physics values
+    timestamps: np.ndarray   # (n,) float64 epoch seconds, NaN = no timestamp
+    records: List[str]       # per-row JSON {"input_type", "metadata"}, parsed on access
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[EpisodeRow]) -> 'EpisodeColumns':
+        """Pack serialized rows into columns."""
+        return cls(
+            np.array([r[0] for r in rows], dtype=np.float32).reshape(-1, len(_FIELD_NAMES)),
+            np.array([r[1] for r in rows], dtype=np.float64),
+            [r[2] for r in rows],
+        )
+
+    def signal(self, row: int) -> ShunolloSignal:
+        """Rebuild one ShunolloSignal (without re-validation; data was validated on write)."""
+        fields = dict(zip(_FIELD_NAMES, self.physics[row].tolist()))
+        ts = float(self.timestamps[row])
+        fields["timestamp"] = None if ts != ts else datetime.fromtimestamp(ts, timezone.utc)
+        record = json.loads(self.records[row])
+        fields["input_type"] = record.get("input_type", "generic")
+        fields["metadata"] = record.get("metadata", {})
+        return ShunolloSignal.model_construct(**fields)
+
+    def to_signals(self) -> List[ShunolloSignal]:
+        """Rebuild every ShunolloSignal in the block."""
+        return [self.signal(row) for row in range(len(self.timestamps))]
+
+
+class EpisodeCache(SequenceABC):
+    """
+    List-like episode cache over an EpisodeColumns block.
+
+    Loaded rows stay in columnar form and are turned into ShunolloSignals
+    only when accessed (recall hits, dream samples), so a cold start costs
+    one memory-mapped read instead of max_cache_size model constructions.
+    Supports what Hippocampus needs from its cache: len, indexing,
+    slicing, append/extend and deleting from the front.
+    """
+
+    def __init__(self, columns: EpisodeColumns) -> None:
+        self._columns = columns
+        self._base = 0  # column rows dropped from the front
+        self._items: List[Optional[ShunolloSignal]] = [None] * len(columns.timestamps)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        return f"EpisodeCache(size={len(self)})"
+
+    def _get(self, i: int) -> ShunolloSignal:
+        signal = self._items[i]
+        if signal is None:
+            signal = self._columns.signal(self._base + i)
+            self._items[i] = signal
+        return signal
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        if isinstance(key, slice):
+            return [self._get(i) for i in range(*key.indices(len(self)))]
+        return self._get(range(len(self))[key])
+
+    def __iter__(self) -> Iterator[ShunolloSignal]:
+        return (self._get(i) for i in range(len(self)))
+
+    def __delitem__(self, key: slice) -> None:
+        start, stop, step = key.indices(len(self))
+        if start != 0 or step != 1:
+            raise ValueError("EpisodeCache only supports deleting from the front")
+        self._base += stop
+        del self._items[:stop]
+
+    def append(self, signal: ShunolloSignal) -> None:
+        self._items.append(signal)
+
+    def extend(self, signals: Sequence[ShunolloSignal]) -> None:
+        self._items.extend(signals)
+
+
+def normalize_physics(physics: np.ndarray) -> np.ndarray:
+    """
+    Vectorized ShunolloSignal.to_vector(normalize=True) over raw rows.
+
+    Clamps each of the 18 fields to its expected range and maps it to 0-1.
+    """
+    physics = np.asarray(physics, dtype=np.float64).reshape(-1, len(PHYSICS_FIELDS))
+    return np.clip((physics - _LOW) / _SPAN, 0.0, 1.0).astype(np.float32)
+
+
+def episode_rows(signals: Sequence[ShunolloSignal]) -> List[EpisodeRow]:
+    """
+    Serialize signals into store rows.
+
+    Snapshots the signal at call time, so later metadata mutations (e.g. by
+    the cortex) do not leak into a deferred write.
+    """
+    return [
+        (
+            [getattr(s, name) for name in _FIELD_NAMES],
+            s.timestamp.timestamp() if s.timestamp is not None else float("nan"),
+            json.dumps({"input_type": s.input_type, "metadata": s.metadata}),
+        )
+        for s in signals
+    ]
+
+
+class _Segment:
+    """One fixed-capacity column file plus its metadata side file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.meta_path = path.with_suffix(".meta.jsonl")
+        # episodes-000012.seg -> 12; consolidated episodes-000012.c1.seg -> 12
+        self.index = int(path.name.split("-")[1].split(".")[0])
+        self.generation = int(path.suffixes[0][2:]) if len(path.suffixes) > 1 else 0
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size + _CREATED.size)
+        magic, self.capacity, self.count = _HEADER.unpack_from(header)
+        (self.created,) = _CREATED.unpack_from(header, _HEADER.size)
+        if magic != _MAGIC:
+            raise ValueError(f"{path} is not an episodic segment")
+        # Side-file lines parsed so far, and the (inode, bytes) they cover
+        self._records: List[str] = []
+        self._records_key: Tuple[int, int] = (0, 0)
+
+    @classmethod
+    def create(cls, path: Path, capacity: int, created: Optional[float] = None) -> '_Segment':
+        created = time.time() if created is None else created
+        with open(path, "wb") as f:
+            header = _HEADER.pack(_MAGIC, capacity, 0) + _CREATED.pack(created)
+            f.write(header.ljust(_HEADER_SIZE, b"\0"))
+            f.truncate(_HEADER_SIZE + capacity * (8 + 4 * len(_FIELD_NAMES)))
+        path.with_suffix(".meta.jsonl").touch()
+        return cls(path)
+
+    def refresh(self) -> None:
+        with open(self.path, "rb") as f:
+            self.count = _HEADER.unpack(f.read(_HEADER.size))[2]
+
+    def _map(self, mode: str) -> Tuple[np.memmap, np.ndarray, np.ndarray]:
+        raw = np.memmap(self.path, dtype=np.uint8, mode=mode)
+        ts_end = _HEADER_SIZE + 8 * self.capacity
+        timestamps = raw[_HEADER_SIZE:ts_end].view(np.float64)
+        physics = raw[ts_end:].view(np.float32).reshape(len(_FIELD_NAMES), self.capacity)
+        return raw, timestamps, physics
+
+    def write(self, columns: EpisodeColumns, fsync: bool = False) -> None:
+        """Append rows; the header count is the commit point."""
+        n = len(columns.timestamps)
+        with open(self.meta_path, "a", encoding="utf-8") as f:
+            f.writelines(r + "\n" for r in columns.records)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        raw, timestamps, physics = self._map("r+")
+        timestamps[self.count:self.count + n] = columns.timestamps
+        physics[:, self.count:self.count + n] = columns.physics.T
+        if fsync:
+            raw.flush()
+        del raw, timestamps, physics
+        with open(self.path, "r+b") as f:
+            f.write(_HEADER.pack(_MAGIC, self.capacity, self.count + n))
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        self.count += n
+
+    def records(self) -> List[str]:
+        """
+        Side-file lines, parsed incrementally: the file only grows until it
+        is replaced (new inode) or truncated by recover().
+        """
+        stat = os.stat(self.meta_path)
+        inode, parsed = self._records_key
+        if stat.st_ino != inode or stat.st_size < parsed:
+            self._records, parsed = [], 0
+        if stat.st_size > parsed:
+            with open(self.meta_path, "rb") as f:
+                f.seek(parsed)
+                data = f.read()
+            end = data.rfind(b"\n") + 1  # complete lines only
+            self._records.extend(data[:end].decode("utf-8").splitlines())
+            parsed += end
+        self._records_key = (stat.st_ino, parsed)
+        return self._records
+
+    def read(self, start: int, stop: int) -> EpisodeColumns:
+        """Rows [start, stop) as read-only views of the memory map."""
+        _, timestamps, physics = self._map("r")
+        physics, timestamps = physics[:, start:stop].T, timestamps[start:stop]
+        if _COPY_READS:
+            physics, timestamps = np.array(physics), np.array(timestamps)
+        return EpisodeColumns(physics, timestamps, self.records()[start:stop])
+
+    def newest(self) -> float:
+        """Latest episode timestamp (NaN if none are timestamped)."""
+        if self.count == 0:
+            return float("nan")
+        _, timestamps, _ = self._map("r")
+        valid = timestamps[:self.count]
+        valid = valid[~np.isnan(valid)]
+        return float(valid.max()) if len(valid) else float("nan")
+
+    def recover(self) -> None:
+        """Drop side-file lines beyond the committed count (torn append)."""
+        with open(self.meta_path, "r+b") as f:
+            data = f.read()
+            if data.count(b"\n") > self.count:
+                end = 0
+                for _ in range(self.count):
+                    end = data.index(b"\n", end) + 1
+                f.truncate(end)
+
+    def unlink(self) -> None:
+        self.path.unlink(missing_ok=True)
+        self.meta_path.unlink(missing_ok=True)
+
+
+class ColumnarEpisodicStore:
+    """
+    Append-only binary episodic log made of fixed-capacity segments.
+
+    Thread-safe within a process and serialized across processes with a
+    lock file, like the JSONL log it replaces.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        segment_size: int = 65536,
+        segment_seconds: Optional[float] = None
+    ) -> None:
+        """
+        Args:
+            root: Directory holding the segments
+            segment_size: Rows per segment file
+            segment_seconds: Also roll to a new segment once the current
+                             one is this old (None = size only)
+        """
+        if segment_size <= 0:
+            raise ValueError(f"segment_size must be positive, got {segment_size}")
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.segment_size = segment_size
+        self.segment_seconds = segment_seconds
+        self._lock_path = self.root / "episodes.lock"
+        self._lock = threading.Lock()
+        self._segments: List[_Segment] = []
+        with self._locked():
+            self._refresh()
+            if self._segments:
+                self._segments[-1].recover()
+
+    def __repr__(self) -> str:
+        return f"ColumnarEpisodicStore(root='{self.root}', segments={len(self._segments)})"
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._refresh()
+            return sum(s.count for s in self._segments)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive access across threads and processes."""
+        with self._lock, open(self._lock_path, "a") as f:
+            lock_file(f)
+            try:
+                yield
+            finally:
+                unlock_file(f)
+
+    def _refresh(self) -> None:
+        """Pick up segments and rows written, dropped or consolidated by other processes."""
+        on_disk = set(self.root.glob("episodes-*.seg"))
+        self._segments = [s for s in self._segments if s.path in on_disk]
+        known = {s.path for s in self._segments}
+        self._segments.extend(_Segment(path) for path in on_disk - known)
+        self._segments.sort(key=lambda s: (s.index, s.generation))
+        if self._segments:
+            self._segments[-1].refresh()
+
+    def _needs_roll(self, segment: Optional[_Segment]) -> bool:
+        if segment is None or segment.count >= segment.capacity or segment.generation:
+            return True
+        return (
+            self.segment_seconds is not None
+            and segment.count > 0
+            and time.time() - segment.created >= self.segment_seconds
+        )
+
+    def append(self, signals: Sequence[ShunolloSignal], durability: str = "flush") -> int:
+        """
+        Append a batch of signals under one lock acquisition.
+
+        Returns:
+            Number of rows written
+        """
+        return self.append_rows(episode_rows(signals), durability)
+
+    def append_rows(self, rows: Sequence[EpisodeRow], durability: str = "flush") -> int:
+        """
+        Append serialized rows (see episode_rows) under one lock acquisition.
+
+        Args:
+            rows: Rows to append
+            durability: "none"/"flush" leave the data in the OS page cache
+                        (survives a process crash); "fsync" also syncs it to
+                        disk before the commit returns (survives power loss)
+
+        Returns:
+            Number of rows written
+        """
+        check_durability(durability)
+        if not rows:
+            return 0
+        columns = EpisodeColumns.from_rows(rows)
+        n = len(columns.timestamps)
+        with self._locked():
+            self._refresh()
+            written = 0
+            while written < n:
+                segment = self._segments[-1] if self._segments else None
+                if self._needs_roll(segment):
+                    index = segment.index + 1 if segment else 0
+                    segment = _Segment.create(
+                        self.root / f"episodes-{index:06d}.seg", self.segment_size
+                    )
+                    self._segments.append(segment)
+                take = min(n - written, segment.capacity - segment.count)
+                segment.write(EpisodeColumns(
+                    columns.physics[written:written + take],
+                    columns.timestamps[written:written + take],
+                    columns.records[written:written + take],
+                ), fsync=durability == "fsync")
+                written += take
+        return n
+
+    def tail(self, n: int) -> EpisodeColumns:
+        """Read the newest n episodes (memory-mapped, oldest first)."""
+        with self._locked():
+            self._refresh()
+            blocks: List[EpisodeColumns] = []
+            remaining = n
+            for segment in reversed(self._segments):
+                if remaining <= 0:
+                    break
+                take = min(remaining, segment.count)
+                if take:
+                    blocks.append(segment.read(segment.count - take, segment.count))
+                remaining -= take
+        return _concat(blocks[::-1])
+
+    def iter_blocks(self) -> Iterator[EpisodeColumns]:
+        """Stream every episode, one segment at a time, oldest first."""
+        with self._lock:
+            self._refresh()
+            segments = [(s, s.count) for s in self._segments]
+        for segment, count in segments:
+            if count and segment.path.exists():
+                yield segment.read(0, count)
+
+    def _expired(self, cutoff: float) -> List[_Segment]:
+        """Oldest-first run of segments whose newest episode is before cutoff."""
+        expired = []
+        for segment in self._segments:
+            newest = segment.newest()
+            if segment.count and not newest < cutoff:
+                break
+            expired.append(segment)
+        return expired
+
+    def drop_before(self, cutoff: float) -> int:
+        """
+        Retention: delete segments whose newest episode is older than cutoff.
+
+        Works on whole segments, oldest first, so a segment that still holds
+        one recent episode is kept in full.
+
+        Args:
+            cutoff: Epoch seconds
+
+        Returns:
+            Number of episodes deleted
+        """
+        with self._locked():
+            self._refresh()
+            expired = self._expired(cutoff)
+            for segment in expired:
+                segment.unlink()
+            self._refresh()
+        return sum(s.count for s in expired)
+
+    def consolidate(self, before: float, n_clusters: int = 256, seed: int = 0) -> int:
+        """
+        Downsample old segments into k-means centroid episodes.
+
+        Segments whose newest episode is older than `before` (excluding the
+        segment being appended to) are clustered in the normalized Physics-RAG
+        space and replaced by one consolidated segment. Each centroid episode
+        carries the mean raw physics of its cluster, the newest timestamp in
+        it and metadata {"consolidated_count": cluster size}.
+
+        Args:
+            before: Epoch seconds
+            n_clusters: Centroid episodes to keep for the whole span
+            seed: k-means RNG seed
+
+        Returns:
+            Number of episodes removed (input rows minus centroids written)
+        """
+        with self._locked():
+            self._refresh()
+            old = self._expired(before)[:max(len(self._segments) - 1, 0)]
+            old = [s for s in old if s.count]
+            if not any(s.generation == 0 for s in old):
+                return 0  # nothing new to summarize
+            columns = _concat([s.read(0, s.count) for s in old])
+            n = len(columns.timestamps)
+            _, labels = kmeans(
+                normalize_physics(columns.physics), n_clusters,
+                rng=np.random.default_rng(seed)
+            )
+            labels = np.unique(labels, return_inverse=True)[1]
+            k = int(labels.max()) + 1
+            # Earlier centroids weigh as many episodes as they summarize
+            weights = np.array(
+                [json.loads(r)["metadata"].get("consolidated_count", 1) for r in columns.records],
+                dtype=np.float64
+            )
+            mass = np.bincount(labels, weights=weights, minlength=k)
+            physics = np.stack([
+                np.bincount(labels, weights=columns.physics[:, j] * weights, minlength=k)
+                for j in range(len(_FIELD_NAMES))
+            ], axis=1) / mass[:, None]
+            timestamps = np.full(k, np.nan)
+            np.fmax.at(timestamps, labels, columns.timestamps)
+            records = [
+                json.dumps({"input_type": "consolidated", "metadata": {"consolidated_count": int(m)}})
+                for m in mass
+            ]
+
+            last = old[-1]
+            generation = max(s.generation for s in old) + 1
+            path = self.root / f"episodes-{last.index:06d}.c{generation}.seg"
+            merged = _Segment.create(path, k, created=last.created)
+            merged.write(EpisodeColumns(physics.astype(np.float32), timestamps, records), fsync=True)
+            for segment in old:
+                segment.unlink()
+            self._refresh()
+        return n - k
+
+    def clear(self) -> None:
+        """Delete every segment."""
+        with self._locked():
+            self._refresh()
+            for segment in self._segments:
+                segment.unlink()
+            self._segments = []
+
+
+def _concat(blocks: List[EpisodeColumns]) -> EpisodeColumns:
+    if not blocks:
+        return EpisodeColumns(
+            np.empty((0, len(_FIELD_NAMES)), dtype=np.float32),
+            np.empty(0, dtype=np.float64),
+            [],
+        )
+    if len(blocks) == 1:
+        return blocks[0]
+    return EpisodeColumns(
+        np.concatenate([b.physics for b in blocks]),
+        np.concatenate([b.timestamps for b in blocks]),
+        [r for b in blocks for r in b.records],
+    )
+
+
+def migrate_jsonl(
+    jsonl_path: Union[str, Path],
+    store: ColumnarEpisodicStore,
+    batch_size: int = 10000
+) -> int:
+    """
+    One-shot import of a JSONL episodic log into a columnar store.
+
+    Lines that fail to parse are skipped, as in Hippocampus._load_cache.
+    The JSONL file is left in place.
+
+    Returns:
+        Number of episodes migrated
+    """
+    migrated = 0
+    batch: List[ShunolloSignal] = []
+    with open(jsonl_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                batch.append(ShunolloSignal(**json.loads(line)))
+            except Exception:
+                continue
+            if len(batch) >= batch_size:
+                migrated += store.append(batch)
+                batch = []
+    migrated += store.append(batch)
+    return migrated
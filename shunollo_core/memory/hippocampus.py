@@ -5,35 +5,69 @@ Biological Role: Consolidation of Short-term to Long-term memory. Spatial naviga
 Cybernetic Role: Stores raw Sensory Events (Episodes) for offline replay ('Dreaming').
 
 Features:
-- Append-only Log (JSONL) of ShunolloSignals.
+- Append-only Log (JSONL) of ShunolloSignals, or a binary columnar store
+  (store="columnar") with memory-mapped loads.
 - 'Dreaming' interface to recall past events.
 - Physics-RAG: Vector similarity search for episodic recall (Déjà Vu).
 """
 import json
+import logging
 import random
 import os
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
-from typing import List, Generator, Tuple, Optional
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Generator, Sequence, Tuple, Optional, Union
 from shunollo_core.models import ShunolloSignal
 from shunollo_core.config import config
+from shunollo_core.utils.file_lock import lock_file as _lock_file, unlock_file as _unlock_file
+from shunollo_core.memory.episodic_index import ExactIndex, create_episodic_index
+from shunollo_core.memory.episodic_store import (
+    ColumnarEpisodicStore, EpisodeCache, episode_rows, normalize_physics
+)
+from shunollo_core.memory.journal import WriteBehindJournal, check_durability
+
+
+def _iter_tail_lines(path: Path, n: int, block_size: int = 1 << 16) -> Iterator[bytes]:
+    """
+    Yield up to the last n lines of a file, newest first.
+
+    Reads fixed-size blocks backwards from the end, so the work and memory
+    depend on n and the line length, not the file size.
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        if end == 0 or n <= 0:
+            return
+        f.seek(end - 1)
+        if f.read(1) == b"\n":
+            end -= 1  # the final terminator does not start a new line
+        pos = end
+        partial = b""
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).split(b"\n")
+            partial = lines[0]  # may continue in the previous block
+            for line in reversed(lines[1:]):
+                yield line
+                n -= 1
+                if n == 0:
+                    return
+        yield partial
 
-# Cross-platform file locking
-if os.name == 'nt':  # Windows
-    import msvcrt
-    def _lock_file(f):
-        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
-    def _unlock_file(f):
-        try:
-            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
-        except OSError:
-            pass  # Already unlocked
-else:  # Unix/Linux/Mac
-    import fcntl
-    def _lock_file(f):
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-    def _unlock_file(f):
-        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+def _parse_timestamp(line: Union[str, bytes]) -> float:
+    """Epoch seconds of a JSONL episode (inf if missing or unparseable)."""
+    try:
+        moment = datetime.fromisoformat(json.loads(line)["timestamp"])
+    except Exception:
+        return float("inf")
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
 
 
 class Hippocampus:
@@ -41,45 +75,210 @@ class Hippocampus:
     Episodic Memory with Physics-RAG capabilities.
     
     Uses lazy-loaded in-memory cache to avoid O(n) file reads on every recall.
-    Thread-safe file operations via file locking.
+    The cache is mirrored by an ExactIndex of normalized vectors, so Physics-RAG
+    queries are one vectorized distance pass instead of a per-signal loop.
+    Thread-safe file operations via file locking; the cache, its index and
+    retention passes share one lock, so concurrent writers (e.g. several
+    NervousSystem memory workers) keep disk, cache and index order in step.
+
+    The columnar store lives in <cache_dir>/episodic/. Import an existing
+    JSONL log with episodic_store.migrate_jsonl(hippo.storage_path, hippo.store).
+
+    With write_behind=True, remember() only serializes the episode and
+    updates the cache; a WriteBehindJournal thread group-commits it to disk.
+
+    Long-running nodes bound disk use with rolling segments: the JSONL log
+    is sealed into episodic_memory.NNNNNN.jsonl every segment_bytes, and the
+    columnar store rolls every segment_size rows. enforce_retention() (run
+    every compact_interval seconds by a background thread) deletes sealed
+    segments older than retention_seconds and, for the columnar store,
+    downsamples segments older than downsample_after into centroid episodes.
+    Both are off by default; without either, nothing is ever deleted and no
+    compactor thread is started.
     """
     
     # Default threshold for "similar" signals (Euclidean distance in normalized 18-dim space)
     # Rule of thumb: 0.5 = very similar, 1.0 = somewhat similar, 2.0 = loosely related
     DEFAULT_THRESHOLD = 1.0
+
+    # (n, 18) vector index mirroring _cache; built by _load_cache
+    _index: Optional[ExactIndex] = None
+    _index_kind = "exact"
+    _index_params: Optional[Dict[str, Any]] = None
+
+    # Binary columnar store; None = JSONL log at storage_path
+    store: Optional[ColumnarEpisodicStore] = None
+
+    # Group-commit journal; None = synchronous writes
+    _journal: Optional[WriteBehindJournal] = None
+    durability = "flush"
+
+    # Rolling segments and retention; None = keep everything
+    segment_bytes = 64 * 1024 * 1024
+    segment_seconds: Optional[float] = None
+    _active_started: Optional[float] = None
+    retention_seconds: Optional[float] = None
+    downsample_after: Optional[float] = None
+    consolidation_clusters = 256
+    _compactor: Optional[threading.Thread] = None
+
+    # Guards _cache/_index and the segment files (per instance; see __init__)
+    _lock = threading.RLock()
     
-    def __init__(self, max_cache_size: int = 10000):
+    def __init__(
+        self,
+        max_cache_size: int = 10000,
+        index: str = "exact",
+        index_params: Optional[Dict[str, Any]] = None,
+        store: str = "jsonl",
+        write_behind: bool = False,
+        durability: str = "flush",
+        journal_params: Optional[Dict[str, Any]] = None,
+        segment_bytes: int = 64 * 1024 * 1024,
+        segment_seconds: Optional[float] = None,
+        retention_seconds: Optional[float] = None,
+        downsample_after: Optional[float] = None,
+        consolidation_clusters: int = 256,
+        compact_interval: Optional[float] = None
+    ):
+        """
+        Args:
+            max_cache_size: Newest episodes kept in memory for recall
+            index: Recall backend, "exact" or "ivf" (approximate, for
+                   caches of 1e5+ episodes)
+            index_params: Backend options, e.g. {"nlist": 1024, "nprobe": 16}
+            store: Episode persistence, "jsonl" or "columnar"
+            write_behind: Commit episodes asynchronously in groups
+            durability: "none", "flush" or "fsync" per commit
+            journal_params: WriteBehindJournal options (max_batch,
+                            max_delay, max_backlog)
+            segment_bytes: Seal the JSONL log into a new segment at this size
+            segment_seconds: Also roll segments (both stores) once this old
+            retention_seconds: Delete sealed segments older than this
+            downsample_after: Columnar store only: consolidate segments older
+                              than this into consolidation_clusters centroids
+            consolidation_clusters: Centroid episodes per consolidation pass
+            compact_interval: Seconds between background retention passes
+                              (None = only when enforce_retention() is called;
+                              no thread without retention_seconds or downsample_after)
+        """
         self.storage_path = Path(config.storage["cache_dir"]) / "episodic_memory.jsonl"
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        if store == "columnar":
+            self.store = ColumnarEpisodicStore(
+                self.storage_path.parent / "episodic", segment_seconds=segment_seconds
+            )
+        elif store != "jsonl":
+            raise ValueError(f"Unknown episodic store '{store}', expected 'jsonl' or 'columnar'")
         
         # In-memory cache for O(1) access (fixes Issue 1: O(n) scan)
-        self._cache: Optional[List[ShunolloSignal]] = None
+        self._cache: Optional[Union[List[ShunolloSignal], EpisodeCache]] = None
         self._cache_dirty = True
         self._max_cache_size = max_cache_size
+        self._lock = threading.RLock()
+        self._index_kind = index
+        self._index_params = index_params
+
+        check_durability(durability)
+        self.durability = durability
+        if write_behind:
+            self._journal = WriteBehindJournal(
+                self._commit, name="HippocampusJournal", **(journal_params or {})
+            )
+
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.retention_seconds = retention_seconds
+        self.downsample_after = downsample_after
+        self.consolidation_clusters = consolidation_clusters
+        self._retention_stats = {"dropped": 0, "consolidated": 0}
+        self._stop_compactor = threading.Event()
+        if compact_interval is not None and (retention_seconds is not None or downsample_after is not None):
+            self._compactor = threading.Thread(
+                target=self._compact_loop, args=(compact_interval,),
+                daemon=True, name="HippocampusCompactor"
+            )
+            self._compactor.start()
 
-    def _load_cache(self) -> List[ShunolloSignal]:
+    def _log_segments(self) -> List[Path]:
+        """Sealed JSONL segments, oldest first."""
+        stem = self.storage_path.stem
+        sealed = [
+            p for p in self.storage_path.parent.glob(f"{stem}.*.jsonl")
+            if p.suffixes[0][1:].isdigit()
+        ]
+        return sorted(sealed, key=lambda p: int(p.suffixes[0][1:]))
+
+    def _seal_log(self) -> None:
+        """Rotate the active JSONL log into the next sealed segment."""
+        sealed = self._log_segments()
+        number = int(sealed[-1].suffixes[0][1:]) + 1 if sealed else 0
+        target = self.storage_path.with_name(f"{self.storage_path.stem}.{number:06d}.jsonl")
+        try:
+            os.replace(self.storage_path, target)
+            self._active_started = None
+        except OSError:
+            pass  # e.g. open elsewhere on Windows; retried on the next commit
+
+    def _active_log_expired(self) -> bool:
+        """True if the active JSONL log is older than segment_seconds."""
+        if self.segment_seconds is None:
+            return False
+        if self._active_started is None:
+            with open(self.storage_path, "r", encoding="utf-8") as f:
+                started = _parse_timestamp(f.readline())
+            if started == float("inf"):
+                # Undated or legacy first line: date the log by the file itself
+                stat = os.stat(self.storage_path)
+                started = getattr(stat, "st_birthtime", min(stat.st_mtime, stat.st_ctime))
+            self._active_started = started
+        return time.time() - self._active_started >= self.segment_seconds
+
+    def _load_cache(self) -> Union[List[ShunolloSignal], EpisodeCache]:
         """Lazy-load cache from disk. Only reads file once until invalidated."""
+        with self._lock:
+            return self._reload_cache()
+
+    def _reload_cache(self) -> Union[List[ShunolloSignal], EpisodeCache]:
         if self._cache is not None and not self._cache_dirty:
             return self._cache
         
+        if self._journal is not None:
+            self._journal.flush()  # the disk must include queued episodes
+
         self._cache = []
-        if not self.storage_path.exists():
+        self._index = create_episodic_index(
+            self._index_kind, self._max_cache_size, **(self._index_params or {})
+        )
+        if self.store is not None:
+            # Memory-mapped columns: vectors come straight from the physics
+            # block and signals are only built when recalled
+            columns = self.store.tail(self._max_cache_size)
+            self._cache = EpisodeCache(columns)
+            self._index.add_batch(normalize_physics(columns.physics))
             self._cache_dirty = False
             return self._cache
-        
-        lines = self.storage_path.read_text(encoding="utf-8").splitlines()
-        
-        # Limit to most recent entries if cache is too large
-        if len(lines) > self._max_cache_size:
-            lines = lines[-self._max_cache_size:]
-        
-        for line in lines:
+
+        # Tail-read only the most recent entries, parsing as we go (newest
+        # first), from the active log back through sealed segments
+        remaining = self._max_cache_size
+        for path in [self.storage_path] + self._log_segments()[::-1]:
+            if remaining <= 0:
+                break
             try:
-                data = json.loads(line)
-                self._cache.append(ShunolloSignal(**data))
-            except Exception:
-                continue
+                for line in _iter_tail_lines(path, remaining):
+                    remaining -= 1
+                    try:
+                        data = json.loads(line)
+                        self._cache.append(ShunolloSignal(**data))
+                    except Exception:
+                        continue
+            except FileNotFoundError:
+                continue  # not written yet, or removed by another process's retention pass
+        self._cache.reverse()
         
+        if self._cache:
+            self._index.add_batch([s.to_vector(normalize=True) for s in self._cache])
         self._cache_dirty = False
         return self._cache
 
@@ -88,28 +287,152 @@ class Hippocampus:
         Encodes a conscious experience (Signal) into Long-Term Memory.
         Thread-safe with file locking.
         """
-        record = signal.model_dump()
-        # Ensure timestamp is string
-        if isinstance(record.get("timestamp"), datetime):
-            record["timestamp"] = record["timestamp"].isoformat()
-        
+        self.remember_batch([signal])
+
+    def remember_batch(self, signals: Sequence[ShunolloSignal]) -> None:
+        """
+        Encodes several experiences with a single locked append.
+        """
+        if not signals:
+            return
+        records = self._serialize(signals)
+        with self._lock:
+            if self._journal is not None:
+                self._journal.submit(records)
+            else:
+                self._commit(records)
+
+            # Append to the loaded cache and index instead of re-reading the file
+            if self._cache is not None and not self._cache_dirty:
+                self._cache.extend(signals)
+                self._index.add_batch([s.to_vector(normalize=True) for s in signals])
+                # Trim cache if too large (the index evicts in step)
+                if len(self._cache) > self._max_cache_size:
+                    del self._cache[:-self._max_cache_size]
+
+    def _serialize(self, signals: Sequence[ShunolloSignal]) -> List[Any]:
+        """Snapshot signals as store records (JSON lines or columnar rows)."""
+        if self.store is not None:
+            return episode_rows(signals)
+        lines = []
+        for signal in signals:
+            record = signal.model_dump()
+            # Ensure timestamp is string
+            if isinstance(record.get("timestamp"), datetime):
+                record["timestamp"] = record["timestamp"].isoformat()
+            lines.append(json.dumps(record) + "\n")
+        return lines
+
+    def _commit(self, records: List[Any]) -> None:
+        """Write serialized records to disk with the configured durability."""
+        if self.store is not None:
+            self.store.append_rows(records, self.durability)
+            return
+
         # File locking for thread safety (fixes Issue 4)
         with open(self.storage_path, "a", encoding="utf-8") as f:
             try:
                 _lock_file(f)
-                f.write(json.dumps(record) + "\n")
+                f.writelines(records)
+                if self.durability != "none":
+                    f.flush()
+                if self.durability == "fsync":
+                    os.fsync(f.fileno())
+                if f.tell() >= self.segment_bytes or self._active_log_expired():
+                    f.flush()
+                    self._seal_log()
             finally:
                 _unlock_file(f)
-        
-        # Invalidate cache so next recall picks up new data
-        self._cache_dirty = True
-        
-        # Also append to in-memory cache for immediate access
-        if self._cache is not None:
-            self._cache.append(signal)
-            # Trim cache if too large
-            if len(self._cache) > self._max_cache_size:
-                self._cache = self._cache[-self._max_cache_size:]
+
+    def enforce_retention(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        One retention pass (Forgetting Curve): drop expired segments and
+        downsample old ones into centroid episodes.
+
+        Args:
+            now: Epoch seconds (default: current time)
+
+        Returns:
+            Episodes dropped and episodes removed by consolidation
+        """
+        now = time.time() if now is None else now
+        with self._lock:  # never delete segments under a concurrent cache load
+            return self._enforce_retention(now)
+
+    def _enforce_retention(self, now: float) -> Dict[str, int]:
+        dropped = consolidated = 0
+        if self.store is not None:
+            if self.retention_seconds is not None:
+                dropped = self.store.drop_before(now - self.retention_seconds)
+            if self.downsample_after is not None:
+                consolidated = self.store.consolidate(
+                    now - self.downsample_after, self.consolidation_clusters
+                )
+        elif self.retention_seconds is not None:
+            cutoff = now - self.retention_seconds
+            for path in self._log_segments():
+                try:
+                    if self._newest_timestamp(path) >= cutoff:
+                        break
+                    with open(path, "rb") as f:
+                        dropped += sum(chunk.count(b"\n") for chunk in iter(lambda: f.read(1 << 20), b""))
+                    path.unlink()
+                except FileNotFoundError:
+                    continue  # already removed by another process
+
+        if dropped or consolidated:
+            self._cache_dirty = True
+            self._retention_stats["dropped"] += dropped
+            self._retention_stats["consolidated"] += consolidated
+        return {"dropped": dropped, "consolidated": consolidated}
+
+    @staticmethod
+    def _newest_timestamp(path: Path) -> float:
+        """Timestamp of the last dated episode in a JSONL segment."""
+        for line in _iter_tail_lines(path, 64):
+            ts = _parse_timestamp(line)
+            if ts != float("inf"):
+                return ts
+        return float("inf")  # undated: never expire
+
+    def _compact_loop(self, interval: float) -> None:
+        while not self._stop_compactor.wait(interval):
+            try:
+                self.enforce_retention()
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"[Hippocampus] Retention pass failed: {e}")
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every remembered episode is on disk.
+
+        Returns:
+            True if the write-behind backlog drained within the timeout
+        """
+        if self._journal is None:
+            return True
+        return self._journal.flush(timeout)
+
+    def close(self) -> None:
+        """Commit pending episodes and stop the background threads."""
+        if self._compactor is not None:
+            self._stop_compactor.set()
+            self._compactor.join()
+        if self._journal is not None:
+            self._journal.close()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Cache size and, with write-behind, journal depth and flush latency."""
+        stats: Dict[str, Any] = {
+            "cached_episodes": len(self._cache) if self._cache is not None else 0,
+            "store": "columnar" if self.store is not None else "jsonl",
+            "durability": self.durability,
+        }
+        if self._journal is not None:
+            stats["journal"] = self._journal.get_statistics()
+        if self.retention_seconds is not None or self.downsample_after is not None:
+            stats["retention"] = dict(self._retention_stats)
+        return stats
 
     def dream(self, batch_size: int = 10, random_sample: bool = True) -> Generator[ShunolloSignal, None, None]:
         """
@@ -117,14 +440,14 @@ class Hippocampus:
         If random_sample=True, picks random moments (Remixing).
         If False, picks most recent (Reflection).
         """
-        cache = self._load_cache()
-        if not cache:
-            return
-
-        if random_sample:
-            selection = random.sample(cache, min(len(cache), batch_size))
-        else:
-            selection = cache[-batch_size:]
+        with self._lock:
+            cache = self._load_cache()
+            if not cache:
+                return
+            if random_sample:
+                selection = random.sample(cache, min(len(cache), batch_size))
+            else:
+                selection = cache[-batch_size:]
 
         for signal in selection:
             yield signal
@@ -138,7 +461,8 @@ class Hippocampus:
         """
         Find episodes with similar physics vectors (Déjà Vu / Physics-RAG).
         
-        Uses in-memory cache for O(n) where n = cache size (not file size).
+        Uses the in-memory vector index: one vectorized distance pass over
+        the n cached episodes (not the file) plus an argpartition top-k.
         
         Args:
             query_vector: 18-dimensional normalized physics fingerprint
@@ -153,23 +477,14 @@ class Hippocampus:
         if threshold is None:
             threshold = self.DEFAULT_THRESHOLD
             
-        cache = self._load_cache()
-        if not cache:
-            return []
-        
-        matches = []
-        for signal in cache:
-            stored_vector = signal.to_vector(normalize=True)
-            
-            # Euclidean distance (18 floats = trivial compute)
-            distance = sum((a - b) ** 2 for a, b in zip(query_vector, stored_vector)) ** 0.5
-            
-            if distance <= threshold:
-                matches.append((signal, distance))
-        
-        # Sort by distance (closest = most similar)
-        matches.sort(key=lambda x: x[1])
-        return matches[:k]
+        with self._lock:
+            cache = self._load_cache()
+            if not cache:
+                return []
+
+            # Sorted by distance (closest = most similar)
+            positions, distances = self._index.search(query_vector, k, threshold)
+            return [(cache[i], float(d)) for i, d in zip(positions, distances)]
     
     def get_novelty_score(self, query_vector: List[float]) -> float:
         """
@@ -179,14 +494,23 @@ class Hippocampus:
             Distance to nearest neighbor (0.0 = exact match, higher = more novel).
             Returns infinity if memory is empty.
         """
-        matches = self.recall_similar(query_vector, k=1, threshold=float('inf'))
-        if not matches:
-            return float('inf')
-        return matches[0][1]
+        with self._lock:
+            if not self._load_cache():
+                return float('inf')
+            _, distances = self._index.search(query_vector, 1)
+        return float(distances[0])
 
     def clear_memory(self):
         """Amnesia."""
-        if self.storage_path.exists():
-            self.storage_path.unlink()
-        self._cache = None
-        self._cache_dirty = True
+        with self._lock:
+            if self._journal is not None:
+                self._journal.flush()
+            if self.store is not None:
+                self.store.clear()
+            for path in self._log_segments():
+                path.unlink()
+            if self.storage_path.exists():
+                self.storage_path.unlink()
+            self._cache = None
+            self._cache_dirty = True
+            self._index = None
@@ -9,6 +9,33 @@ Mathematical Foundation:
     Recall (Correlation): v_rec = F⁻¹{F{M} · F{k'}*}
     Capacity bound: C ≈ √N (space-bandwidth product limit)
 
+Spectral residency:
+    With spectral=True the hologram is held as its spectrum F{M}. Encoding
+    superimposes F{v} · F{k} directly and recall skips the forward FFT of M,
+    saving one full transform per call. The spatial view is materialized
+    only on demand (save, sharding, the M attribute).
+
+Lazy decay:
+    Forgetting multiplies the whole hologram by (1 - decay_rate) per encode.
+    Instead of rewriting M each time, the memory stores M = scale · M_stored
+    and only shrinks the scalar; new traces are added as trace / scale and
+    recalls apply the scale to F{M}. M_stored is renormalized (one O(size)
+    pass) only when the scale drifts below _DECAY_RENORM_FLOOR. A
+    HolographicBank keeps one such scale per bank.
+
+Raw persistence:
+    save() writes a compressed, portable .npz. save_raw() writes a .holo
+    file instead: magic, JSON header, then the stored array contiguously at
+    a 64-byte aligned offset. open_raw() maps it with np.memmap, so loading
+    is O(1) regardless of size, and read_only=True lets many worker
+    processes share one hologram through the page cache without copying.
+
+Real storage:
+    Stored vectors and keys are real, so their circular convolution is real
+    and the spectrum is Hermitian. With real=True the hologram is kept as a
+    float array (or its rfft half-spectrum when spectral) and every
+    transform uses rfft/irfft, halving memory and FFT cost.
+
 Capacity is O(√N) orthogonal memories before interference dominates.
 For size=1024, expect ~32 reliable memories.
 
@@ -21,18 +48,99 @@ Note:
     synchronization or instantiate separate memories per thread.
 """
 import numpy as np
-from typing import Tuple, Optional, List, Dict
+from typing import Tuple, Optional, List, Dict, Any
+import json
+import os
+import struct
 import warnings
 import threading
 
+from shunollo_core.utils.precision import DTypeLike, float_dtype, complex_dtype
+
 __all__ = [
     'HolographicMemory',
     'DistributedHolographicShard',
+    'HolographicBank',
     'create_holographic_memory',
     'shard_memory',
 ]
 
 
+_DECAY_RENORM_FLOOR = 1e-12
+
+_RAW_MAGIC = b"SHHOLO01"
+_RAW_SUFFIX = ".holo"
+_RAW_ALIGN = 64
+
+
+def _raw_path(path: str) -> str:
+    return path if path.endswith(_RAW_SUFFIX) else path + _RAW_SUFFIX
+
+
+def _write_raw(path: str, header: Dict[str, Any], array: np.ndarray) -> None:
+    """Write magic + JSON header + aligned contiguous array, atomically."""
+    array = np.ascontiguousarray(array)
+    header = dict(header, dtype=array.dtype.str, shape=list(array.shape))
+    header_bytes = json.dumps(header).encode("utf-8")
+    prefix = len(_RAW_MAGIC) + 4 + len(header_bytes)
+    padding = -prefix % _RAW_ALIGN
+    
+    # Replace rather than overwrite so processes mapping the old file keep it
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_RAW_MAGIC)
+        f.write(struct.pack("<I", len(header_bytes)))
+        f.write(header_bytes)
+        f.write(b"\0" * padding)
+        array.tofile(f)
+    os.replace(tmp_path, path)
+
+
+def _read_raw(path: str, read_only: bool) -> Tuple[Dict[str, Any], np.memmap]:
+    """Parse the header and memory-map the array (copy-on-write unless read_only)."""
+    try:
+        with open(path, "rb") as f:
+            magic = f.read(len(_RAW_MAGIC))
+            if magic != _RAW_MAGIC:
+                raise ValueError(f"Invalid hologram file format: bad magic in {path}")
+            (header_len,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_len).decode("utf-8"))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Hologram file not found: {path}")
+    
+    prefix = len(_RAW_MAGIC) + 4 + header_len
+    data = np.memmap(
+        path,
+        dtype=np.dtype(header["dtype"]),
+        mode="r" if read_only else "c",
+        offset=prefix + (-prefix % _RAW_ALIGN),
+        shape=tuple(header["shape"])
+    )
+    return header, data
+
+
+def _pad_rows(arr: np.ndarray, size: int, dtype: np.dtype) -> np.ndarray:
+    """Zero-pad or truncate each row of an (n, width) array to size."""
+    arr = np.asarray(arr, dtype=dtype)
+    if arr.ndim == 1:
+        arr = arr[np.newaxis, :]
+    if arr.ndim != 2:
+        raise ValueError(f"Expected a 2-D (n, width) array, got shape {arr.shape}")
+    if arr.shape[1] >= size:
+        return arr[:, :size]
+    return np.pad(arr, ((0, 0), (0, size - arr.shape[1])))
+
+
+def _rfft_energy(X: np.ndarray, size: int) -> np.ndarray:
+    """Σ|x|² of a length-size real signal from its rfft (one-sided Parseval)."""
+    power = np.abs(X) ** 2
+    # rfft keeps half of a Hermitian spectrum: interior bins count twice
+    total = 2 * np.sum(power, axis=-1) - power[..., 0]
+    if size % 2 == 0:
+        total = total - power[..., -1]
+    return total / size
+
+
 class HolographicMemory:
     """
     Associative memory using holographic (Fourier) encoding.
@@ -50,10 +158,14 @@ class HolographicMemory:
         capacity: Theoretical capacity (√size)
         memory_count: Number of stored memories
         decay_rate: Forgetting rate per encode
+        spectral: Hologram is stored in the frequency domain
+        real: Hologram is stored as a real signal (rfft/irfft transforms)
+        dtype: Real working dtype (float32 or float64, see utils.precision)
     """
     
     __slots__ = (
-        'size', 'decay_rate', 'require_context', 'M',
+        'size', 'decay_rate', 'require_context', 'spectral', 'real',
+        'dtype', '_cdtype', '_M', '_scale',
         'memory_count', '_total_energy', 'capacity',
         '_capacity_warned', '_lock'
     )
@@ -62,7 +174,10 @@ class HolographicMemory:
         self, 
         size: int = 1024, 
         decay_rate: float = 0.0,
-        require_context: bool = True
+        require_context: bool = True,
+        spectral: bool = False,
+        real: bool = False,
+        dtype: Optional[DTypeLike] = None
     ) -> None:
         """
         Initialize the memory.
@@ -71,6 +186,9 @@ class HolographicMemory:
             size: Size of holographic storage (frequency bins)
             decay_rate: Forgetting rate per encode [0, 1)
             require_context: Require distinct context keys
+            spectral: Keep the hologram resident as its spectrum F{M}
+            real: Store a real-valued hologram using rfft/irfft
+            dtype: float32 or float64; None follows config.precision
             
         Raises:
             ValueError: If size not positive or decay_rate out of range
@@ -83,7 +201,12 @@ class HolographicMemory:
         self.size = size
         self.decay_rate = decay_rate
         self.require_context = require_context
-        self.M = np.zeros(size, dtype=complex)
+        self.spectral = spectral
+        self.real = real
+        self.dtype = float_dtype(dtype)
+        self._cdtype = complex_dtype(self.dtype)
+        self._M = self._empty_storage()
+        self._scale = 1.0
         self.memory_count = 0
         self._total_energy = 0.0
         self.capacity = int(np.sqrt(size))
@@ -97,13 +220,109 @@ class HolographicMemory:
             f"capacity={self.capacity})"
         )
     
+    @property
+    def M(self) -> np.ndarray:
+        """
+        Spatial-domain hologram.
+        
+        In spectral mode this is a read-only snapshot materialized from F{M},
+        so in-place edits raise instead of being silently lost; assign to M
+        to replace the hologram.
+        """
+        with self._lock:
+            return self._spatial()
+    
+    @M.setter
+    def M(self, value: np.ndarray) -> None:
+        value = np.asarray(value)
+        if self.real:
+            value = np.real(value).astype(self.dtype)
+        else:
+            value = value.astype(self._cdtype)
+        self._M = self._fft(value) if self.spectral else value
+        self._scale = 1.0
+    
+    def _spatial(self) -> np.ndarray:
+        """Body of the M getter; the caller holds the lock."""
+        self._fold_scale()
+        if self.spectral:
+            M = self._ifft(self._M)
+            M.setflags(write=False)
+            return M
+        return self._M
+    
+    def _empty_storage(self) -> np.ndarray:
+        """Zeroed hologram in the configured domain and dtype."""
+        if self.spectral and self.real:
+            return np.zeros(self.size // 2 + 1, dtype=self._cdtype)
+        return np.zeros(self.size, dtype=self.dtype if self.real else self._cdtype)
+    
+    def _fft(self, x: np.ndarray, axis: int = -1) -> np.ndarray:
+        """Forward transform: rfft for real storage, full FFT otherwise."""
+        if self.real:
+            X = np.fft.rfft(x, axis=axis)
+        else:
+            X = np.fft.fft(x, axis=axis)
+        # NumPy < 2.0 always transforms in double precision
+        return X.astype(self._cdtype, copy=False)
+    
+    def _ifft(self, X: np.ndarray, axis: int = -1) -> np.ndarray:
+        """Inverse of _fft back to a length-size signal."""
+        if self.real:
+            return np.fft.irfft(X, n=self.size, axis=axis).astype(self.dtype, copy=False)
+        return np.fft.ifft(X, axis=axis).astype(self._cdtype, copy=False)
+    
+    def _energy(self, X: np.ndarray) -> np.ndarray:
+        """Signal energy Σ|x|² from its spectrum (Parseval), along the last axis."""
+        if self.real:
+            return _rfft_energy(X, self.size)
+        return np.sum(np.abs(X) ** 2, axis=-1) / self.size
+    
+    def _spectrum(self) -> np.ndarray:
+        """F{M} with the pending decay scale applied."""
+        if self.spectral:
+            return self._M if self._scale == 1.0 else self._M * self._scale
+        M_fft = self._fft(self._M)
+        if self._scale != 1.0:
+            M_fft *= self._scale
+        return M_fft
+    
+    def _fold_scale(self) -> None:
+        """Apply the pending decay scale to the stored array (one O(size) pass)."""
+        if self._scale != 1.0:
+            self._M *= self._scale
+            self._scale = 1.0
+    
+    def _decay(self, factor: float) -> None:
+        """Forget by factor in O(1), renormalizing only near underflow."""
+        self._scale *= factor
+        if self._scale < _DECAY_RENORM_FLOOR:
+            self._fold_scale()
+    
+    def _superimpose(self, VK: np.ndarray) -> None:
+        """Add a frequency-domain trace F{v} · F{k} (consumed) to the stored hologram."""
+        if self._scale != 1.0:
+            VK *= 1.0 / self._scale
+        if self.spectral:
+            self._M += VK
+        else:
+            self._M += self._ifft(VK)
+    
+    def _check_writable(self) -> None:
+        if not self._M.flags.writeable:
+            raise ValueError("Hologram is read-only (opened with read_only=True)")
+    
     def _pad_to_size(self, arr: np.ndarray) -> np.ndarray:
         """Zero-pad or truncate array to hologram size."""
-        arr = np.asarray(arr, dtype=float)
+        arr = np.asarray(arr, dtype=self.dtype)
         if len(arr) >= self.size:
             return arr[:self.size]
         return np.pad(arr, (0, self.size - len(arr)))
     
+    def _pad_batch(self, arr: np.ndarray) -> np.ndarray:
+        """Zero-pad or truncate each row of an (n, width) array to hologram size."""
+        return _pad_rows(arr, self.size, self.dtype)
+    
     def encode(
         self, 
         vector: np.ndarray, 
@@ -126,6 +345,8 @@ class HolographicMemory:
                 "Context key required. Provide context or set require_context=False."
             )
         
+        self._check_writable()
+        
         with self._lock:
             if self.memory_count >= self.capacity and not self._capacity_warned:
                 warnings.warn(
@@ -136,18 +357,18 @@ class HolographicMemory:
                 self._capacity_warned = True
             
             if self.decay_rate > 0:
-                self.M *= (1 - self.decay_rate)
+                self._decay(1 - self.decay_rate)
                 self._total_energy *= (1 - self.decay_rate) ** 2
             
             v = self._pad_to_size(vector)
             k = self._pad_to_size(context) if context is not None else v.copy()
             
-            V = np.fft.fft(v)
-            K = np.fft.fft(k)
-            convolution = np.fft.ifft(V * K)
+            V = self._fft(v)
+            K = self._fft(k)
+            VK = V * K
             
-            self.M += convolution
-            self._total_energy += np.sum(np.abs(convolution) ** 2)
+            self._total_energy += float(self._energy(VK))
+            self._superimpose(VK)
             self.memory_count += 1
     
     def recall(self, cue: np.ndarray) -> Tuple[np.ndarray, float]:
@@ -165,9 +386,9 @@ class HolographicMemory:
         with self._lock:
             k_prime = self._pad_to_size(cue)
             
-            M_fft = np.fft.fft(self.M)
-            K_prime_fft = np.fft.fft(k_prime)
-            correlation = np.fft.ifft(M_fft * np.conj(K_prime_fft))
+            M_fft = self._spectrum()
+            K_prime_fft = self._fft(k_prime)
+            correlation = self._ifft(M_fft * np.conj(K_prime_fft))
             
             recalled = np.real(correlation)
             
@@ -178,6 +399,102 @@ class HolographicMemory:
         
         return recalled, match_strength
     
+    def encode_batch(
+        self,
+        vectors: np.ndarray,
+        contexts: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Store n memory vectors in one pass.
+        
+        Equivalent to calling encode() row by row, but the whole block is
+        transformed with one axis-wise FFT and superimposed in the
+        frequency domain: M_new = M_old + F⁻¹{Σ w_i · F{v_i} · F{k_i}},
+        where w_i = (1 - decay_rate)^(n-1-i) replays per-encode decay.
+        
+        Args:
+            vectors: (n, width) memories to store (v)
+            contexts: (n, width) retrieval keys (k), row-aligned with vectors
+            
+        Raises:
+            ValueError: If context required but not provided, or row counts differ
+        """
+        if self.require_context and contexts is None:
+            raise ValueError(
+                "Context key required. Provide context or set require_context=False."
+            )
+        self._check_writable()
+        
+        v = self._pad_batch(vectors)
+        k = self._pad_batch(contexts) if contexts is not None else v
+        if k.shape[0] != v.shape[0]:
+            raise ValueError(
+                f"contexts has {k.shape[0]} rows but vectors has {v.shape[0]}"
+            )
+        n = v.shape[0]
+        if n == 0:
+            return
+        
+        V = self._fft(v, axis=1)
+        K = self._fft(k, axis=1)
+        VK = V * K
+        # Parseval gives each trace's energy without a per-item inverse FFT
+        energies = self._energy(VK)
+        
+        with self._lock:
+            if self.memory_count + n > self.capacity and not self._capacity_warned:
+                warnings.warn(
+                    f"Memory count ({max(self.memory_count, self.capacity)}) >= capacity ({self.capacity}). "
+                    f"Retrieval accuracy will degrade.",
+                    UserWarning
+                )
+                self._capacity_warned = True
+            
+            if self.decay_rate > 0:
+                retain = 1 - self.decay_rate
+                weights = retain ** np.arange(n - 1, -1, -1, dtype=float)
+                self._decay(retain ** n)
+                self._total_energy = (
+                    self._total_energy * retain ** (2 * n)
+                    + float(np.dot(weights ** 2, energies))
+                )
+                VK *= weights[:, np.newaxis]
+            else:
+                self._total_energy += float(np.sum(energies))
+            
+            self._superimpose(np.sum(VK, axis=0))
+            self.memory_count += n
+    
+    def recall_batch(self, cues: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Retrieve the memories associated with n cues in one pass.
+        
+        Equivalent to calling recall() row by row; F{M} is computed once and
+        the correlation runs as a single axis-wise FFT over the cue block.
+        
+        Args:
+            cues: (n, width) retrieval cues (k')
+        
+        Returns:
+            Tuple of (recalled_patterns (n, size), match_strengths (n,))
+        """
+        k_prime = self._pad_batch(cues)
+        K_prime_fft = self._fft(k_prime, axis=1)
+        
+        with self._lock:
+            M_fft = self._spectrum()
+            total_energy = self._total_energy
+        
+        correlation = self._ifft(M_fft[np.newaxis, :] * np.conj(K_prime_fft), axis=1)
+        recalled = np.real(correlation)
+        
+        if total_energy > 0 and recalled.shape[0] > 0:
+            strengths = np.max(np.abs(recalled), axis=1) / np.sqrt(total_energy)
+        else:
+            strengths = np.zeros(recalled.shape[0])
+        
+        return recalled, strengths
+    
     def check_resonance(
         self, 
         query: np.ndarray, 
@@ -202,8 +519,11 @@ class HolographicMemory:
                 "utilization": utilization,
                 "utilization_warning": utilization > 0.8,
                 "hologram_size": self.size,
-                "total_bytes": self.M.nbytes,
-                "bytes_per_memory": self.M.nbytes / max(1, self.memory_count),
+                "spectral": self.spectral,
+                "real": self.real,
+                "dtype": str(self.dtype),
+                "total_bytes": self._M.nbytes,
+                "bytes_per_memory": self._M.nbytes / max(1, self.memory_count),
                 "total_energy": self._total_energy
             }
     
@@ -217,18 +537,26 @@ class HolographicMemory:
     def clear(self) -> None:
         """Clear all memories."""
         with self._lock:
-            self.M = np.zeros(self.size, dtype=complex)
+            self._M = self._empty_storage()
+            self._scale = 1.0
             self.memory_count = 0
             self._total_energy = 0.0
             self._capacity_warned = False
     
     def save(self, path: str) -> None:
-        """Save hologram to file using numpy format."""
+        """
+        Save hologram to file using numpy format.
+        
+        The spatial hologram is always written as real/imaginary parts, so
+        files are interchangeable between spectral, spatial and real memories
+        (real memories write a zero imaginary part).
+        """
         with self._lock:
+            M = self._spatial()
             np.savez_compressed(
                 path,
-                hologram_real=np.real(self.M),
-                hologram_imag=np.imag(self.M),
+                hologram_real=np.real(M),
+                hologram_imag=np.imag(M),
                 size=np.array([self.size]),
                 count=np.array([self.memory_count]),
                 energy=np.array([self._total_energy]),
@@ -239,6 +567,10 @@ class HolographicMemory:
         """
         Load hologram from file.
         
+        Files written by complex memories are upgraded automatically when
+        loaded into a real memory: the imaginary part, which is only
+        round-off for holograms built from real vectors, is discarded.
+        
         Raises:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is invalid
@@ -255,7 +587,16 @@ class HolographicMemory:
             with self._lock:
                 real = data['hologram_real']
                 imag = data['hologram_imag']
-                self.M = real + 1j * imag
+                if self.real:
+                    scale = max(1.0, float(np.max(np.abs(real), initial=0.0)))
+                    if np.max(np.abs(imag), initial=0.0) > 1e-6 * scale:
+                        warnings.warn(
+                            f"Discarding non-negligible imaginary hologram component from {path}",
+                            UserWarning
+                        )
+                    self.M = real
+                else:
+                    self.M = real + 1j * imag
                 self.size = int(data['size'][0])
                 self.memory_count = int(data['count'][0])
                 self._total_energy = float(data['energy'][0])
@@ -264,6 +605,72 @@ class HolographicMemory:
                 self._capacity_warned = self.memory_count >= self.capacity
         except KeyError as e:
             raise ValueError(f"Invalid hologram file format: missing {e}")
+    
+    def save_raw(self, path: str) -> str:
+        """
+        Save the stored array uncompressed for memory-mapped loading.
+        
+        The array is written in its storage domain and dtype (spectral/real
+        modes included), so open_raw() can map it without conversion.
+        
+        Returns:
+            The written path (with .holo suffix)
+        """
+        path = _raw_path(path)
+        with self._lock:
+            header = {
+                "kind": "memory",
+                "size": self.size,
+                "count": self.memory_count,
+                "energy": self._total_energy,
+                "decay_rate": self.decay_rate,
+                "require_context": self.require_context,
+                "spectral": self.spectral,
+                "real": self.real,
+                "precision": self.dtype.name,
+            }
+            stored = self._M if self._scale == 1.0 else self._M * self._scale
+            _write_raw(path, header, stored)
+        return path
+    
+    @classmethod
+    def open_raw(cls, path: str, read_only: bool = False) -> 'HolographicMemory':
+        """
+        Memory-map a hologram written by save_raw() in O(1).
+        
+        Args:
+            path: File path (.holo suffix optional)
+            read_only: Map read-only so processes share pages; encodes raise.
+                       Otherwise the mapping is copy-on-write and the file
+                       is never modified.
+        
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is invalid
+        """
+        path = _raw_path(path)
+        header, data = _read_raw(path, read_only)
+        try:
+            if header["kind"] != "memory":
+                raise ValueError(f"Invalid hologram file format: {path} holds a {header['kind']}")
+            memory = cls(
+                size=int(header["size"]),
+                decay_rate=float(header["decay_rate"]),
+                require_context=bool(header["require_context"]),
+                spectral=bool(header["spectral"]),
+                real=bool(header["real"]),
+                dtype=header["precision"]
+            )
+        except KeyError as e:
+            raise ValueError(f"Invalid hologram file format: missing {e}")
+        if data.shape != memory._M.shape or data.dtype != memory._M.dtype:
+            raise ValueError(f"Invalid hologram file format: array {data.shape} {data.dtype} in {path}")
+        
+        memory._M = data
+        memory.memory_count = int(header["count"])
+        memory._total_energy = float(header["energy"])
+        memory._capacity_warned = memory.memory_count >= memory.capacity
+        return memory
 
 
 class DistributedHolographicShard:
@@ -366,10 +773,12 @@ class DistributedHolographicShard:
         
         reconstructed = HolographicMemory(size=original_size, require_context=False)
         
+        M = np.zeros(original_size, dtype=complex)
         for shard in shards:
             start = shard.shard_id * shard.shard_size
             end = start + shard.shard_size
-            reconstructed.M[start:end] = shard.shard
+            M[start:end] = shard.shard
+        reconstructed.M = M
         
         present_ids = {s.shard_id for s in shards}
         total_shards = shards[0].total_shards
@@ -386,16 +795,394 @@ class DistributedHolographicShard:
         return reconstructed
 
 
+class HolographicBank:
+    """
+    Many holograms stacked into one contiguous (banks, size) store.
+    
+    A single HolographicMemory saturates at ~√N memories, so large stores
+    are spread across banks. The bank keeps every hologram resident as its
+    rfft spectrum in one (banks, size // 2 + 1) array, so associative
+    search against all banks is one vectorized correlation:
+    
+        v_rec[b] = F⁻¹{F{M_b} · F{k'}*}    for every bank b at once
+    
+    New encodes are routed to the least-saturated bank. Decay is lazy, as
+    in HolographicMemory, with one pending scale per bank.
+    
+    Attributes:
+        n_banks: Number of stacked holograms
+        size: Hologram size per bank
+        capacity: Theoretical capacity per bank (√size)
+        memory_counts: Memories stored in each bank
+        decay_rate: Forgetting rate per encode into a bank
+    """
+    
+    __slots__ = (
+        'n_banks', 'size', 'decay_rate', 'require_context', 'dtype',
+        '_cdtype', '_F', '_scales', 'memory_counts', '_energies', 'capacity',
+        '_capacity_warned', '_lock'
+    )
+    
+    def __init__(
+        self,
+        n_banks: int,
+        size: int = 1024,
+        decay_rate: float = 0.0,
+        require_context: bool = True,
+        dtype: Optional[DTypeLike] = None
+    ) -> None:
+        """
+        Initialize the bank.
+        
+        Args:
+            n_banks: Number of holograms in the bank
+            size: Size of each hologram (frequency bins)
+            decay_rate: Forgetting rate per encode into a bank [0, 1)
+            require_context: Require distinct context keys
+            dtype: float32 or float64; None follows config.precision
+            
+        Raises:
+            ValueError: If n_banks/size not positive or decay_rate out of range
+        """
+        if n_banks <= 0:
+            raise ValueError(f"n_banks must be positive, got {n_banks}")
+        if size <= 0:
+            raise ValueError(f"size must be positive, got {size}")
+        if decay_rate < 0 or decay_rate >= 1:
+            raise ValueError(f"decay_rate must be in [0, 1), got {decay_rate}")
+        
+        self.n_banks = n_banks
+        self.size = size
+        self.decay_rate = decay_rate
+        self.require_context = require_context
+        self.dtype = float_dtype(dtype)
+        self._cdtype = complex_dtype(self.dtype)
+        self._F = np.zeros((n_banks, size // 2 + 1), dtype=self._cdtype)
+        self._scales = np.ones(n_banks, dtype=np.float64)  # pending decay per bank
+        self.memory_counts = np.zeros(n_banks, dtype=np.int64)
+        self._energies = np.zeros(n_banks, dtype=np.float64)
+        self.capacity = int(np.sqrt(size))
+        self._capacity_warned = False
+        self._lock = threading.Lock()
+    
+    def __repr__(self) -> str:
+        return (
+            f"HolographicBank(n_banks={self.n_banks}, size={self.size}, "
+            f"memory_count={int(self.memory_counts.sum())})"
+        )
+    
+    def _route(self, n: int) -> np.ndarray:
+        """Assign n encodes, one at a time, to the least-saturated bank."""
+        counts = self.memory_counts.copy()
+        banks = np.empty(n, dtype=np.int64)
+        for i in range(n):
+            b = int(np.argmin(counts))
+            banks[i] = b
+            counts[b] += 1
+        return banks
+    
+    def encode(
+        self,
+        vector: np.ndarray,
+        context: Optional[np.ndarray] = None,
+        bank: Optional[int] = None
+    ) -> int:
+        """
+        Store a memory in one bank.
+        
+        Args:
+            vector: The memory to store (v)
+            context: The retrieval key (k)
+            bank: Target bank; None routes to the least-saturated bank
+        
+        Returns:
+            The bank the memory was stored in
+        """
+        contexts = None if context is None else [context]
+        banks = None if bank is None else [bank]
+        return int(self.encode_batch([vector], contexts, banks=banks)[0])
+    
+    def encode_batch(
+        self,
+        vectors: np.ndarray,
+        contexts: Optional[np.ndarray] = None,
+        banks: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Store n memories, routed to the least-saturated banks.
+        
+        Each bank sees its rows in order, so per-bank decay matches encoding
+        them one by one into a standalone HolographicMemory.
+        
+        Args:
+            vectors: (n, width) memories to store (v)
+            contexts: (n, width) retrieval keys (k)
+            banks: Optional (n,) explicit target banks
+        
+        Returns:
+            (n,) bank index each memory was stored in
+            
+        Raises:
+            ValueError: If context required but missing, or shapes/banks invalid
+        """
+        if self.require_context and contexts is None:
+            raise ValueError(
+                "Context key required. Provide context or set require_context=False."
+            )
+        
+        if not self._F.flags.writeable:
+            raise ValueError("Hologram bank is read-only (opened with read_only=True)")
+        
+        v = _pad_rows(vectors, self.size, self.dtype)
+        k = _pad_rows(contexts, self.size, self.dtype) if contexts is not None else v
+        if k.shape[0] != v.shape[0]:
+            raise ValueError(
+                f"contexts has {k.shape[0]} rows but vectors has {v.shape[0]}"
+            )
+        n = v.shape[0]
+        
+        VK = np.fft.rfft(v, axis=1) * np.fft.rfft(k, axis=1)
+        VK = VK.astype(self._cdtype, copy=False)
+        energies = _rfft_energy(VK, self.size).astype(np.float64)
+        
+        with self._lock:
+            if banks is None:
+                target = self._route(n)
+            else:
+                target = np.asarray(banks, dtype=np.int64).reshape(-1)
+                if target.shape[0] != n:
+                    raise ValueError(f"banks has {target.shape[0]} entries but vectors has {n}")
+                if n and (target.min() < 0 or target.max() >= self.n_banks):
+                    raise ValueError(f"bank ids must be in [0, {self.n_banks - 1}]")
+            if n == 0:
+                return target
+            
+            per_bank = np.bincount(target, minlength=self.n_banks)
+            if (
+                not self._capacity_warned
+                and np.any(self.memory_counts + per_bank > self.capacity)
+            ):
+                warnings.warn(
+                    f"Bank memory count >= capacity ({self.capacity}) per bank. "
+                    f"Retrieval accuracy will degrade; add banks.",
+                    UserWarning
+                )
+                self._capacity_warned = True
+            
+            if self.decay_rate > 0:
+                retain = 1 - self.decay_rate
+                # Position of each row from the end of its bank's sub-sequence
+                order = np.argsort(target, kind="stable")
+                starts = np.concatenate(([0], np.cumsum(per_bank)[:-1]))
+                rank = np.empty(n, dtype=np.int64)
+                rank[order] = np.arange(n) - starts[target[order]]
+                weights = retain ** (per_bank[target] - 1 - rank).astype(float)
+                self._decay(retain ** per_bank)
+                self._energies *= retain ** (2 * per_bank)
+                energies *= weights ** 2
+                # Traces are stored against the pending scale of their bank
+                VK *= (weights / self._scales[target])[:, np.newaxis]
+            
+            np.add.at(self._F, target, VK)
+            np.add.at(self._energies, target, energies)
+            self.memory_counts += per_bank
+        
+        return target
+    
+    def _decay(self, factors: np.ndarray) -> None:
+        """Forget by a factor per bank in O(banks), renormalizing only banks near underflow."""
+        self._scales *= factors
+        low = self._scales < _DECAY_RENORM_FLOOR
+        if np.any(low):
+            self._F[low] *= self._scales[low, np.newaxis]
+            self._scales[low] = 1.0
+    
+    def _stored_spectra(self) -> np.ndarray:
+        """The (banks, bins) spectra with pending decay applied."""
+        if np.all(self._scales == 1.0):
+            return self._F
+        return self._F * self._scales[:, np.newaxis].astype(self.dtype)
+    
+    def _correlate(self, cue: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Correlate one cue against every bank: (recalled (banks, size), strengths (banks,))."""
+        K = np.fft.rfft(_pad_rows(cue, self.size, self.dtype)[0]).astype(self._cdtype, copy=False)
+        with self._lock:
+            correlation = self._F * np.conj(K)[np.newaxis, :]
+            scales = self._scales.copy()
+            energies = self._energies.copy()
+        recalled = np.fft.irfft(correlation, n=self.size, axis=1).astype(self.dtype, copy=False)
+        if np.any(scales != 1.0):
+            recalled *= scales[:, np.newaxis].astype(self.dtype)
+        peaks = np.max(np.abs(recalled), axis=1)
+        strengths = np.zeros(self.n_banks)
+        stored = energies > 0
+        strengths[stored] = peaks[stored] / np.sqrt(energies[stored])
+        return recalled, strengths
+    
+    def match_strengths(self, cue: np.ndarray) -> np.ndarray:
+        """match_strength of the cue against every bank, shape (n_banks,)."""
+        return self._correlate(cue)[1]
+    
+    def search(
+        self,
+        cue: np.ndarray,
+        k: int = 1
+    ) -> List[Tuple[int, np.ndarray, float]]:
+        """
+        Find the banks that resonate most strongly with a cue.
+        
+        Args:
+            cue: The retrieval cue (k')
+            k: Number of banks to return
+        
+        Returns:
+            List of (bank_id, recalled_pattern, match_strength), strongest first
+        """
+        recalled, strengths = self._correlate(cue)
+        k = max(0, min(k, self.n_banks))
+        if k == 0:
+            return []
+        top = np.argpartition(-strengths, k - 1)[:k]
+        top = top[np.argsort(-strengths[top], kind="stable")]
+        return [(int(b), recalled[b], float(strengths[b])) for b in top]
+    
+    def get_memory(self, bank: int) -> HolographicMemory:
+        """Copy one bank out as a standalone (real, spectral) HolographicMemory."""
+        if bank < 0 or bank >= self.n_banks:
+            raise ValueError(f"bank must be in [0, {self.n_banks - 1}], got {bank}")
+        memory = HolographicMemory(
+            size=self.size,
+            decay_rate=self.decay_rate,
+            require_context=self.require_context,
+            spectral=True,
+            real=True,
+            dtype=self.dtype
+        )
+        with self._lock:
+            memory._M = self._F[bank].copy()
+            memory._scale = float(self._scales[bank])
+            memory.memory_count = int(self.memory_counts[bank])
+            memory._total_energy = float(self._energies[bank])
+        memory._capacity_warned = memory.memory_count >= memory.capacity
+        return memory
+    
+    def get_statistics(self) -> Dict:
+        """Get aggregate storage statistics across all banks."""
+        with self._lock:
+            total = int(self.memory_counts.sum())
+            total_capacity = self.capacity * self.n_banks
+            per_bank = self.memory_counts / self.capacity if self.capacity > 0 else np.ones(self.n_banks)
+            utilization = total / total_capacity if total_capacity > 0 else 0
+            return {
+                "n_banks": self.n_banks,
+                "memory_count": total,
+                "capacity": total_capacity,
+                "capacity_per_bank": self.capacity,
+                "utilization": utilization,
+                "utilization_warning": utilization > 0.8,
+                "max_bank_utilization": float(np.max(per_bank)),
+                "saturated_banks": int(np.sum(self.memory_counts >= self.capacity)),
+                "hologram_size": self.size,
+                "dtype": str(self.dtype),
+                "total_bytes": self._F.nbytes,
+                "bytes_per_memory": self._F.nbytes / max(1, total),
+                "total_energy": float(self._energies.sum())
+            }
+    
+    def get_interference_estimate(self) -> float:
+        """Estimate mean interference level across banks [0, 1]."""
+        if self.capacity == 0:
+            return 1.0
+        ratios = self.memory_counts / self.capacity
+        return float(np.mean(np.minimum(1.0, ratios ** 2)))
+    
+    def clear(self) -> None:
+        """Clear all banks."""
+        with self._lock:
+            self._F = np.zeros((self.n_banks, self.size // 2 + 1), dtype=self._cdtype)
+            self._scales[:] = 1.0
+            self.memory_counts[:] = 0
+            self._energies[:] = 0.0
+            self._capacity_warned = False
+    
+    def save_raw(self, path: str) -> str:
+        """
+        Save the stacked spectra uncompressed for memory-mapped loading.
+        
+        Returns:
+            The written path (with .holo suffix)
+        """
+        path = _raw_path(path)
+        with self._lock:
+            header = {
+                "kind": "bank",
+                "size": self.size,
+                "counts": self.memory_counts.tolist(),
+                "energies": self._energies.tolist(),
+                "decay_rate": self.decay_rate,
+                "require_context": self.require_context,
+                "precision": self.dtype.name,
+            }
+            _write_raw(path, header, self._stored_spectra())
+        return path
+    
+    @classmethod
+    def open_raw(cls, path: str, read_only: bool = False) -> 'HolographicBank':
+        """
+        Memory-map a bank written by save_raw() without reading the spectra.
+        
+        Args:
+            path: File path (.holo suffix optional)
+            read_only: Map read-only so processes share pages; encodes raise.
+                       Otherwise the mapping is copy-on-write.
+        
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If file format is invalid
+        """
+        path = _raw_path(path)
+        header, data = _read_raw(path, read_only)
+        try:
+            if header["kind"] != "bank":
+                raise ValueError(f"Invalid hologram file format: {path} holds a {header['kind']}")
+            # np.zeros is lazily paged, so this allocation is not touched
+            bank = cls(
+                n_banks=int(data.shape[0]),
+                size=int(header["size"]),
+                decay_rate=float(header["decay_rate"]),
+                require_context=bool(header["require_context"]),
+                dtype=header["precision"]
+            )
+            counts = np.asarray(header["counts"], dtype=np.int64)
+            energies = np.asarray(header["energies"], dtype=np.float64)
+        except KeyError as e:
+            raise ValueError(f"Invalid hologram file format: missing {e}")
+        if data.shape != bank._F.shape or data.dtype != bank._F.dtype or len(counts) != bank.n_banks:
+            raise ValueError(f"Invalid hologram file format: array {data.shape} {data.dtype} in {path}")
+        
+        bank._F = data
+        bank.memory_counts = counts
+        bank._energies = energies
+        bank._capacity_warned = bool(np.any(counts >= bank.capacity))
+        return bank
+
+
 def create_holographic_memory(
     size: int = 1024,
     decay_rate: float = 0.0,
-    require_context: bool = True
+    require_context: bool = True,
+    spectral: bool = False,
+    real: bool = False,
+    dtype: Optional[DTypeLike] = None
 ) -> HolographicMemory:
     """Create a HolographicMemory instance."""
     return HolographicMemory(
         size=size,
         decay_rate=decay_rate,
-        require_context=require_context
+        require_context=require_context,
+        spectral=spectral,
+        real=real,
+        dtype=dtype
     )
 
 
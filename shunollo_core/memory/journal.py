@@ -0,0 +1,265 @@
+"""
+Write-Behind Journal (Memory Consolidation Buffer)
+--------------------------------------------------
+Biological Role: Synaptic tagging. New experiences are tagged immediately
+and consolidated into long-term storage in bursts (sharp-wave ripples),
+not one synapse at a time.
+Cybernetic Role: Asynchronous group commit for the episodic log, keeping
+disk latency out of the perception loop.
+
+Records are queued in memory and handed to a sink by a background thread
+in group commits, triggered when max_batch records are pending or the
+oldest has waited max_delay seconds. The backlog is bounded: when it is
+full, submit() blocks (back-pressure) instead of growing without limit.
+
+Durability levels (applied by the sink on each commit):
+    "none":  hand the batch to the writer; it may sit in user-space buffers
+    "flush": flush to the OS page cache (survives a process crash)
+    "fsync": fsync to disk (survives power loss)
+"""
+import atexit
+import logging
+import threading
+import time
+import weakref
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+__all__ = ['DURABILITY_LEVELS', 'WriteBehindJournal', 'check_durability']
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_LEVELS = ("none", "flush", "fsync")
+
+# Open journals, weakly held so the exit hook does not keep them alive
+_live_journals: "weakref.WeakSet[WriteBehindJournal]" = weakref.WeakSet()
+
+# Seconds an idle journal thread waits before checking its journal still exists
+_IDLE_POLL = 1.0
+
+
+def check_durability(durability: str) -> None:
+    """Raise ValueError for an unknown durability level."""
+    if durability not in DURABILITY_LEVELS:
+        raise ValueError(f"durability must be one of {DURABILITY_LEVELS}, got '{durability}'")
+
+
+@atexit.register
+def _close_live_journals() -> None:
+    """Commit the backlog of every journal still open at interpreter exit."""
+    for journal in list(_live_journals):
+        journal.close()
+
+
+def _wake(cond: threading.Condition) -> None:
+    with cond:
+        cond.notify_all()
+
+
+def _journal_loop(ref: "weakref.ref[WriteBehindJournal]", cond: threading.Condition) -> None:
+    """
+    Journal thread body. It holds the journal only while records are
+    pending, so an idle journal nobody references can be freed; the
+    thread then exits.
+    """
+    while True:
+        with cond:
+            journal = ref()
+            if journal is None:
+                return
+            if not journal._pending and not journal._closed:
+                del journal
+                if ref() is not None:
+                    cond.wait(_IDLE_POLL)
+                continue
+        if not journal._commit_next():
+            return
+        del journal
+
+
+class WriteBehindJournal:
+    """
+    Bounded in-memory queue drained by a group-commit thread.
+
+    Attributes:
+        max_batch: Records per commit (and the early-commit trigger)
+        max_delay: Seconds a record may wait before a commit is forced
+        max_backlog: Queued records before submit() blocks
+    """
+
+    def __init__(
+        self,
+        sink: Callable[[List[Any]], None],
+        max_batch: int = 1024,
+        max_delay: float = 0.05,
+        max_backlog: int = 65536,
+        name: str = "WriteBehindJournal"
+    ) -> None:
+        """
+        Args:
+            sink: Called from the journal thread with each batch of records
+            max_batch: Maximum records per group commit
+            max_delay: Maximum seconds before pending records are committed
+            max_backlog: Bound on queued records (back-pressure beyond it)
+            name: Journal thread name
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if max_batch <= 0 or max_backlog <= 0 or max_delay <= 0:
+            raise ValueError("max_batch, max_backlog and max_delay must be positive")
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_backlog = max(max_backlog, max_batch)
+        self._sink = sink
+        self._pending: Deque[Any] = deque()
+        self._arrivals: Deque[List[Any]] = deque()  # [monotonic enqueue time, records] per submit
+        self._in_flight = 0     # records taken by the thread but not yet committed
+        self._flush_requested = False
+        self._closed = False
+        self._cond = threading.Condition()
+        self._latencies: Deque[float] = deque(maxlen=1024)
+        self._stats = {
+            "submitted": 0, "committed": 0, "commits": 0,
+            "failed": 0, "blocked_submits": 0, "max_depth": 0,
+        }
+        self._thread = threading.Thread(
+            target=_journal_loop, args=(weakref.ref(self), self._cond), daemon=True, name=name
+        )
+        self._thread.start()
+        weakref.finalize(self, _wake, self._cond)
+        _live_journals.add(self)
+
+    def __repr__(self) -> str:
+        return f"WriteBehindJournal(depth={self.depth}, max_batch={self.max_batch})"
+
+    @property
+    def depth(self) -> int:
+        """Records queued or being committed."""
+        with self._cond:
+            return len(self._pending) + self._in_flight
+
+    def submit(self, records: Sequence[Any]) -> None:
+        """
+        Queue records for the next group commit.
+
+        Blocks while the backlog is full.
+
+        Raises:
+            RuntimeError: If the journal is closed
+        """
+        if not records:
+            return
+        with self._cond:
+            if len(self._pending) + len(records) > self.max_backlog and not self._closed:
+                self._stats["blocked_submits"] += 1
+                self._cond.notify_all()
+                while len(self._pending) + len(records) > self.max_backlog and self._pending:
+                    self._cond.wait()
+            if self._closed:
+                raise RuntimeError("WriteBehindJournal is closed")
+            was_empty = not self._pending
+            self._arrivals.append([time.monotonic(), len(records)])
+            self._pending.extend(records)
+            self._stats["submitted"] += len(records)
+            self._stats["max_depth"] = max(self._stats["max_depth"], len(self._pending))
+            if was_empty or len(self._pending) >= self.max_batch:
+                # Arm the max_delay timer, or commit a full batch now
+                self._cond.notify_all()
+
+    def _commit_next(self) -> bool:
+        """
+        Wait for a commit trigger and commit one batch.
+
+        Returns:
+            False once the journal is closed and drained
+        """
+        with self._cond:
+            while True:
+                if self._pending and (
+                    len(self._pending) >= self.max_batch
+                    or self._flush_requested
+                    or self._closed
+                    or time.monotonic() - self._arrivals[0][0] >= self.max_delay
+                ):
+                    break
+                if self._closed:
+                    return False
+                if not self._pending:
+                    return True  # idle: the thread waits without holding the journal
+                self._cond.wait(self._arrivals[0][0] + self.max_delay - time.monotonic())
+            take = min(len(self._pending), self.max_batch)
+            batch = [self._pending.popleft() for _ in range(take)]
+            self._in_flight = take
+            # Leftover records keep their own enqueue time for the max_delay trigger
+            remaining = take
+            while remaining:
+                arrival = self._arrivals[0]
+                if arrival[1] > remaining:
+                    arrival[1] -= remaining
+                    break
+                remaining -= arrival[1]
+                self._arrivals.popleft()
+            self._cond.notify_all()  # wake submitters blocked on the backlog
+
+        start = time.perf_counter()
+        try:
+            self._sink(batch)
+            failed = False
+        except Exception as e:
+            failed = True
+            logger.warning(f"[Journal] Commit of {take} records failed: {e}")
+        latency = time.perf_counter() - start
+
+        with self._cond:
+            self._in_flight = 0
+            self._latencies.append(latency)
+            self._stats["commits"] += 1
+            self._stats["failed" if failed else "committed"] += take
+            if not self._pending:
+                self._flush_requested = False
+            self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Commit everything queued so far and wait for it.
+
+        Returns:
+            True if the backlog drained within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if not self._thread.is_alive():
+                return not self._pending
+            self._flush_requested = True
+            self._cond.notify_all()
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Queue depth, commit counters and flush latency (ms) over recent commits."""
+        with self._cond:
+            latencies = sorted(self._latencies)
+            stats = dict(self._stats, depth=len(self._pending) + self._in_flight)
+        if latencies:
+            stats["flush_latency_ms"] = {
+                "mean": 1e3 * sum(latencies) / len(latencies),
+                "p99": 1e3 * latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))],
+                "max": 1e3 * latencies[-1],
+            }
+        return stats
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Commit the backlog and stop the journal thread."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        _live_journals.discard(self)
@@ -0,0 +1,248 @@
+"""
+Sharded Holographic Memory
+--------------------------
+Process-parallel recall over DistributedHolographicShard.
+
+Each shard is placed on one worker (shard i -> worker i % n_workers), so a
+worker process only holds its own slice of the hologram. A cue is fanned
+out to every shard concurrently, the partial recalls are stitched back in
+shard order and the strengths are merged:
+
+    strength = Σ strength_s / total_shards   (over shards that answered)
+
+A shard that times out or whose worker crashed contributes nothing, so
+the merged result degrades like a missing shard in reconstruct_from_shards
+(a notch in the recalled pattern, proportionally lower strength) instead
+of failing the recall. Crashed workers, and process workers stuck on a
+timed-out shard, are restarted on the next call.
+"""
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+)
+from concurrent.futures.process import BrokenProcessPool
+import ctypes
+import multiprocessing
+import os
+import signal
+import threading
+import warnings
+
+from shunollo_core.memory.holographic import (
+    HolographicMemory,
+    DistributedHolographicShard,
+    shard_memory,
+)
+
+__all__ = ['ShardedHolographicMemory']
+
+
+# Per-process shard placement, filled by the pool initializer
+_WORKER_SHARDS: Dict[int, DistributedHolographicShard] = {}
+
+
+def _init_shard_worker(shards: List[DistributedHolographicShard], pid: ctypes.c_longlong) -> None:
+    pid.value = os.getpid()  # lets the coordinator kill this worker if it hangs
+    _WORKER_SHARDS.clear()
+    _WORKER_SHARDS.update({s.shard_id: s for s in shards})
+
+
+def _worker_partial_recall(shard_id: int, cue: np.ndarray) -> Tuple[np.ndarray, float]:
+    return _WORKER_SHARDS[shard_id].partial_recall(cue)
+
+
+class ShardedHolographicMemory:
+    """
+    Coordinator that runs partial_recall on all shards in parallel.
+
+    Attributes:
+        shards: The DistributedHolographicShards being served
+        n_workers: Number of worker processes (or threads)
+        timeout: Seconds to wait for shards before answering without them
+    """
+
+    def __init__(
+        self,
+        memory: HolographicMemory,
+        n_shards: int,
+        n_workers: Optional[int] = None,
+        timeout: float = 1.0,
+        use_processes: bool = True
+    ) -> None:
+        """
+        Shard a memory and start the workers.
+
+        Args:
+            memory: The full hologram to serve
+            n_shards: Number of frequency-domain shards
+            n_workers: Worker count (default: min(n_shards, CPU count))
+            timeout: Per-recall deadline in seconds
+            use_processes: Process workers (True) or a thread pool (False)
+
+        Raises:
+            ValueError: If n_shards, n_workers or timeout are invalid
+        """
+        if timeout <= 0:
+            raise ValueError(f"timeout must be positive, got {timeout}")
+        self.shards = shard_memory(memory, n_shards)
+        self.n_workers = n_workers or min(n_shards, os.cpu_count() or 1)
+        if self.n_workers <= 0:
+            raise ValueError(f"n_workers must be positive, got {self.n_workers}")
+        self.timeout = timeout
+        self.use_processes = use_processes
+        self._stats = {"recalls": 0, "shard_timeouts": 0, "shard_failures": 0, "worker_restarts": 0}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        if use_processes:
+            # Shared slot each worker process writes its pid into
+            self._worker_pids: List[Optional[ctypes.c_longlong]] = [None] * self.n_workers
+            self._workers: List[Optional[Executor]] = [
+                self._start_worker(w) for w in range(self.n_workers)
+            ]
+        else:
+            self._workers = [ThreadPoolExecutor(
+                max_workers=self.n_workers, thread_name_prefix="HolographicShard"
+            )]
+
+    def __repr__(self) -> str:
+        return (
+            f"ShardedHolographicMemory(shards={len(self.shards)}, "
+            f"workers={self.n_workers}, processes={self.use_processes})"
+        )
+
+    def __enter__(self) -> 'ShardedHolographicMemory':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _start_worker(self, worker: int) -> ProcessPoolExecutor:
+        placed = self.shards[worker::self.n_workers]
+        self._worker_pids[worker] = multiprocessing.Value("q", 0, lock=False)
+        return ProcessPoolExecutor(
+            max_workers=1,
+            initializer=_init_shard_worker,
+            initargs=(placed, self._worker_pids[worker])
+        )
+
+    def _submit(
+        self, shard: DistributedHolographicShard, cue: np.ndarray
+    ) -> Tuple[Optional[Future], Optional[Executor]]:
+        """Submit one partial recall; returns the future and the executor running it."""
+        if not self.use_processes:
+            return self._workers[0].submit(shard.partial_recall, cue), self._workers[0]
+
+        worker = shard.shard_id % self.n_workers
+        with self._lock:
+            if self._workers[worker] is None:
+                self._workers[worker] = self._start_worker(worker)
+                self._stats["worker_restarts"] += 1
+            executor = self._workers[worker]
+        try:
+            return executor.submit(_worker_partial_recall, shard.shard_id, cue), executor
+        except BrokenProcessPool:
+            self._discard_worker(worker, executor)
+            return None, None
+
+    def _discard_worker(self, worker: int, executor: Executor, terminate: bool = False) -> None:
+        """
+        Drop a crashed (or, with terminate, hung) worker; it is restarted on
+        the next submit. A no-op if the slot already holds a newer worker.
+        """
+        with self._lock:
+            if self._workers[worker] is not executor:
+                return
+            self._workers[worker] = None
+            pid = self._worker_pids[worker].value if terminate else 0
+        executor.shutdown(wait=False, cancel_futures=True)
+        if pid:
+            # Shutdown cannot interrupt a running task: kill the process instead
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except OSError:
+                pass  # already gone
+
+    def recall(self, cue: np.ndarray) -> Tuple[np.ndarray, float]:
+        """
+        Recall from all shards concurrently.
+
+        Missing shards (timeout or worker failure) leave a zero gap in the
+        recalled pattern and emit a UserWarning.
+
+        Args:
+            cue: The retrieval cue (k')
+
+        Returns:
+            Tuple of (recalled_pattern, merged match_strength)
+        """
+        if self._closed:
+            raise RuntimeError("ShardedHolographicMemory is closed")
+        cue = np.asarray(cue, dtype=float)
+        submitted = {s.shard_id: self._submit(s, cue) for s in self.shards}
+        pending = [f for f, _ in submitted.values() if f is not None]
+        wait(pending, timeout=self.timeout)
+
+        shard_size = self.shards[0].shard_size
+        recalled = np.zeros(shard_size * len(self.shards))
+        total_strength = 0.0
+        timed_out, failed = [], []
+
+        for shard_id, (future, executor) in submitted.items():
+            if future is None:
+                failed.append(shard_id)
+                continue
+            if not future.done():
+                timed_out.append(shard_id)
+                # A started task holds its single-slot worker until it
+                # returns, which may be never: restart the worker
+                if self.use_processes and not future.cancel() and not future.done():
+                    self._discard_worker(shard_id % self.n_workers, executor, terminate=True)
+                continue
+            try:
+                partial, strength = future.result()
+            except BrokenProcessPool:
+                failed.append(shard_id)
+                if self.use_processes:
+                    self._discard_worker(shard_id % self.n_workers, executor)
+                continue
+            except Exception:
+                failed.append(shard_id)
+                continue
+            start = shard_id * shard_size
+            recalled[start:start + shard_size] = partial
+            total_strength += strength
+
+        with self._lock:
+            self._stats["recalls"] += 1
+            self._stats["shard_timeouts"] += len(timed_out)
+            self._stats["shard_failures"] += len(failed)
+
+        missing = sorted(timed_out + failed)
+        if missing:
+            warnings.warn(
+                f"Missing shards {set(missing)}: recall has frequency gaps",
+                UserWarning
+            )
+
+        return recalled, total_strength / len(self.shards)
+
+    def get_statistics(self) -> Dict:
+        """Get recall and fault counters."""
+        with self._lock:
+            return dict(
+                self._stats,
+                n_shards=len(self.shards),
+                n_workers=self.n_workers,
+                use_processes=self.use_processes,
+            )
+
+    def close(self) -> None:
+        """Shut down all workers."""
+        with self._lock:
+            self._closed = True
+            workers, self._workers = self._workers, [None] * len(self._workers)
+        for executor in workers:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
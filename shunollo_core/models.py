@@ -5,6 +5,29 @@ from pydantic import BaseModel, Field
 def utc_now():
     return datetime.now(timezone.utc)
 
+# The 18 physics fields of a ShunolloSignal with their expected ranges,
+# in to_vector() order. Shared by the Physics-RAG vector and episodic store.
+PHYSICS_FIELDS: Tuple[Tuple[str, float, float], ...] = (
+    ("energy", 0.0, 10.0),       # 0: Amplitude (0-10 typical)
+    ("entropy", 0.0, 8.0),       # 1: Information Density (0-8 bits)
+    ("frequency", 0.0, 1000.0),  # 2: Rate (Hz, 0-1000 typical)
+    ("roughness", 0.0, 1.0),     # 3: Texture (already 0-1)
+    ("viscosity", 0.0, 1.0),     # 4: Flow Resistance (0-1)
+    ("volatility", 0.0, 1.0),    # 5: Brownian Deviation (0-1)
+    ("action", 0.0, 10.0),       # 6: Lagrangian (0-10)
+    ("hamiltonian", 0.0, 10.0),  # 7: Total Energy (0-10)
+    ("ewr", 0.0, 10.0),          # 8: Entropy-to-Wait Ratio (0-10)
+    ("hue", 0.0, 1.0),           # 9: Color/Spectrum (0-1)
+    ("saturation", 0.0, 1.0),    # 10: Purity (0-1)
+    ("pan", -1.0, 1.0),          # 11: Stereo Field (-1 to 1)
+    ("spatial_x", -1.0, 1.0),    # 12: 3D Space X (-1 to 1)
+    ("spatial_y", -1.0, 1.0),    # 13: 3D Space Y (-1 to 1)
+    ("spatial_z", -1.0, 1.0),    # 14: 3D Space Z (-1 to 1)
+    ("harmony", 0.0, 1.0),       # 15: Consonance (0-1)
+    ("flux", 0.0, 10.0),         # 16: Rate of Change (0-10)
+    ("dissonance", 0.0, 1.0),    # 17: Cross-Modal Conflict (0-1)
+)
+
 # ------------------------------------------------------------------ #
 # Existing models                                                     (unchanged)
 # ------------------------------------------------------------------ #
@@ -61,26 +84,7 @@ class ShunolloSignal(BaseModel):
             18-dimensional physics vector.
         """
         # Raw values with their expected ranges for normalization
-        raw = [
-            (self.energy, 0.0, 10.0),       # 0: Amplitude (0-10 typical)
-            (self.entropy, 0.0, 8.0),       # 1: Information Density (0-8 bits)
-            (self.frequency, 0.0, 1000.0),  # 2: Rate (Hz, 0-1000 typical)
-            (self.roughness, 0.0, 1.0),     # 3: Texture (already 0-1)
-            (self.viscosity, 0.0, 1.0),     # 4: Flow Resistance (0-1)
-            (self.volatility, 0.0, 1.0),    # 5: Brownian Deviation (0-1)
-            (self.action, 0.0, 10.0),       # 6: Lagrangian (0-10)
-            (self.hamiltonian, 0.0, 10.0),  # 7: Total Energy (0-10)
-            (self.ewr, 0.0, 10.0),          # 8: Entropy-to-Wait Ratio (0-10)
-            (self.hue, 0.0, 1.0),           # 9: Color/Spectrum (0-1)
-            (self.saturation, 0.0, 1.0),    # 10: Purity (0-1)
-            (self.pan, -1.0, 1.0),          # 11: Stereo Field (-1 to 1)
-            (self.spatial_x, -1.0, 1.0),    # 12: 3D Space X (-1 to 1)
-            (self.spatial_y, -1.0, 1.0),    # 13: 3D Space Y (-1 to 1)
-            (self.spatial_z, -1.0, 1.0),    # 14: 3D Space Z (-1 to 1)
-            (self.harmony, 0.0, 1.0),       # 15: Consonance (0-1)
-            (self.flux, 0.0, 10.0),         # 16: Rate of Change (0-10)
-            (self.dissonance, 0.0, 1.0),    # 17: Cross-Modal Conflict (0-1)
-        ]
+        raw = [(getattr(self, name), lo, hi) for name, lo, hi in PHYSICS_FIELDS]
         
         if not normalize:
             return [v for v, _, _ in raw]
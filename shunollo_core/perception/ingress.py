@@ -0,0 +1,273 @@
+"""
+Ingress Queue (Thalamic Gate)
+-----------------------------
+Biological Role: The thalamus relays sensory input to the cortex but gates
+it under load; when the cortex is saturated, only salient input gets through.
+An unbounded relay would be a seizure: activity that grows without limit.
+Cybernetic Role: Bounded admission queue with explicit load-shedding policies
+and counters, so operators can size the system from observed drop rates.
+
+Policies when the queue is full:
+    "block":                the producer waits for space (back-pressure)
+    "drop_newest":          the incoming event is rejected
+    "drop_oldest":          the stalest queued event is evicted
+    "drop_lowest_priority": the oldest event of the lowest priority is evicted
+                            (the incoming one is rejected if it ranks lower)
+    "ras":                  Reticular sampling: above high_water, non-salient
+                            events are admitted with probability falling to 0
+                            at capacity; when full, as "drop_lowest_priority"
+
+Priorities are integers; higher is more urgent. Scheduling:
+    "fifo":     items are handed out in arrival order
+    "priority": the most urgent item goes first. With aging, every
+                aging_seconds an item waits is worth one priority level,
+                so background traffic is delayed but never starved.
+"""
+import queue
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+__all__ = [
+    'DEFAULT_PRIORITY',
+    'INGRESS_POLICIES',
+    'MECHANISM_PRIORITY',
+    'SALIENT_MECHANISMS',
+    'SCHEDULING_MODES',
+    'IngressQueue',
+]
+
+INGRESS_POLICIES = ("block", "drop_newest", "drop_oldest", "drop_lowest_priority", "ras")
+SCHEDULING_MODES = ("fifo", "priority")
+
+DEFAULT_PRIORITY = 1
+
+# Minimum priority granted by the RAS mechanism that let a signal through
+MECHANISM_PRIORITY = {
+    "salience_conflict": 3,  # dissonance: the events we alert on
+    "salience_texture": 2,
+}
+
+# RAS mechanisms that always pass the reticular sampler
+SALIENT_MECHANISMS = frozenset(MECHANISM_PRIORITY)
+
+# (sequence, enqueue time, priority, item)
+_Entry = Tuple[int, float, int, Any]
+
+
+class IngressQueue(queue.Queue):
+    """
+    Bounded queue.Queue with per-priority lanes and a load-shedding policy.
+
+    put() keeps the standard queue.Queue semantics (blocking or queue.Full);
+    offer() applies the policy and never raises. get(), task_done() and join()
+    work as usual, so worker pools can drain it like any other queue.
+
+    Attributes:
+        policy: Load-shedding policy (see INGRESS_POLICIES)
+        high_water: Fill fraction above which "ras" starts sampling
+        scheduling: Hand-out order (see SCHEDULING_MODES)
+        aging_seconds: Wait that earns one priority level (None disables aging)
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10000,
+        policy: str = "drop_oldest",
+        high_water: float = 0.5,
+        scheduling: str = "priority",
+        aging_seconds: Optional[float] = 0.5,
+        seed: Optional[int] = None
+    ) -> None:
+        """
+        Args:
+            maxsize: Queue capacity (0 means unbounded; policies never trigger)
+            policy: One of INGRESS_POLICIES
+            high_water: Fill fraction in [0, 1) where RAS sampling begins
+            scheduling: "fifo" or "priority"
+            aging_seconds: Seconds of waiting worth one priority level
+            seed: Seed for the RAS sampler
+
+        Raises:
+            ValueError: If the policy, scheduling or a limit is invalid
+        """
+        if policy not in INGRESS_POLICIES:
+            raise ValueError(f"policy must be one of {INGRESS_POLICIES}, got '{policy}'")
+        if scheduling not in SCHEDULING_MODES:
+            raise ValueError(f"scheduling must be one of {SCHEDULING_MODES}, got '{scheduling}'")
+        if aging_seconds is not None and aging_seconds <= 0:
+            raise ValueError("aging_seconds must be positive (or None)")
+        if not 0.0 <= high_water < 1.0:
+            raise ValueError("high_water must be in [0, 1)")
+        if maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+        self.policy = policy
+        self.high_water = high_water
+        self.scheduling = scheduling
+        self.aging_seconds = aging_seconds
+        self._waits: Dict[int, Deque[float]] = {}  # recent queue wait per priority
+        self._rng = random.Random(seed)
+        self._stats = {
+            "offered": 0, "admitted": 0, "blocked": 0,
+            "dropped_newest": 0, "dropped_oldest": 0,
+            "dropped_lowest_priority": 0, "sampled_out": 0, "max_depth": 0,
+        }
+        super().__init__(maxsize)
+
+    def __repr__(self) -> str:
+        return f"IngressQueue(depth={self.qsize()}, maxsize={self.maxsize}, policy='{self.policy}')"
+
+    # --- queue.Queue storage hooks (called with self.mutex held) ---
+
+    def _init(self, maxsize: int) -> None:
+        self._lanes: Dict[int, Deque[_Entry]] = {}
+        self._size = 0
+        self._seq = 0
+
+    def _qsize(self) -> int:
+        return self._size
+
+    def _put(self, item: Any, priority: int = DEFAULT_PRIORITY) -> None:
+        lane = self._lanes.get(priority)
+        if lane is None:
+            lane = self._lanes[priority] = deque()
+        lane.append((self._seq, time.monotonic(), priority, item))
+        self._seq += 1
+        self._size += 1
+        self._stats["max_depth"] = max(self._stats["max_depth"], self._size)
+
+    def _get(self) -> Any:
+        now = time.monotonic()
+        _, enqueued, priority, item = self._pop(self._next_lane(now))
+        waits = self._waits.get(priority)
+        if waits is None:
+            waits = self._waits[priority] = deque(maxlen=1024)
+        waits.append(now - enqueued)
+        return item
+
+    def _next_lane(self, now: float) -> int:
+        """Lane holding the next item to hand out."""
+        if self.scheduling == "fifo":
+            return min((lane[0][0], p) for p, lane in self._lanes.items())[1]
+        # Each lane's head is its oldest item, so it carries the lane's best
+        # aged priority; ties go to the earlier arrival.
+        best_key, best_lane = None, None
+        for p, lane in self._lanes.items():
+            seq, enqueued = lane[0][0], lane[0][1]
+            urgency = p if self.aging_seconds is None else p + (now - enqueued) / self.aging_seconds
+            key = (urgency, -seq)
+            if best_key is None or key > best_key:
+                best_key, best_lane = key, p
+        return best_lane
+
+    def _pop(self, priority: int) -> _Entry:
+        lane = self._lanes[priority]
+        entry = lane.popleft()
+        if not lane:
+            del self._lanes[priority]
+        self._size -= 1
+        return entry
+
+    # --- Admission ---
+
+    def offer(
+        self,
+        item: Any,
+        priority: int = DEFAULT_PRIORITY,
+        mechanism: Optional[str] = None,
+        timeout: Optional[float] = None
+    ) -> bool:
+        """
+        Admit an item according to the queue's policy.
+
+        Args:
+            item: Event to enqueue
+            priority: Urgency (higher is more urgent)
+            mechanism: RAS mechanism that passed the item (used by "ras")
+            timeout: Longest wait under "block" (None waits forever)
+
+        Returns:
+            True if the item was enqueued
+        """
+        with self.not_full:
+            self._stats["offered"] += 1
+            if self.maxsize > 0:
+                if self.policy == "ras" and not self._ras_admit(mechanism):
+                    self._stats["sampled_out"] += 1
+                    return False
+                if self._size >= self.maxsize and not self._make_room(priority, timeout):
+                    return False
+            self._put(item, priority)
+            self.unfinished_tasks += 1
+            self._stats["admitted"] += 1
+            self.not_empty.notify()
+            return True
+
+    def _ras_admit(self, mechanism: Optional[str]) -> bool:
+        if mechanism in SALIENT_MECHANISMS:
+            return True
+        fill = self._size / self.maxsize
+        if fill < self.high_water:
+            return True
+        return self._rng.random() < (1.0 - fill) / (1.0 - self.high_water)
+
+    def _make_room(self, priority: int, timeout: Optional[float]) -> bool:
+        """Apply the overflow policy to a full queue. Returns False to reject."""
+        if self.policy == "block":
+            self._stats["blocked"] += 1
+            deadline = None if timeout is None else time.monotonic() + timeout
+            while self._size >= self.maxsize:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    self._stats["dropped_newest"] += 1
+                    return False
+                self.not_full.wait(remaining)
+            return True
+        if self.policy == "drop_newest":
+            self._stats["dropped_newest"] += 1
+            return False
+        if self.policy == "drop_oldest":
+            victim = min((lane[0][0], p) for p, lane in self._lanes.items())[1]
+            self._evict(victim, "dropped_oldest")
+            return True
+        # drop_lowest_priority / ras
+        lowest = min(self._lanes)
+        if priority < lowest:
+            self._stats["dropped_lowest_priority"] += 1
+            return False
+        self._evict(lowest, "dropped_lowest_priority")
+        return True
+
+    def _evict(self, priority: int, counter: str) -> None:
+        self._pop(priority)
+        # The evicted item will never be task_done()'d
+        self.unfinished_tasks -= 1
+        self._stats[counter] += 1
+
+    # --- Introspection ---
+
+    def depth_by_priority(self) -> Dict[int, int]:
+        """Queued items per priority level."""
+        with self.mutex:
+            return {p: len(lane) for p, lane in sorted(self._lanes.items())}
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Admission and drop counters, current and peak depth, queue wait (ms) per priority."""
+        with self.mutex:
+            stats = dict(self._stats)
+            stats["depth"] = self._size
+            waits = {p: sorted(w) for p, w in self._waits.items() if w}
+        stats["wait_ms"] = {
+            p: {
+                "mean": 1e3 * sum(w) / len(w),
+                "p99": 1e3 * w[min(len(w) - 1, int(0.99 * len(w)))],
+            }
+            for p, w in sorted(waits.items())
+        }
+        stats["dropped"] = (
+            stats["dropped_newest"] + stats["dropped_oldest"]
+            + stats["dropped_lowest_priority"] + stats["sampled_out"]
+        )
+        stats.update(maxsize=self.maxsize, policy=self.policy, scheduling=self.scheduling)
+        return stats
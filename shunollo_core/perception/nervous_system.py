@@ -6,15 +6,23 @@ Implements an Asynchronous Producer-Consumer pattern to dispatch sensory
 signals to the various Cortexes without blocking the main application.
 
 Architecture:
-- Singleton `NervousSystem` instance.
-- Thread-safe Queue for incoming events.
-- Daemon Worker Thread for processing.
+- Shared engine from `get_nervous_system()`, built on first use so that
+  importing this module starts no threads.
+- Bounded ingress queue (thalamic gate) with a load-shedding policy.
+- Staged pipeline: each pathway (memory, cognition, visual, audio, haptic,
+  vocal) has its own worker pool and bounded inbox, so a slow cortex does
+  not hold up the others.
 - Fault Isolation: Each Cortex call is wrapped in try/except.
+
+Pathways:
+    ingress (_queue) -> cognition -> memory
+                                  -> visual | audio | haptic | vocal
 """
 import threading
-import queue
 import time
-from typing import Dict, Any
+import uuid
+from collections import Counter
+from typing import Dict, Any, List, Optional
 from shunollo_core.models import ShunolloSignal
 
 from shunollo_core.perception.auditory_cortex import synthesize_audio_event, AuditoryCortex
@@ -24,39 +32,105 @@ from shunollo_core.perception.vocal_cords import synthesize_speech_event
 from shunollo_core.cognition.wernickes_area import WernickesArea
 from shunollo_core.cognition.brocas_area import BrocasArea
 from shunollo_core.memory.hippocampus import Hippocampus
+from shunollo_core.perception.ingress import IngressQueue, MECHANISM_PRIORITY
+from shunollo_core.perception.pipeline import PipelineStage
 from shunollo_core.config import config
 
+# Per-stage worker pools. Memory blocks when full (experiences are not lost);
+# the synthesis stages shed load instead of stalling cognition.
+DEFAULT_STAGES = {
+    "cognition": {"workers": 1},
+    "memory": {"workers": 1, "queue_size": 4096, "max_batch": 256, "overflow": "block"},
+    "visual": {"workers": 1, "queue_size": 256, "overflow": "drop"},
+    "audio": {"workers": 1, "queue_size": 256, "overflow": "drop"},
+    "haptic": {"workers": 1, "queue_size": 256, "overflow": "drop"},
+    "vocal": {"workers": 1, "queue_size": 64, "overflow": "drop"},
+}
+
+SYNTHESIS_STAGES = ("visual", "audio", "haptic", "vocal")
+
 class NervousSystemEngine:
-    def __init__(self):
-        self._queue = queue.Queue()
+    def __init__(
+        self,
+        stages: Optional[Dict[str, Dict[str, Any]]] = None,
+        ingress: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            stages: Per-stage overrides of DEFAULT_STAGES, e.g.
+                {"visual": {"workers": 4}}. Defaults to config.nervous_system["stages"].
+            ingress: IngressQueue settings (maxsize, policy, high_water, seed).
+                Defaults to config.nervous_system["ingress"].
+        """
+        # Pathway settings: defaults < config < constructor overrides
+        settings = {name: dict(params) for name, params in DEFAULT_STAGES.items()}
+        if stages is None:
+            stages = config.nervous_system.get("stages", {})
+        for name, params in stages.items():
+            if name not in settings:
+                raise ValueError(f"Unknown NervousSystem stage '{name}', expected one of {tuple(settings)}")
+            settings[name].update(params)
+
+        # Ingress queue (the brainstem -> thalamus relay), drained by cognition
+        if ingress is None:
+            ingress = config.nervous_system.get("ingress", {})
+        self._queue = IngressQueue(**ingress)
+        self._suppressed = Counter()  # RAS rejections by mechanism
+        self._suppressed_lock = threading.Lock()
         self._shutdown = False
         
         # New Biological Organs
         self.auditory = AuditoryCortex()
         self.wernicke = WernickesArea()
         self.broca = BrocasArea(enable_tts=False) # Config driven normally
-        self.hippocampus = Hippocampus()
+        self.hippocampus = Hippocampus(
+            write_behind=config.storage.get("episodic_write_behind", True),
+            durability=config.storage.get("episodic_durability", "flush"),
+            retention_seconds=config.storage.get("retention_seconds"),
+            compact_interval=config.storage.get("compact_interval_seconds")
+        )
+
+        cognition = settings.pop("cognition")
         
-        # Start Worker
-        self._thread = threading.Thread(target=self._worker_loop, daemon=True, name="NervousSystemWorker")
-        self._thread.start()
+        # Start Workers (downstream first so cognition always has somewhere to send)
+        self.stages: Dict[str, PipelineStage] = {}
+        handlers = {
+            "memory": self._memory_stage,
+            "visual": self._visual_stage,
+            "audio": self._audio_stage,
+            "haptic": self._haptic_stage,
+            "vocal": self._vocal_stage,
+        }
+        for name, handler in handlers.items():
+            self.stages[name] = PipelineStage(name, handler, **settings[name])
+        self.stages["cognition"] = PipelineStage(
+            "cognition", self._cognition_stage, inbox=self._queue, **cognition
+        )
         print("[System] [NervousSystem] Online (Async Mode)")
 
-    def dispatch(self, correlation_id: str, sensory_data: Dict[str, Any]):
+    def dispatch(self, correlation_id: str, sensory_data: Dict[str, Any], priority: int = 1) -> bool:
         """
         Non-blocking dispatch of a sensory event.
-        Returns immediately.
+        Returns immediately (unless the ingress policy is "block").
+
+        Returns:
+            False if the ingress policy shed the event
         """
         payload = {
             "id": correlation_id,
             "data": sensory_data
         }
-        self._queue.put(payload)
+        return self._queue.offer(payload, priority=priority)
 
-    def publish_event(self, signal: ShunolloSignal, priority: int = 1):
+    def publish_event(self, signal: ShunolloSignal, priority: int = 1) -> bool:
         """
         Ingests a raw signal, runs it through the Brainstem (RAS),
         and if salient, dispatches it to the Cortex.
+        Salient mechanisms raise the priority (see MECHANISM_PRIORITY), so
+        alerts overtake background traffic in the ingress scheduler.
+
+        Returns:
+            True if the signal was queued for cortical processing
         """
         # 0. Brainstem Filtering (RAS)
         from shunollo_core.subcortex.ras import ras
@@ -65,13 +139,14 @@ class NervousSystemEngine:
         if not arousal:
             # Signal ignored by reticular formation
             # We don't log this to INFO to avoid spam, maybe DEBUG
-            return
+            with self._suppressed_lock:
+                self._suppressed[mechanism] += 1
+            return False
 
-        # 1. Enqueue for Cortical Processing
-        try:
-            self._queue.put(signal, block=False)
-        except Exception:
-            pass # Drop if brain is full (seizure prevention)
+        # 1. Enqueue for Cortical Processing (salience sets the floor on urgency)
+        priority = max(priority, MECHANISM_PRIORITY.get(mechanism, priority))
+        # A full brain sheds load per the ingress policy (seizure prevention)
+        return self._queue.offer(signal, priority=priority, mechanism=mechanism)
 
     def trigger_dream_cycle(self, duration_seconds: int = 5):
         """
@@ -91,122 +166,175 @@ class NervousSystemEngine:
             # OR we rename publish_event.
             # publish_event runs RAS. We probably want RAS to filter dreams too (Nightmares vs boring dreams).
             self.publish_event(dream)
-            
-    def _worker_loop(self):
-        while not self._shutdown:
-            try:
-                item = self._queue.get()
-                # The original _process_event expects 'id' and 'data' from a dict.
-                # If publish_event puts a ShunolloSignal directly, this needs adaptation.
-                # For now, assuming item is still a dict or can be adapted.
-                if isinstance(item, dict):
-                    self._process_event(item["id"], item["data"])
-                elif isinstance(item, ShunolloSignal):
-                    # --- MEMORY CONSOLIDATION ---
-                    # Only remember "Real" experiences, not dreams
-                    is_dream = item.metadata.get("is_dream", False)
-                    if not is_dream:
-                        try:
-                            self.hippocampus.remember(item)
-                        except Exception:
-                            pass # Don't crash on memory failure
-
-                    # Adapt ShunolloSignal to legacy sensory format
-                    import uuid
-                    cid = item.metadata.get("correlation_id", str(uuid.uuid4()))
-                    
-                    # --- PERCEPTUAL PRE-PROCESSING ---
-                    # 1. Isomorphic Translation (Physics -> Sensory)
-                    # We need this EARLY to feed the Visual Cortex
-                    sensory_payload = {
-                        "light": {
-                            "hue": item.hue,
-                            "brightness": int(item.energy * 255),
-                            "saturation": item.saturation
-                        },
-                        "position": {
-                            "x": (item.spatial_x + 1.0) / 2.0, 
-                            "y": (item.spatial_y + 1.0) / 2.0 
-                        }
-                    }
-                    
-                    # 2. visual Feedback Loop (Seeing)
-                    visual_features = analyze_scene(sensory_payload)
-                    item.metadata["visual_analysis"] = visual_features
-                    
-                    # --- COGNITIVE LOOP (Thinking) ---
-                    # 3. Wernicke's Area (Narrative)
-                    try:
-                        narrative = self.wernicke.narrate(item)
-                        # 4. Broca's Area (Expression)
-                        urgency = item.energy * item.roughness
-                        # If we see danger (Red), boost urgency
-                        if visual_features.get("semantic_color") == "danger":
-                            urgency = max(urgency, 0.8)
-                            
-                        self.broca.express(narrative, urgency=urgency)
-                    except Exception as e:
-                        print(f"[Warning] [Cognition] Error: {e}")
-
-                    # --- LEGACY OUTPUT LOOP ---
-                    # Check for pre-calculated auditory params
-                    aud_meta = item.metadata.get("auditory", {})
-                    
-                    # Complete the sensory payload for legacy synthesizers
-                    sensory_payload["sound"] = {
-                        "pitch": aud_meta.get("pitch_base", item.frequency),
-                        "timbre": aud_meta.get("timbre", "sine"),
-                        "volume": item.energy,
-                        "fm_mod": aud_meta.get("fm_mod", 0.0)
-                    }
-                    sensory_payload["raw_signal"] = item.dict()
-                    sensory_payload.update(item.metadata)
-                    
-                    self._process_event(cid, sensory_payload)
-                self._queue.task_done()
-            except Exception as e:
-                print(f"[Error] [NervousSystem] Worker Error: {e}")
-
-    def _process_event(self, event_id: str, sensory_data: Dict[str, Any]):
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
         """
-        Orchestrates the firing of all enabled cortexes.
-        Fault Isolation: A crash in one does not stop the others.
+        Wait until every queued event has passed through all pathways.
+
+        Returns:
+            True if the pipeline went idle within the timeout
         """
-        # 1. Auditory Cortex
-        try:
-            if config.perception_matrix.get("enabled", True): # Check global switch
-                synthesize_audio_event(event_id, sensory_data, correlation_id=event_id)
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).debug(f"[Auditory] Cortex dispatch failed: {e}")
-            print(f"[Warning] [Auditory] Error: {e}")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Cognition feeds the others, so it must settle first
+        order = ["cognition", "memory", *SYNTHESIS_STAGES]
+        return all(self.stages[name].join(deadline) for name in order)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Finish queued work, stop every worker pool and flush memory."""
+        if self._shutdown:
+            return
+        self._shutdown = True
+        # Stop sentinels are scheduled like ordinary traffic; settle the
+        # ingress first so low-priority events are not stranded behind them.
+        self.drain(timeout)
+        self.stages["cognition"].stop(timeout)
+        for name in ("memory", *SYNTHESIS_STAGES):
+            self.stages[name].stop(timeout)
+        self.hippocampus.close()
+
+    def get_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Ingress admission/drop counters (plus RAS suppressions by mechanism)
+        and per-stage worker count, inbox depth and processed/failed/dropped counters.
+        """
+        ingress = self._queue.get_statistics()
+        with self._suppressed_lock:
+            ingress["ras_suppressed"] = dict(self._suppressed)
+        stats = {"ingress": ingress}
+        stats.update((name, stage.get_statistics()) for name, stage in self.stages.items())
+        return stats
+
+    # --- Pathways ---
 
-        # 2. Visual Cortex
+    def _cognition_stage(self, items: List[Any]):
+        for item in items:
+            # dispatch() enqueues legacy {'id', 'data'} dicts; publish_event enqueues signals
+            if isinstance(item, dict):
+                self._fan_out(item["id"], item["data"])
+            elif isinstance(item, ShunolloSignal):
+                self._perceive(item)
+
+    def _perceive(self, item: ShunolloSignal):
+        # --- MEMORY CONSOLIDATION ---
+        # Only remember "Real" experiences, not dreams.
+        # The memory pathway gets its own metadata dict: cognition annotates this one.
+        is_dream = item.metadata.get("is_dream", False)
+        if not is_dream:
+            self.stages["memory"].put(item.model_copy(update={"metadata": dict(item.metadata)}))
+
+        # Adapt ShunolloSignal to legacy sensory format
+        cid = item.metadata.get("correlation_id", str(uuid.uuid4()))
+        
+        # --- PERCEPTUAL PRE-PROCESSING ---
+        # 1. Isomorphic Translation (Physics -> Sensory)
+        # We need this EARLY to feed the Visual Cortex
+        sensory_payload = {
+            "light": {
+                "hue": item.hue,
+                "brightness": int(item.energy * 255),
+                "saturation": item.saturation
+            },
+            "position": {
+                "x": (item.spatial_x + 1.0) / 2.0, 
+                "y": (item.spatial_y + 1.0) / 2.0 
+            }
+        }
+        
+        # 2. visual Feedback Loop (Seeing)
+        visual_features = analyze_scene(sensory_payload)
+        item.metadata["visual_analysis"] = visual_features
+        
+        # --- COGNITIVE LOOP (Thinking) ---
+        # 3. Wernicke's Area (Narrative)
         try:
-            synthesize_visual_event(sensory_data, correlation_id=event_id)
+            narrative = self.wernicke.narrate(item)
+            # 4. Broca's Area (Expression)
+            urgency = item.energy * item.roughness
+            # If we see danger (Red), boost urgency
+            if visual_features.get("semantic_color") == "danger":
+                urgency = max(urgency, 0.8)
+                
+            self.broca.express(narrative, urgency=urgency)
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).debug(f"[Visual] Cortex dispatch failed: {e}")
-            print(f"[Warning] [Visual] Error: {e}")
+            print(f"[Warning] [Cognition] Error: {e}")
+
+        # --- LEGACY OUTPUT LOOP ---
+        # Check for pre-calculated auditory params
+        aud_meta = item.metadata.get("auditory", {})
+        
+        # Complete the sensory payload for legacy synthesizers
+        sensory_payload["sound"] = {
+            "pitch": aud_meta.get("pitch_base", item.frequency),
+            "timbre": aud_meta.get("timbre", "sine"),
+            "volume": item.energy,
+            "fm_mod": aud_meta.get("fm_mod", 0.0)
+        }
+        sensory_payload["raw_signal"] = item.model_dump()
+        sensory_payload.update(item.metadata)
+        
+        self._fan_out(cid, sensory_payload)
+
+    def _fan_out(self, event_id: str, sensory_data: Dict[str, Any]):
+        """Hand an event to every synthesis pathway that applies to it."""
+        event = (event_id, sensory_data)
+        if config.perception_matrix.get("enabled", True): # Check global switch
+            self.stages["audio"].put(event)
+        self.stages["visual"].put(event)
+        if "haptic" in sensory_data:
+            self.stages["haptic"].put(event)
+        if "text" in sensory_data:
+            self.stages["vocal"].put(event)
 
-        # 3. Haptic Driver
+    def _memory_stage(self, signals: List[ShunolloSignal]):
         try:
-            if "haptic" in sensory_data:
-                synthesize_haptic_event(sensory_data, correlation_id=event_id)
-        except Exception as e:
-            import logging
-            logging.getLogger(__name__).debug(f"[Haptic] Cortex dispatch failed: {e}")
-            print(f"[Warning] [Haptic] Error: {e}")
+            self.hippocampus.remember_batch(signals)
+        except Exception:
+            pass # Don't crash on memory failure
+
+    def _audio_stage(self, events: List[Any]):
+        for event_id, sensory_data in events:
+            self._fire("Auditory", synthesize_audio_event, event_id, event_id, sensory_data)
+
+    def _visual_stage(self, events: List[Any]):
+        for event_id, sensory_data in events:
+            self._fire("Visual", synthesize_visual_event, event_id, sensory_data)
+
+    def _haptic_stage(self, events: List[Any]):
+        for event_id, sensory_data in events:
+            self._fire("Haptic", synthesize_haptic_event, event_id, sensory_data)
 
-        # 4. Vocal Cords
+    def _vocal_stage(self, events: List[Any]):
+        for event_id, sensory_data in events:
+            self._fire("Vocal", synthesize_speech_event, event_id, sensory_data)
+
+    @staticmethod
+    def _fire(cortex: str, synthesize, event_id: str, *args):
+        # Fault Isolation: A crash in one event does not stop the pathway
         try:
-            if "text" in sensory_data:
-                # Check config specifically for TTS if needed, but module handles it
-                synthesize_speech_event(sensory_data, correlation_id=event_id)
+            synthesize(*args, correlation_id=event_id)
         except Exception as e:
             import logging
-            logging.getLogger(__name__).debug(f"[Vocal] Cortex dispatch failed: {e}")
-            print(f"[Warning] [Vocal] Error: {e}")
+            logging.getLogger(__name__).debug(f"[{cortex}] Cortex dispatch failed: {e}")
+            print(f"[Warning] [{cortex}] Error: {e}")
+
+_nervous_system: Optional[NervousSystemEngine] = None
+_nervous_system_lock = threading.Lock()
+
+
+def get_nervous_system() -> NervousSystemEngine:
+    """
+    Shared NervousSystemEngine, created (with its worker, journal and
+    compactor threads) on the first call.
+    """
+    global _nervous_system
+    with _nervous_system_lock:
+        if _nervous_system is None:
+            _nervous_system = NervousSystemEngine()
+        return _nervous_system
+
 
-# Singleton Instance
-NervousSystem = NervousSystemEngine()
+def __getattr__(name: str) -> Any:
+    # Legacy singleton name, resolved lazily
+    if name == "NervousSystem":
+        return get_nervous_system()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
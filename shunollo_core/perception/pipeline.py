@@ -0,0 +1,187 @@
+"""
+Staged Perception Pipeline (Parallel Cortical Pathways)
+-------------------------------------------------------
+Biological Role: Sensory streams are processed in parallel pathways
+(dorsal/ventral visual streams, auditory belt, somatosensory strip). A slow
+pathway does not stall the others; each has its own pool of neurons.
+Cybernetic Role: Staged event-driven architecture. Each stage owns a bounded
+inbox and a pool of worker threads; stages hand work to each other through
+their inboxes.
+
+Overflow policies for a full inbox:
+    "block": the producer waits (back-pressure, nothing is lost)
+    "drop":  the item is discarded and counted (the stage sheds load)
+"""
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+__all__ = ['OVERFLOW_POLICIES', 'PipelineStage', 'wait_idle']
+
+logger = logging.getLogger(__name__)
+
+OVERFLOW_POLICIES = ("block", "drop")
+
+_STOP = object()  # worker shutdown sentinel
+
+
+def wait_idle(inbox: "queue.Queue", deadline: Optional[float] = None) -> bool:
+    """
+    Wait until every item put on a queue has been marked done.
+
+    Args:
+        inbox: Queue whose task_done() accounting is waited on
+        deadline: time.monotonic() deadline (None waits forever)
+
+    Returns:
+        True if the queue went idle before the deadline
+    """
+    with inbox.all_tasks_done:
+        while inbox.unfinished_tasks:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            inbox.all_tasks_done.wait(remaining)
+    return True
+
+
+class PipelineStage:
+    """
+    A bounded inbox drained by a pool of worker threads.
+
+    The handler receives a list of up to max_batch items; a worker takes one
+    item (blocking) and then whatever else is already waiting. Handler
+    exceptions are counted and logged, never propagated (fault isolation).
+
+    Attributes:
+        name: Stage name (also prefixes the worker thread names)
+        workers: Number of worker threads
+        max_batch: Items handed to the handler per call
+        overflow: Policy when the inbox is full ("block" or "drop")
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[List[Any]], None],
+        workers: int = 1,
+        queue_size: int = 1024,
+        max_batch: int = 1,
+        overflow: str = "block",
+        inbox: Optional["queue.Queue"] = None
+    ) -> None:
+        """
+        Args:
+            name: Stage name
+            handler: Called from a worker thread with each batch of items
+            workers: Worker thread count
+            queue_size: Inbox bound (ignored when inbox is given)
+            max_batch: Maximum items per handler call
+            overflow: "block" or "drop" when the inbox is full
+            inbox: Existing queue to drain instead of creating one
+
+        Raises:
+            ValueError: If a limit is not positive or overflow is unknown
+        """
+        if workers <= 0 or queue_size <= 0 or max_batch <= 0:
+            raise ValueError("workers, queue_size and max_batch must be positive")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {OVERFLOW_POLICIES}, got '{overflow}'")
+        self.name = name
+        self.workers = workers
+        self.max_batch = max_batch
+        self.overflow = overflow
+        self.inbox = inbox if inbox is not None else queue.Queue(maxsize=queue_size)
+        self._handler = handler
+        self._lock = threading.Lock()
+        self._stats = {"processed": 0, "failed": 0, "dropped": 0, "busy_seconds": 0.0}
+        self._threads = [
+            threading.Thread(target=self._run, daemon=True, name=f"NervousSystem-{name}-{i}")
+            for i in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def __repr__(self) -> str:
+        return f"PipelineStage('{self.name}', workers={self.workers}, depth={self.depth})"
+
+    @property
+    def depth(self) -> int:
+        """Items waiting in the inbox."""
+        return self.inbox.qsize()
+
+    def put(self, item: Any) -> bool:
+        """
+        Hand an item to this stage according to its overflow policy.
+
+        Returns:
+            False if the item was dropped
+        """
+        if self.overflow == "block":
+            self.inbox.put(item)
+            return True
+        try:
+            self.inbox.put_nowait(item)
+            return True
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+            logger.debug(f"[Pipeline] Stage '{self.name}' full, dropped an item")
+            return False
+
+    def _run(self) -> None:
+        while True:
+            item = self.inbox.get()
+            if item is _STOP:
+                self.inbox.task_done()
+                return
+            batch = [item]
+            stop = False
+            while len(batch) < self.max_batch:
+                try:
+                    extra = self.inbox.get_nowait()
+                except queue.Empty:
+                    break
+                if extra is _STOP:
+                    self.inbox.task_done()
+                    stop = True
+                    break
+                batch.append(extra)
+
+            start = time.perf_counter()
+            try:
+                self._handler(batch)
+                failed = False
+            except Exception as e:
+                failed = True
+                logger.warning(f"[Pipeline] Stage '{self.name}' failed on {len(batch)} items: {e}")
+            elapsed = time.perf_counter() - start
+
+            with self._lock:
+                self._stats["failed" if failed else "processed"] += len(batch)
+                self._stats["busy_seconds"] += elapsed
+            for _ in batch:
+                self.inbox.task_done()
+            if stop:
+                return
+
+    def join(self, deadline: Optional[float] = None) -> bool:
+        """Wait until the inbox is empty and every taken item is handled."""
+        return wait_idle(self.inbox, deadline)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Finish the queued work, then stop the worker threads."""
+        for _ in self._threads:
+            self.inbox.put(_STOP)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Worker count, inbox depth and processed/failed/dropped counters."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats.update(workers=self.workers, depth=self.depth)
+        return stats
@@ -0,0 +1,30 @@
+"""
+file_lock.py - The Synaptic Cleft Lock (Cross-Process Exclusion)
+----------------------------------------------------------------
+Biological Role: Refractory period. While one writer holds the channel,
+                 no other process may fire into it.
+Technical Role:  Cross-platform exclusive advisory lock on an open file
+                 (fcntl.flock on Unix, msvcrt.locking on Windows).
+"""
+import os
+from typing import IO
+
+if os.name == 'nt':  # Windows
+    import msvcrt
+
+    def lock_file(f: IO) -> None:
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+    def unlock_file(f: IO) -> None:
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass  # Already unlocked
+else:  # Unix/Linux/Mac
+    import fcntl
+
+    def lock_file(f: IO) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+    def unlock_file(f: IO) -> None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,46 @@
+"""
+precision.py - The Myelin Policy (Numeric Precision)
+----------------------------------------------------
+Biological Role: Myelination trades signal fidelity for conduction speed.
+Technical Role:  Global floating-point policy for the numeric hot paths
+                 (HolographicMemory, Autoencoder, LinearAssociativeMemory).
+
+The policy is read from ConfigManager (``precision.dtype``):
+    "float64" (default): float64 / complex128 everywhere.
+    "float32": float32 / complex64, halving memory bandwidth for large
+               holograms and reservoirs at ~1e-7 relative precision.
+"""
+from typing import Optional, Union
+import numpy as np
+
+from shunollo_core.config import config
+
+DTypeLike = Union[str, type, np.dtype]
+
+_COMPLEX_FOR = {
+    np.dtype(np.float32): np.dtype(np.complex64),
+    np.dtype(np.float64): np.dtype(np.complex128),
+}
+
+
+def float_dtype(dtype: Optional[DTypeLike] = None) -> np.dtype:
+    """
+    Resolve the real dtype for a component.
+    
+    Args:
+        dtype: Explicit override; None falls back to config.precision["dtype"]
+    
+    Raises:
+        ValueError: If the dtype is not float32 or float64
+    """
+    if dtype is None:
+        dtype = config.precision.get("dtype", "float64")
+    resolved = np.dtype(dtype)
+    if resolved not in _COMPLEX_FOR:
+        raise ValueError(f"precision dtype must be float32 or float64, got {resolved}")
+    return resolved
+
+
+def complex_dtype(dtype: Optional[DTypeLike] = None) -> np.dtype:
+    """Complex dtype paired with float_dtype(dtype) (complex64 / complex128)."""
+    return _COMPLEX_FOR[float_dtype(dtype)]
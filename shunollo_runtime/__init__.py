@@ -1,12 +1,44 @@
 # Shunollo Runtime: The Nervous System
-from .interfaces import AbstractThalamus, ThalamusMiddleware
+from .codecs import BinaryCodec, Codec, JsonCodec, SomaticCodec, decode_message, get_codec, register_codec
+from .interfaces import DELIVERY_KEY, AbstractThalamus, AsyncThalamus, AsyncThalamusMiddleware, ThalamusMiddleware
 from .thalamus import RedisThalamus, get_thalamus
+from .async_thalamus import (
+    AsyncRedisThalamus,
+    AsyncThalamusAdapter,
+    SyncThalamusAdapter,
+    as_async_thalamus,
+    get_async_thalamus,
+)
+from .local_thalamus import InMemoryThalamus, SharedMemoryThalamus
+from .stream_thalamus import DEAD_LETTER_SUFFIX, RedisStreamThalamus
 from .agents import BaseAgent
+from .supervisor import AgentPool, AgentSupervisor
 
 __all__ = [
     "AbstractThalamus",
+    "AsyncThalamus",
+    "AsyncThalamusMiddleware",
     "ThalamusMiddleware",
     "RedisThalamus",
     "get_thalamus",
+    "AsyncRedisThalamus",
+    "AsyncThalamusAdapter",
+    "SyncThalamusAdapter",
+    "as_async_thalamus",
+    "get_async_thalamus",
+    "InMemoryThalamus",
+    "SharedMemoryThalamus",
+    "RedisStreamThalamus",
+    "DEAD_LETTER_SUFFIX",
+    "DELIVERY_KEY",
     "BaseAgent",
+    "AgentPool",
+    "AgentSupervisor",
+    "Codec",
+    "JsonCodec",
+    "BinaryCodec",
+    "SomaticCodec",
+    "decode_message",
+    "get_codec",
+    "register_codec",
 ]
@@ -6,13 +6,23 @@ Biological role: The Neuron / The Cell.
                  It has internal state (Memory), perceives stimuli, and fires signals via Thalamus.
 
 This agent connects to the Synaptic Bus (Thalamus) for communication.
+run() handles one stimulus (or one micro-batch) at a time; run_async() keeps
+up to `concurrency` stimuli in flight on an asyncio loop. Either Thalamus contract works with
+either loop (the other side is adapted).
+
+Stimuli are acknowledged once their results are published (or their analysis
+failed), so on an acknowledged bus a replica that dies mid-stimulus has it
+redelivered to another replica.
 """
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Union
+import asyncio
+import threading
 import time
 
-from ..interfaces import AbstractThalamus
+from ..interfaces import AbstractThalamus, AsyncThalamus
 
 
 class BaseAgent(ABC):
@@ -25,7 +35,7 @@ class BaseAgent(ABC):
         self,
         name: str,
         role: str,
-        thalamus: Optional[AbstractThalamus] = None,
+        thalamus: Optional[Union[AbstractThalamus, AsyncThalamus]] = None,
         input_channel: str = "stimuli",
         output_channel: str = "qualia",
     ):
@@ -38,6 +48,12 @@ class BaseAgent(ABC):
         # Internal state
         self.memory: List[Dict[str, Any]] = []
         self._running = False
+        self._sync_adapter = None
+        
+        # Health counters (read by get_statistics, e.g. from a supervisor thread)
+        self._stats_lock = threading.Lock()
+        self._stats = {"processed": 0, "failed": 0, "volleys": 0, "busy_seconds": 0.0}
+        self._latencies: Deque[float] = deque(maxlen=1024)  # seconds per stimulus
         
         # Synesthesia: Rhythm Memory (Core Platform Feature)
         self.beat_tracker: List[float] = []
@@ -53,6 +69,20 @@ class BaseAgent(ABC):
         """
         pass
 
+    def analyze_batch(self, stimuli: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Process a micro-batch, returning one result per stimulus.
+        Defaults to analyze() per stimulus; override to vectorize.
+        """
+        return [self.analyze(stimulus) for stimulus in stimuli]
+
+    async def analyze_async(self, stimulus: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Awaitable analysis used by run_async().
+        Defaults to analyze(); override when analysis awaits I/O.
+        """
+        return self.analyze(stimulus)
+
     # ------------------------------------------------------------------ #
     # Rhythm Analysis (Universal Heartbeat)
     # ------------------------------------------------------------------ #
@@ -89,31 +119,89 @@ class BaseAgent(ABC):
     # ------------------------------------------------------------------ #
     # Thalamus I/O (Distributed Communication)
     # ------------------------------------------------------------------ #
+    def _blocking_thalamus(self) -> Optional[AbstractThalamus]:
+        """The Thalamus through the blocking contract (adapting an AsyncThalamus)."""
+        if isinstance(self.thalamus, AsyncThalamus):
+            if self._sync_adapter is None or self._sync_adapter.thalamus is not self.thalamus:
+                from ..async_thalamus import SyncThalamusAdapter
+                self._sync_adapter = SyncThalamusAdapter(self.thalamus)
+            return self._sync_adapter
+        return self.thalamus
+
+    def _async_thalamus(self) -> Optional[AsyncThalamus]:
+        """The Thalamus through the async contract (adapting a blocking one)."""
+        if not self.thalamus:
+            return None
+        from ..async_thalamus import as_async_thalamus
+        return as_async_thalamus(self.thalamus)
+
     def publish_result(self, result: Dict[str, Any]) -> bool:
         """Publish a result (Qualia) to the output channel."""
         if not self.thalamus:
             return False
         result["_agent"] = self.name
         result["_timestamp"] = time.time()
-        return self.thalamus.publish_stimulus(self.output_channel, result)
+        return self._blocking_thalamus().publish_stimulus(self.output_channel, result)
 
     def consume_stimulus(self, timeout: int = 1) -> Optional[Dict[str, Any]]:
         """Consume a stimulus from the input channel."""
         if not self.thalamus:
             return None
-        return self.thalamus.consume_stimulus(self.input_channel, timeout=timeout)
+        return self._blocking_thalamus().consume_stimulus(self.input_channel, timeout=timeout)
+
+    def publish_results(self, results: List[Dict[str, Any]]) -> int:
+        """Publish several results (Qualia) in one volley. Returns how many were accepted."""
+        if not self.thalamus or not results:
+            return 0
+        now = time.time()
+        for result in results:
+            result["_agent"] = self.name
+            result["_timestamp"] = now
+        return self._blocking_thalamus().publish_many(self.output_channel, results)
+
+    def consume_stimuli(self, max_items: int, timeout: int = 1) -> List[Dict[str, Any]]:
+        """Consume up to max_items stimuli from the input channel in one volley."""
+        if not self.thalamus:
+            return []
+        return self._blocking_thalamus().consume_many(self.input_channel, max_items=max_items, timeout=timeout)
+
+    def acknowledge_stimuli(self, stimuli: List[Dict[str, Any]]) -> int:
+        """Confirm handled stimuli on the input channel (a no-op on buses without acknowledgement)."""
+        if not self.thalamus or not stimuli:
+            return 0
+        return self._blocking_thalamus().acknowledge(self.input_channel, stimuli)
+
+    async def publish_result_async(self, result: Dict[str, Any], thalamus: Optional[AsyncThalamus] = None) -> bool:
+        """Publish a result (Qualia) to the output channel without blocking the loop."""
+        thalamus = thalamus or self._async_thalamus()
+        if not thalamus:
+            return False
+        result["_agent"] = self.name
+        result["_timestamp"] = time.time()
+        return await thalamus.publish_stimulus(self.output_channel, result)
+
+    async def consume_stimulus_async(self, timeout: int = 1, thalamus: Optional[AsyncThalamus] = None) -> Optional[Dict[str, Any]]:
+        """Await a stimulus from the input channel without blocking the loop."""
+        thalamus = thalamus or self._async_thalamus()
+        if not thalamus:
+            return None
+        return await thalamus.consume_stimulus(self.input_channel, timeout=timeout)
 
     # ------------------------------------------------------------------ #
     # The Main Loop (The Heartbeat)
     # ------------------------------------------------------------------ #
-    def run(self, max_iterations: Optional[int] = None) -> None:
+    def run(self, max_iterations: Optional[int] = None, batch_size: int = 1) -> None:
         """
         The main agent loop. Consumes stimuli, processes them, and publishes results.
         
         Args:
             max_iterations: If set, run for this many iterations then stop.
                             If None, run indefinitely until stop() is called.
+            batch_size: Stimuli per iteration. Above 1, each iteration is one
+                        consume_many / analyze_batch / publish_many volley.
         """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
         self._running = True
         iteration = 0
         
@@ -122,23 +210,144 @@ class BaseAgent(ABC):
         while self._running:
             if max_iterations is not None and iteration >= max_iterations:
                 break
-                
-            stimulus = self.consume_stimulus(timeout=1)
-            if stimulus:
+            
+            if batch_size > 1:
+                stimuli = self.consume_stimuli(batch_size, timeout=1)
+                if stimuli:
+                    start = time.perf_counter()
+                    results = self._analyze_volley(stimuli)
+                    if self.publish_results(results) == len(results):
+                        self.acknowledge_stimuli(stimuli)
+                    self._record(len(results), len(stimuli) - len(results), time.perf_counter() - start)
+            else:
+                stimulus = self.consume_stimulus(timeout=1)
+                if stimulus:
+                    start = time.perf_counter()
+                    failed = 0
+                    try:
+                        result = self.analyze(stimulus)
+                        published = self.publish_result(result)
+                    except Exception as e:
+                        print(f"[{self.name}] Error processing stimulus: {e}")
+                        published = True  # handled: retrying would fail the same way
+                        failed = 1
+                    if published:
+                        self.acknowledge_stimuli([stimulus])
+                    self._record(1 - failed, failed, time.perf_counter() - start)
+            
+            iteration += 1
+        
+        print(f"[{self.name}] Agent stopped after {iteration} iterations.")
+
+    def _analyze_volley(self, stimuli: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """analyze_batch with per-stimulus fault isolation if the batch fails."""
+        try:
+            return self.analyze_batch(stimuli)
+        except Exception:
+            results = []
+            for stimulus in stimuli:
                 try:
-                    result = self.analyze(stimulus)
-                    self.publish_result(result)
+                    results.append(self.analyze(stimulus))
                 except Exception as e:
                     print(f"[{self.name}] Error processing stimulus: {e}")
+            return results
+
+    async def run_async(self, max_iterations: Optional[int] = None, concurrency: int = 64, batch_size: int = 1) -> None:
+        """
+        The asyncio agent loop. Keeps consuming while earlier stimuli are
+        still being analyzed, with at most `concurrency` in flight.
+        
+        Args:
+            max_iterations: If set, stop after this many consume attempts
+                            (in-flight stimuli are finished first).
+                            If None, run indefinitely until stop() is called.
+            concurrency: Maximum stimuli being analyzed/published at once.
+            batch_size: Stimuli taken per consume round trip (consume_many).
+        """
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self._running = True
+        iteration = 0
+        thalamus = self._async_thalamus()
+        in_flight = asyncio.Semaphore(concurrency)
+        tasks = set()
+        
+        print(f"[{self.name}] Async agent starting on channels: {self.input_channel} -> {self.output_channel}")
+        
+        while self._running:
+            if max_iterations is not None and iteration >= max_iterations:
+                break
+            
+            # Wait for a free slot before taking more work off the bus
+            await in_flight.acquire()
+            in_flight.release()
+            if batch_size > 1 and thalamus:
+                stimuli = await thalamus.consume_many(self.input_channel, max_items=batch_size, timeout=1)
+            else:
+                stimulus = await self.consume_stimulus_async(timeout=1, thalamus=thalamus)
+                stimuli = [stimulus] if stimulus else []
+            for stimulus in stimuli:
+                await in_flight.acquire()
+                task = asyncio.create_task(self._process_async(stimulus, thalamus, in_flight))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
             
             iteration += 1
         
-        print(f"[{self.name}] Agent stopped after {iteration} iterations.")
+        if tasks:
+            await asyncio.gather(*tasks)
+        print(f"[{self.name}] Async agent stopped after {iteration} iterations.")
+
+    async def _process_async(self, stimulus: Dict[str, Any], thalamus: Optional[AsyncThalamus], in_flight: asyncio.Semaphore) -> None:
+        start = time.perf_counter()
+        failed = 0
+        try:
+            try:
+                result = await self.analyze_async(stimulus)
+                published = await self.publish_result_async(result, thalamus=thalamus)
+            except Exception as e:
+                print(f"[{self.name}] Error processing stimulus: {e}")
+                published = True  # handled: retrying would fail the same way
+                failed = 1
+            self._record(1 - failed, failed, time.perf_counter() - start)
+            if published and thalamus:
+                await thalamus.acknowledge(self.input_channel, [stimulus])
+        except Exception as e:
+            print(f"[{self.name}] Error acknowledging stimulus: {e}")
+        finally:
+            in_flight.release()
 
     def stop(self) -> None:
         """Signal the agent to stop its run loop."""
         self._running = False
 
+    # ------------------------------------------------------------------ #
+    # Health Reporting
+    # ------------------------------------------------------------------ #
+    def _record(self, handled: int, failed: int, seconds: float) -> None:
+        """Account for one volley: stimuli handled, failures, and wall time."""
+        with self._stats_lock:
+            self._stats["processed"] += handled
+            self._stats["failed"] += failed
+            self._stats["volleys"] += 1
+            self._stats["busy_seconds"] += seconds
+            if handled + failed:
+                self._latencies.append(seconds / (handled + failed))
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Counters since start, per-stimulus handling latency (ms) and the snapshot time."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+            latencies = sorted(self._latencies)
+        stats["latency_ms"] = {
+            "mean": 1e3 * sum(latencies) / len(latencies) if latencies else 0.0,
+            "p99": 1e3 * latencies[min(len(latencies) - 1, int(0.99 * len(latencies)))] if latencies else 0.0,
+        }
+        stats.update(name=self.name, input_channel=self.input_channel, timestamp=time.time())
+        return stats
+
     # ------------------------------------------------------------------ #
     # Lifecycle Hooks
     # ------------------------------------------------------------------ #
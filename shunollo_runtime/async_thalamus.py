@@ -0,0 +1,301 @@
+"""
+AsyncRedisThalamus - asyncio Reference Implementation
+-----------------------------------------------------
+The Thalamus on redis.asyncio, so one agent process can keep many stimuli in
+flight instead of blocking on one brpop at a time.
+
+Adapters bridge the two contracts:
+    AsyncThalamusAdapter: any AbstractThalamus used from async code
+                          (blocking calls run in worker threads)
+    SyncThalamusAdapter:  any AsyncThalamus used through the AbstractThalamus
+                          contract (calls run on a private event loop thread)
+"""
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, List, Optional, Union
+
+from .codecs import Codec
+from .interfaces import AbstractThalamus, AsyncThalamus
+from .interfaces.thalamus import AnyMiddleware
+from .thalamus import PUBLISH_CHUNK
+
+
+class AsyncRedisThalamus(AsyncThalamus):
+    """redis.asyncio-backed implementation of the Thalamus."""
+
+    def __init__(
+        self,
+        host: str = None,
+        port: int = None,
+        db: int = 0,
+        middleware: List[AnyMiddleware] = None,
+        codec: Union[str, Codec] = None
+    ):
+        super().__init__(middleware=middleware, codec=codec)
+        # Defer import to prevent hard dependency if not using Redis
+        import redis.asyncio
+
+        self.host = host or os.getenv("SHUNOLLO_REDIS_HOST") or os.getenv("REDIS_HOST", "localhost")
+        self.port = int(port or os.getenv("SHUNOLLO_REDIS_PORT") or os.getenv("REDIS_PORT", 6379))
+        self.db = db
+        self._pool = None
+        self._rpop_count = True  # server supports RPOP with a count
+        self._client: Optional["redis.asyncio.Redis"] = None
+        self._connect()
+
+    def _connect(self):
+        """Establish connection pool (connections open lazily on first await)."""
+        import redis.asyncio
+        try:
+            self._pool = redis.asyncio.ConnectionPool(
+                host=self.host,
+                port=self.port,
+                db=self.db,
+                socket_connect_timeout=2
+            )
+            self._client = redis.asyncio.Redis(connection_pool=self._pool)
+        except Exception as e:
+            print(f"[AsyncRedisThalamus] [WARN] Init Failed: {e}")
+            self._client = None
+
+    @property
+    def client(self):
+        """Lazy resilient client accessor."""
+        if not self._client:
+            self._connect()
+        return self._client
+
+    async def is_healthy(self) -> bool:
+        """Check if Thalamus is reachable."""
+        try:
+            return await self.client.ping()
+        except Exception:
+            return False
+
+    async def publish_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Relay a stimulus to a specific synaptic pathway (Queue)."""
+        if not self.client:
+            return False
+
+        try:
+            payload = await self._apply_publish_middleware(channel, stimulus)
+            if "timestamp" not in payload:
+                payload["timestamp"] = time.time()
+
+            await self.client.lpush(channel, self._encode_payload(payload))
+            return True
+        except Exception as e:
+            print(f"[AsyncRedisThalamus] [X] Signal Lost: {e}")
+            return False
+
+    async def consume_stimulus(self, channel: str, timeout: int = 1) -> Dict[str, Any] | None:
+        """Await a stimulus from a synaptic pathway."""
+        if not self.client:
+            await asyncio.sleep(timeout)
+            return None
+
+        try:
+            item = await self.client.brpop(channel, timeout=timeout)
+            if item:
+                _, data = item
+                payload = self._decode_payload(data)
+                return await self._apply_receive_middleware(channel, payload)
+        except Exception:
+            pass
+        return None
+
+    async def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """Relay a volley of stimuli with one pipelined round trip."""
+        if not self.client or not stimuli:
+            return 0
+
+        try:
+            payloads = []
+            for stimulus in stimuli:
+                payload = await self._apply_publish_middleware(channel, stimulus)
+                if "timestamp" not in payload:
+                    payload["timestamp"] = time.time()
+                payloads.append(self._encode_payload(payload))
+
+            # One LPUSH carries many values; chunk to keep commands bounded.
+            # Values are pushed left to right, so brpop/rpop stay FIFO.
+            pipe = self.client.pipeline(transaction=False)
+            for start in range(0, len(payloads), PUBLISH_CHUNK):
+                pipe.lpush(channel, *payloads[start:start + PUBLISH_CHUNK])
+            await pipe.execute()
+            return len(payloads)
+        except Exception as e:
+            print(f"[AsyncRedisThalamus] [X] Volley Lost: {e}")
+            return 0
+
+    async def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        """
+        Await up to max_items stimuli: RPOP with a count takes whatever is
+        queued in one round trip; only an empty queue falls back to brpop.
+        """
+        if not self.client:
+            await asyncio.sleep(timeout)
+            return []
+
+        try:
+            raw = await self._pop_many(channel, max_items)
+            if not raw:
+                item = await self.client.brpop(channel, timeout=timeout)
+                if not item:
+                    return []
+                raw = [item[1]]
+                if max_items > 1:
+                    try:
+                        raw.extend(await self._pop_many(channel, max_items - 1))
+                    except Exception:
+                        pass  # brpop already took one off the queue: deliver it
+        except Exception:
+            return []
+
+        stimuli = []
+        for data in raw:
+            try:
+                stimuli.append(await self._apply_receive_middleware(channel, self._decode_payload(data)))
+            except Exception as e:
+                print(f"[AsyncRedisThalamus] [WARN] Dropped malformed stimulus: {e}")
+        return stimuli
+
+    async def _pop_many(self, channel: str, count: int) -> List[bytes]:
+        """Non-blocking pop of up to count raw messages (oldest first)."""
+        from redis.exceptions import ResponseError
+        if self._rpop_count:
+            try:
+                return await self.client.rpop(channel, count) or []
+            except ResponseError:
+                # RPOP <key> <count> needs Redis >= 6.2; pipeline single pops instead
+                self._rpop_count = False
+        pipe = self.client.pipeline(transaction=False)
+        for _ in range(count):
+            pipe.rpop(channel)
+        return [data for data in await pipe.execute() if data is not None]
+
+    async def broadcast_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Broadcast a signal to all listeners on a synaptic pathway (Pub/Sub)."""
+        if not self.client:
+            return False
+
+        try:
+            payload = await self._apply_publish_middleware(channel, stimulus)
+            if "timestamp" not in payload:
+                payload["timestamp"] = time.time()
+
+            await self.client.publish(channel, self._encode_payload(payload))
+            return True
+        except Exception as e:
+            print(f"[AsyncRedisThalamus] [X] Broadcast Failed: {e}")
+            return False
+
+    async def close(self) -> None:
+        """Close the client and its connection pool."""
+        if self._client is not None:
+            # redis-py >= 5 renamed close() to aclose()
+            closer = getattr(self._client, "aclose", None) or self._client.close
+            await closer()
+            self._client = None
+
+
+class AsyncThalamusAdapter(AsyncThalamus):
+    """
+    Presents a blocking AbstractThalamus as an AsyncThalamus.
+    Each call runs in the default executor; middleware stays with the wrapped bus.
+    """
+
+    def __init__(self, thalamus: AbstractThalamus):
+        super().__init__()
+        self.thalamus = thalamus
+
+    async def publish_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        return await asyncio.to_thread(self.thalamus.publish_stimulus, channel, stimulus)
+
+    async def consume_stimulus(self, channel: str, timeout: int = 1) -> Dict[str, Any] | None:
+        return await asyncio.to_thread(self.thalamus.consume_stimulus, channel, timeout)
+
+    async def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        return await asyncio.to_thread(self.thalamus.publish_many, channel, stimuli)
+
+    async def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        return await asyncio.to_thread(self.thalamus.consume_many, channel, max_items, timeout)
+
+    async def acknowledge(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        return await asyncio.to_thread(self.thalamus.acknowledge, channel, stimuli)
+
+    async def broadcast_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        return await asyncio.to_thread(self.thalamus.broadcast_stimulus, channel, stimulus)
+
+    async def is_healthy(self) -> bool:
+        return await asyncio.to_thread(self.thalamus.is_healthy)
+
+
+class SyncThalamusAdapter(AbstractThalamus):
+    """
+    Presents an AsyncThalamus through the blocking AbstractThalamus contract.
+    Coroutines run on a private event loop in a daemon thread, so this is safe
+    to call from any thread (but not from inside that loop).
+    """
+
+    def __init__(self, thalamus: AsyncThalamus):
+        super().__init__()
+        self.thalamus = thalamus
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True, name="SyncThalamusLoop")
+        self._thread.start()
+
+    def _call(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def publish_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        return self._call(self.thalamus.publish_stimulus(channel, stimulus))
+
+    def consume_stimulus(self, channel: str, timeout: int = 1) -> Dict[str, Any] | None:
+        return self._call(self.thalamus.consume_stimulus(channel, timeout=timeout))
+
+    def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        return self._call(self.thalamus.publish_many(channel, stimuli))
+
+    def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        return self._call(self.thalamus.consume_many(channel, max_items=max_items, timeout=timeout))
+
+    def acknowledge(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        return self._call(self.thalamus.acknowledge(channel, stimuli))
+
+    def broadcast_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        return self._call(self.thalamus.broadcast_stimulus(channel, stimulus))
+
+    def is_healthy(self) -> bool:
+        return self._call(self.thalamus.is_healthy())
+
+    def close(self) -> None:
+        """Close the wrapped bus and stop the loop thread."""
+        if self._loop.is_closed():
+            return
+        self._call(self.thalamus.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+def as_async_thalamus(thalamus: AbstractThalamus | AsyncThalamus) -> AsyncThalamus:
+    """Return an AsyncThalamus for either contract (adapting blocking ones)."""
+    if isinstance(thalamus, AsyncThalamus):
+        return thalamus
+    if isinstance(thalamus, SyncThalamusAdapter):
+        return thalamus.thalamus
+    return AsyncThalamusAdapter(thalamus)
+
+
+# Singleton Instance (The Global Async Thalamus)
+_async_thalamus_instance: Optional[AsyncRedisThalamus] = None
+
+
+def get_async_thalamus(middleware: List[AnyMiddleware] = None, codec: Union[str, Codec] = None) -> AsyncRedisThalamus:
+    global _async_thalamus_instance
+    if not _async_thalamus_instance:
+        _async_thalamus_instance = AsyncRedisThalamus(middleware=middleware, codec=codec)
+    return _async_thalamus_instance
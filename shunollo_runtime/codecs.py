@@ -0,0 +1,339 @@
+"""
+Thalamus Codecs (Neural Coding)
+-------------------------------
+Biological Role: Neural coding. The same stimulus can travel as a rate code
+or a dense population code; the receiver must know which one it is reading.
+Technical Role: Pluggable wire formats for Thalamus payloads.
+
+    "json":    UTF-8 JSON text. Untagged, so it stays readable by consumers
+               that predate codecs (compatibility default).
+    "binary":  Compact tagged binary encoding (msgpack-style) of
+               JSON-compatible values. Lossless; homogeneous float lists are
+               packed as raw float64 arrays.
+    "somatic": The 18 physics fields (shunollo_core.models.PHYSICS_FIELDS)
+               in a fixed float32 layout, with everything else in "binary".
+               Physics values come back as float32-rounded floats.
+
+Every binary message starts with a one-byte codec tag. Tags are bytes that
+can never begin UTF-8 JSON text, so decode_message() reads any codec (and any
+legacy JSON) without being told which one was used. This lets mixed-version
+fleets interoperate: upgrade consumers first, then switch publishers.
+"""
+import json
+import math
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Union
+
+from shunollo_core.models import PHYSICS_FIELDS
+
+__all__ = [
+    'BinaryCodec',
+    'Codec',
+    'JsonCodec',
+    'SomaticCodec',
+    'decode_message',
+    'get_codec',
+    'register_codec',
+]
+
+
+class Codec(ABC):
+    """A Thalamus wire format. Subclasses define a unique name and tag byte."""
+
+    name: str = ""
+    tag: bytes = b""
+
+    @abstractmethod
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        """Serialize a payload, including the codec tag."""
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        """Deserialize a message produced by encode()."""
+        pass
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class JsonCodec(Codec):
+    """Plain JSON text (untagged: the leading '{' identifies it)."""
+
+    name = "json"
+    tag = b"{"
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload).encode()
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        return json.loads(data)
+
+
+# --- Binary encoding ---------------------------------------------------------
+# Type markers (one byte each), followed by:
+#   N / T / F          nothing (None, True, False)
+#   i                  zigzag varint
+#   d                  float64
+#   s / b              varint length + UTF-8 / raw bytes
+#   l                  varint count + values
+#   v                  varint count + raw float64 array (all-float lists)
+#   m                  varint count + (varint length + UTF-8 key, value) pairs
+
+_F64 = struct.Struct("<d")
+_F32_MAX = 3.4028234663852886e38  # largest finite float32
+_VECTOR_MIN = 4  # shorter float lists are cheaper as plain lists
+
+
+def _write_varint(out: List[bytes], value: int) -> None:
+    if value < 0x80:
+        out.append(bytes((value,)))
+        return
+    buf = bytearray()
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+    out.append(bytes(buf))
+
+
+def _truncated(pos: int) -> ValueError:
+    return ValueError(f"Corrupt binary payload: truncated at byte {pos}")
+
+
+def _span(data: bytes, pos: int, size: int) -> int:
+    """End of a size-byte field starting at pos, checked against the buffer."""
+    end = pos + size
+    if end > len(data):
+        raise _truncated(len(data))
+    return end
+
+
+def _read_varint(data: bytes, pos: int):
+    try:
+        byte = data[pos]
+        if byte < 0x80:
+            return byte, pos + 1
+        value, shift = 0, 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value, pos
+            shift += 7
+    except IndexError:
+        raise _truncated(len(data)) from None
+
+
+def _encode_value(out: List[bytes], value: Any) -> None:
+    if isinstance(value, str):
+        raw = value.encode()
+        out.append(b"s")
+        _write_varint(out, len(raw))
+        out.append(raw)
+    elif isinstance(value, bool):
+        out.append(b"T" if value else b"F")
+    elif isinstance(value, float):
+        out.append(b"d")
+        out.append(_F64.pack(value))
+    elif isinstance(value, int):
+        out.append(b"i")
+        _write_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+    elif value is None:
+        out.append(b"N")
+    elif isinstance(value, dict):
+        out.append(b"m")
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            raw = (key if isinstance(key, str) else json.dumps(key).strip('"')).encode()
+            _write_varint(out, len(raw))
+            out.append(raw)
+            _encode_value(out, item)
+    elif isinstance(value, (list, tuple)):
+        if len(value) >= _VECTOR_MIN and all(type(item) is float for item in value):
+            out.append(b"v")
+            _write_varint(out, len(value))
+            out.append(struct.pack(f"<{len(value)}d", *value))
+            return
+        out.append(b"l")
+        _write_varint(out, len(value))
+        for item in value:
+            _encode_value(out, item)
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(b"b")
+        _write_varint(out, len(value))
+        out.append(bytes(value))
+    elif hasattr(value, "tolist"):  # numpy arrays and scalars
+        _encode_value(out, value.tolist())
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not serializable")
+
+
+def _decode_value(data: bytes, pos: int):
+    if pos >= len(data):
+        raise _truncated(pos)
+    marker = data[pos]
+    pos += 1
+    if marker == 0x73:  # s
+        size, pos = _read_varint(data, pos)
+        end = _span(data, pos, size)
+        return data[pos:end].decode(), end
+    if marker == 0x64:  # d
+        end = _span(data, pos, 8)
+        return _F64.unpack_from(data, pos)[0], end
+    if marker == 0x6D:  # m
+        count, pos = _read_varint(data, pos)
+        result = {}
+        for _ in range(count):
+            size, pos = _read_varint(data, pos)
+            end = _span(data, pos, size)
+            key = data[pos:end].decode()
+            result[key], pos = _decode_value(data, end)
+        return result, pos
+    if marker == 0x69:  # i
+        raw, pos = _read_varint(data, pos)
+        return (raw >> 1) ^ -(raw & 1), pos
+    if marker == 0x76:  # v
+        count, pos = _read_varint(data, pos)
+        end = _span(data, pos, 8 * count)
+        return list(struct.unpack_from(f"<{count}d", data, pos)), end
+    if marker == 0x6C:  # l
+        count, pos = _read_varint(data, pos)
+        items = []
+        for _ in range(count):
+            item, pos = _decode_value(data, pos)
+            items.append(item)
+        return items, pos
+    if marker == 0x54:  # T
+        return True, pos
+    if marker == 0x46:  # F
+        return False, pos
+    if marker == 0x4E:  # N
+        return None, pos
+    if marker == 0x62:  # b
+        size, pos = _read_varint(data, pos)
+        end = _span(data, pos, size)
+        return bytes(data[pos:end]), end
+    raise ValueError(f"Corrupt binary payload: unknown marker 0x{marker:02x} at {pos - 1}")
+
+
+class BinaryCodec(Codec):
+    """Compact, lossless tagged binary encoding of JSON-compatible payloads."""
+
+    name = "binary"
+    tag = b"\xc1"  # never valid in UTF-8, so never the start of JSON text
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        out = [self.tag]
+        _encode_value(out, payload)
+        return b"".join(out)
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        value, _ = _decode_value(data, 1)
+        if not isinstance(value, dict):
+            raise ValueError("Corrupt binary payload: not a mapping")
+        return value
+
+
+class SomaticCodec(Codec):
+    """
+    Fixed layout for the 18-dim somatic vector:
+        tag | u32 presence mask | 18 x float32 | binary-encoded remainder
+    A physics field travels in the vector only if it is a real number that
+    float32 can hold (others go in the remainder); the mask keeps absent
+    fields absent.
+    """
+
+    name = "somatic"
+    tag = b"\xc0"  # never valid in UTF-8
+    FIELDS = tuple(name for name, _, _ in PHYSICS_FIELDS)
+    _LAYOUT = struct.Struct(f"<I{len(FIELDS)}f")
+
+    def encode(self, payload: Dict[str, Any]) -> bytes:
+        mask = 0
+        vector = [0.0] * len(self.FIELDS)
+        rest = dict(payload)
+        for i, field in enumerate(self.FIELDS):
+            value = rest.get(field)
+            if (
+                (type(value) is float and (abs(value) <= _F32_MAX or not math.isfinite(value)))
+                or (type(value) is int and -(1 << 24) <= value <= (1 << 24))
+            ):
+                mask |= 1 << i
+                vector[i] = value
+                del rest[field]
+        out = [self.tag, self._LAYOUT.pack(mask, *vector)]
+        _encode_value(out, rest)
+        return b"".join(out)
+
+    def decode(self, data: bytes) -> Dict[str, Any]:
+        end = _span(data, 1, self._LAYOUT.size)
+        mask, *vector = self._LAYOUT.unpack_from(data, 1)
+        payload, _ = _decode_value(data, end)
+        if not isinstance(payload, dict):
+            raise ValueError("Corrupt binary payload: not a mapping")
+        for i, field in enumerate(self.FIELDS):
+            if mask >> i & 1:
+                payload[field] = vector[i]
+        return payload
+
+
+_CODECS: Dict[str, Codec] = {}
+_BY_TAG: Dict[int, Codec] = {}
+
+
+def register_codec(codec: Codec) -> None:
+    """
+    Make a codec available by name and readable by decode_message().
+
+    Raises:
+        ValueError: If its name or tag is already taken by another codec
+    """
+    if len(codec.tag) != 1:
+        raise ValueError("A codec tag must be exactly one byte")
+    for existing in (_CODECS.get(codec.name), _BY_TAG.get(codec.tag[0])):
+        if existing is not None and type(existing) is not type(codec):
+            raise ValueError(f"Codec name '{codec.name}' or tag {codec.tag!r} is already registered")
+    _CODECS[codec.name] = codec
+    _BY_TAG[codec.tag[0]] = codec
+
+
+for _codec in (JsonCodec(), BinaryCodec(), SomaticCodec()):
+    register_codec(_codec)
+
+
+def get_codec(codec: Union[str, Codec, None] = None) -> Codec:
+    """
+    Resolve a codec by name (None means "json") or pass an instance through.
+
+    Raises:
+        ValueError: If the name is unknown
+    """
+    if isinstance(codec, Codec):
+        return codec
+    name = codec or "json"
+    if name not in _CODECS:
+        raise ValueError(f"Unknown codec '{name}', expected one of {tuple(_CODECS)}")
+    return _CODECS[name]
+
+
+def decode_message(data: Union[bytes, str]) -> Dict[str, Any]:
+    """
+    Decode a message from any registered codec, chosen by its tag byte.
+    Untagged text (legacy publishers) is read as JSON.
+
+    Raises:
+        ValueError: If the message is empty, corrupt or has an unknown tag
+    """
+    if isinstance(data, str):
+        return json.loads(data)
+    if not data:
+        raise ValueError("Empty Thalamus message")
+    codec = _BY_TAG.get(data[0])
+    if codec is None:
+        if data[0] < 0x80:  # ASCII: JSON text, possibly with leading whitespace
+            return json.loads(data)
+        raise ValueError(f"Unknown codec tag 0x{data[0]:02x}")
+    return codec.decode(data)
@@ -1,4 +1,4 @@
 # Shunollo Runtime Interfaces
-from .thalamus import AbstractThalamus, ThalamusMiddleware
+from .thalamus import DELIVERY_KEY, AbstractThalamus, AsyncThalamus, AsyncThalamusMiddleware, ThalamusMiddleware
 
-__all__ = ["AbstractThalamus", "ThalamusMiddleware"]
+__all__ = ["DELIVERY_KEY", "AbstractThalamus", "AsyncThalamus", "AsyncThalamusMiddleware", "ThalamusMiddleware"]
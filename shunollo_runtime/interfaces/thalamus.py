@@ -6,9 +6,23 @@ The Runtime (or App) must implement this using Redis, Kafka, or Memory.
 
 This interface supports a MIDDLEWARE chain to allow Commercial Apps to
 inject proprietary logic (Audit, Security) without modifying the Open Source code.
+
+AsyncThalamus is the asyncio twin of AbstractThalamus, for agents that keep
+many stimuli in flight per process. Its middleware hooks may be plain or
+awaitable, so existing ThalamusMiddleware works unchanged.
+
+Serializing implementations encode with their `codec` (see
+shunollo_runtime.codecs) and decode any codec by its tag.
+
+Delivery is at-most-once by default: a consumed stimulus is gone. Buses with
+acknowledged delivery (e.g. RedisStreamThalamus) tag each consumed stimulus
+with DELIVERY_KEY and redeliver it until acknowledge() is called.
 """
+import inspect
 from abc import ABC, abstractmethod
-from typing import Callable, Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Union
+
+from ..codecs import Codec, decode_message, get_codec
 
 
 class ThalamusMiddleware(ABC):
@@ -27,14 +41,45 @@ class ThalamusMiddleware(ABC):
         pass
 
 
+class AsyncThalamusMiddleware(ABC):
+    """
+    Awaitable variant of ThalamusMiddleware (e.g. remote audit or KMS calls).
+    Only AsyncThalamus awaits these hooks.
+    """
+    @abstractmethod
+    async def on_publish(self, channel: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Called before a message is published. Can modify payload."""
+        pass
+
+    @abstractmethod
+    async def on_receive(self, channel: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Called after a message is received. Can modify payload."""
+        pass
+
+
+AnyMiddleware = Union[ThalamusMiddleware, AsyncThalamusMiddleware]
+
+# Reserved stimulus key carrying the delivery id on acknowledged buses
+DELIVERY_KEY = "_delivery_id"
+
+
 class AbstractThalamus(ABC):
     """
     The Biomimetic Bus.
     Decouples the 'Brain' (Analyzers) from the 'Body' (Sensors).
     """
 
-    def __init__(self, middleware: List[ThalamusMiddleware] = None):
+    def __init__(self, middleware: List[ThalamusMiddleware] = None, codec: Union[str, Codec] = None):
         self._middleware = middleware or []
+        self.codec = get_codec(codec)
+
+    def _encode_payload(self, payload: Dict[str, Any]) -> bytes:
+        """Serialize a payload for the wire with this bus's codec."""
+        return self.codec.encode(payload)
+
+    def _decode_payload(self, data: Union[bytes, str]) -> Dict[str, Any]:
+        """Deserialize a message from any codec (chosen by its tag)."""
+        return decode_message(data)
 
     def _apply_publish_middleware(self, channel: str, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Apply all publish hooks."""
@@ -58,6 +103,35 @@ class AbstractThalamus(ABC):
         """Await a nerve impulse from a synaptic pathway (Queue)."""
         pass
 
+    def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """
+        Send a volley of stimuli; returns how many were accepted.
+        Middleware applies per message. The default sends one at a time;
+        implementations should batch the round trips.
+        """
+        return sum(1 for stimulus in stimuli if self.publish_stimulus(channel, stimulus))
+
+    def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        """
+        Await up to max_items stimuli: waits up to timeout for the first, then
+        takes only what is already queued. Middleware applies per message.
+        The default returns at most one; implementations should batch.
+        """
+        stimulus = self.consume_stimulus(channel, timeout=timeout)
+        return [stimulus] if stimulus is not None else []
+
+    def acknowledge(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """
+        Confirm that consumed stimuli were handled, so they are not redelivered.
+        Returns how many were acknowledged. The default is a no-op (delivery
+        is already final when a stimulus is consumed).
+        """
+        return 0
+
+    def depth(self, channel: str) -> Optional[int]:
+        """Stimuli waiting on a pathway, or None if the bus cannot tell."""
+        return None
+
     @abstractmethod
     def broadcast_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
         """Broadcast a signal to all listeners on a synaptic pathway (Pub/Sub)."""
@@ -67,3 +141,78 @@ class AbstractThalamus(ABC):
     def is_healthy(self) -> bool:
         """Check if Thalamus is reachable."""
         pass
+
+
+class AsyncThalamus(ABC):
+    """
+    The Biomimetic Bus, asyncio edition.
+    Same contract as AbstractThalamus, but every call is a coroutine.
+    """
+
+    def __init__(self, middleware: List[AnyMiddleware] = None, codec: Union[str, Codec] = None):
+        self._middleware = middleware or []
+        self.codec = get_codec(codec)
+
+    def _encode_payload(self, payload: Dict[str, Any]) -> bytes:
+        """Serialize a payload for the wire with this bus's codec."""
+        return self.codec.encode(payload)
+
+    def _decode_payload(self, data: Union[bytes, str]) -> Dict[str, Any]:
+        """Deserialize a message from any codec (chosen by its tag)."""
+        return decode_message(data)
+
+    async def _apply_publish_middleware(self, channel: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply all publish hooks, awaiting async ones."""
+        for mw in self._middleware:
+            payload = mw.on_publish(channel, payload)
+            if inspect.isawaitable(payload):
+                payload = await payload
+        return payload
+
+    async def _apply_receive_middleware(self, channel: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Apply all receive hooks, awaiting async ones."""
+        for mw in self._middleware:
+            payload = mw.on_receive(channel, payload)
+            if inspect.isawaitable(payload):
+                payload = await payload
+        return payload
+
+    @abstractmethod
+    async def publish_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Send a nerve impulse (Stimulus) to the system."""
+        pass
+
+    @abstractmethod
+    async def consume_stimulus(self, channel: str, timeout: int = 1) -> Dict[str, Any] | None:
+        """Await a nerve impulse from a synaptic pathway (Queue)."""
+        pass
+
+    async def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """Send a volley of stimuli; returns how many were accepted (see AbstractThalamus)."""
+        accepted = 0
+        for stimulus in stimuli:
+            accepted += bool(await self.publish_stimulus(channel, stimulus))
+        return accepted
+
+    async def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        """Await up to max_items stimuli (see AbstractThalamus). The default returns at most one."""
+        stimulus = await self.consume_stimulus(channel, timeout=timeout)
+        return [stimulus] if stimulus is not None else []
+
+    async def acknowledge(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """Confirm that consumed stimuli were handled (see AbstractThalamus). The default is a no-op."""
+        return 0
+
+    @abstractmethod
+    async def broadcast_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Broadcast a signal to all listeners on a synaptic pathway (Pub/Sub)."""
+        pass
+
+    @abstractmethod
+    async def is_healthy(self) -> bool:
+        """Check if Thalamus is reachable."""
+        pass
+
+    async def close(self) -> None:
+        """Release connections. Override if the implementation holds any."""
+        pass
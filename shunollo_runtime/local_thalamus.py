@@ -0,0 +1,509 @@
+"""
+Local Thalamus Implementations (Single-Node Buses)
+--------------------------------------------------
+Biological Role: Local circuits. Neurons in the same nucleus talk through
+short interneurons rather than long-range projections; on one host there is
+no need for the long (network) pathway.
+
+InMemoryThalamus:     agents in one process. Stimuli are handed over by
+                      reference through a deque per channel (no serialization,
+                      no copy; the receiver owns the payload).
+SharedMemoryThalamus: agents in several processes on one host. Each channel is
+                      a byte ring buffer in multiprocessing.shared_memory,
+                      guarded by a lock file; stimuli are encoded with the
+                      bus codec (JSON by default).
+
+Both implement the full AbstractThalamus contract, including middleware and
+publish_many/consume_many. Broadcasts fan out to named subscriptions: each
+subscriber consumes its own queue channel returned by subscribe().
+"""
+import hashlib
+import json
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Deque, Dict, Iterator, List, Set, Union
+
+from shunollo_core.utils.file_lock import lock_file, unlock_file
+
+from .codecs import Codec
+from .interfaces import AbstractThalamus, ThalamusMiddleware
+
+__all__ = ['InMemoryThalamus', 'SharedMemoryThalamus', 'subscription_channel']
+
+
+def subscription_channel(channel: str, subscriber: str) -> str:
+    """Queue channel that receives a subscriber's copy of broadcasts on channel."""
+    return f"{channel}::{subscriber}"
+
+
+class _Channel:
+    """A deque plus the condition consumers sleep on when it is empty."""
+
+    __slots__ = ("queue", "cond", "waiters")
+
+    def __init__(self):
+        self.queue: Deque[Dict[str, Any]] = deque()
+        self.cond = threading.Condition()
+        self.waiters = 0
+
+
+class InMemoryThalamus(AbstractThalamus):
+    """
+    In-process Thalamus. Publishing is a deque append (atomic under the GIL,
+    no lock); the condition is only touched when a consumer is asleep.
+    """
+
+    def __init__(self, middleware: List[ThalamusMiddleware] = None):
+        # Nothing is serialized in-process, so the codec is never used
+        super().__init__(middleware=middleware)
+        self._channels: Dict[str, _Channel] = {}
+        self._subscribers: Dict[str, Set[str]] = {}
+        self._registry_lock = threading.Lock()
+
+    def _channel(self, name: str) -> _Channel:
+        channel = self._channels.get(name)
+        if channel is None:
+            with self._registry_lock:
+                channel = self._channels.setdefault(name, _Channel())
+        return channel
+
+    def _prepare(self, channel: str, stimulus: Dict[str, Any]) -> Dict[str, Any]:
+        payload = self._apply_publish_middleware(channel, stimulus)
+        if "timestamp" not in payload:
+            payload["timestamp"] = time.time()
+        return payload
+
+    def _deliver(self, channel: _Channel, payloads: List[Dict[str, Any]]) -> None:
+        channel.queue.extend(payloads)
+        # Consumers register as waiters before re-checking the queue,
+        # so a publisher that sees none cannot miss a sleeper.
+        if channel.waiters:
+            with channel.cond:
+                channel.cond.notify(len(payloads))
+
+    def is_healthy(self) -> bool:
+        """Check if Thalamus is reachable."""
+        return True
+
+    def publish_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Relay a stimulus to a specific synaptic pathway (Queue)."""
+        try:
+            self._deliver(self._channel(channel), [self._prepare(channel, stimulus)])
+            return True
+        except Exception as e:
+            print(f"[InMemoryThalamus] [X] Signal Lost: {e}")
+            return False
+
+    def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """Relay a volley of stimuli."""
+        try:
+            payloads = [self._prepare(channel, stimulus) for stimulus in stimuli]
+        except Exception as e:
+            print(f"[InMemoryThalamus] [X] Volley Lost: {e}")
+            return 0
+        if payloads:
+            self._deliver(self._channel(channel), payloads)
+        return len(payloads)
+
+    def consume_stimulus(self, channel: str, timeout: int = 1) -> Dict[str, Any] | None:
+        """Await a stimulus from a synaptic pathway."""
+        batch = self.consume_many(channel, max_items=1, timeout=timeout)
+        return batch[0] if batch else None
+
+    def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        """Await up to max_items stimuli (waits only for the first)."""
+        pathway = self._channel(channel)
+        raw = self._drain(pathway.queue, max_items)
+        if not raw and timeout:
+            deadline = time.monotonic() + timeout
+            with pathway.cond:
+                pathway.waiters += 1
+                try:
+                    while not pathway.queue:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        pathway.cond.wait(remaining)
+                finally:
+                    pathway.waiters -= 1
+            raw = self._drain(pathway.queue, max_items)
+        return [self._apply_receive_middleware(channel, payload) for payload in raw]
+
+    @staticmethod
+    def _drain(queue: Deque[Dict[str, Any]], max_items: int) -> List[Dict[str, Any]]:
+        raw = []
+        try:
+            while len(raw) < max_items:
+                raw.append(queue.popleft())
+        except IndexError:
+            pass
+        return raw
+
+    def broadcast_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Broadcast a signal to every subscription on a synaptic pathway."""
+        try:
+            payload = self._prepare(channel, stimulus)
+            for i, subscriber in enumerate(tuple(self._subscribers.get(channel, ()))):
+                # Each subscriber owns its copy of the envelope
+                self._deliver(
+                    self._channel(subscription_channel(channel, subscriber)),
+                    [payload if i == 0 else dict(payload)]
+                )
+            return True
+        except Exception as e:
+            print(f"[InMemoryThalamus] [X] Broadcast Failed: {e}")
+            return False
+
+    def subscribe(self, channel: str, subscriber: str) -> str:
+        """Register for broadcasts on channel; returns the queue channel to consume."""
+        with self._registry_lock:
+            self._subscribers.setdefault(channel, set()).add(subscriber)
+        return subscription_channel(channel, subscriber)
+
+    def unsubscribe(self, channel: str, subscriber: str) -> None:
+        """Stop receiving broadcasts on channel."""
+        with self._registry_lock:
+            self._subscribers.get(channel, set()).discard(subscriber)
+
+    def depth(self, channel: str) -> int:
+        """Stimuli waiting on a channel."""
+        return len(self._channel(channel).queue)
+
+
+# --- Shared memory ring -----------------------------------------------------
+
+_MAGIC = b"SHTHAL02"
+_HEADER = struct.Struct("<8sQQQQ")  # magic, capacity, head, tail (monotonic byte offsets), records
+_HEADER_SIZE = 64
+_LENGTH = struct.Struct("<I")
+
+
+class _Ring:
+    """
+    Byte ring in one shared memory segment: [header | capacity bytes].
+    Records are a u32 length then the payload, wrapping at the end.
+    Callers hold the ring's lock around every read or write.
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, lock_path: str):
+        self.shm = shm
+        self.buf = shm.buf
+        self.capacity = _HEADER.unpack_from(self.buf, 0)[1]
+        self._lock_file = open(lock_path, "a+b")
+        self._thread_lock = threading.Lock()  # flock does not exclude threads sharing the file
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        with self._thread_lock:
+            lock_file(self._lock_file)
+            try:
+                yield
+            finally:
+                unlock_file(self._lock_file)
+
+    def _offsets(self):
+        _, _, head, tail, count = _HEADER.unpack_from(self.buf, 0)
+        return head, tail, count
+
+    def _set(self, head: int, tail: int, count: int) -> None:
+        _HEADER.pack_into(self.buf, 0, _MAGIC, self.capacity, head, tail, count)
+
+    def _write(self, offset: int, data: bytes) -> None:
+        pos = offset % self.capacity
+        first = min(len(data), self.capacity - pos)
+        self.buf[_HEADER_SIZE + pos:_HEADER_SIZE + pos + first] = data[:first]
+        if first < len(data):
+            self.buf[_HEADER_SIZE:_HEADER_SIZE + len(data) - first] = data[first:]
+
+    def _read(self, offset: int, size: int) -> bytes:
+        pos = offset % self.capacity
+        first = min(size, self.capacity - pos)
+        data = bytes(self.buf[_HEADER_SIZE + pos:_HEADER_SIZE + pos + first])
+        if first < size:
+            data += bytes(self.buf[_HEADER_SIZE:_HEADER_SIZE + size - first])
+        return data
+
+    def push(self, records: List[bytes]) -> int:
+        """Append records while they fit; returns how many were written."""
+        head, tail, count = self._offsets()
+        written = 0
+        for record in records:
+            need = _LENGTH.size + len(record)
+            if tail - head + need > self.capacity:
+                break
+            self._write(tail, _LENGTH.pack(len(record)))
+            self._write(tail + _LENGTH.size, record)
+            tail += need
+            written += 1
+        if written:
+            self._set(head, tail, count + written)
+        return written
+
+    def pop(self, max_items: int) -> List[bytes]:
+        """Remove up to max_items records (oldest first)."""
+        head, tail, count = self._offsets()
+        records = []
+        while head < tail and len(records) < max_items:
+            size = _LENGTH.unpack(self._read(head, _LENGTH.size))[0]
+            records.append(self._read(head + _LENGTH.size, size))
+            head += _LENGTH.size + size
+        if records:
+            self._set(head, tail, count - len(records))
+        return records
+
+    def __len__(self) -> int:
+        """Records waiting."""
+        return self._offsets()[2]
+
+    def close(self) -> None:
+        self._lock_file.close()
+        self.buf = None
+        self.shm.close()
+
+
+class SharedMemoryThalamus(AbstractThalamus):
+    """
+    Cross-process Thalamus on one host. Processes that use the same `name`
+    share channels. Segments are created on first use by whichever process
+    gets there first and persist until unlink() (call once, from the owner).
+
+    Consumers poll with a short backoff, since shared memory has no
+    cross-process wakeup.
+    """
+
+    def __init__(
+        self,
+        name: str = "shunollo",
+        capacity: int = 1 << 22,
+        poll_interval: float = 0.001,
+        middleware: List[ThalamusMiddleware] = None,
+        codec: Union[str, Codec] = None
+    ):
+        """
+        Args:
+            name: Namespace shared by cooperating processes
+            capacity: Ring size in bytes per channel
+            poll_interval: Longest sleep between polls while waiting
+            middleware: Publish/receive hooks
+            codec: Wire format for published stimuli (any codec is readable)
+
+        Raises:
+            ValueError: If capacity is not positive or the codec is unknown
+        """
+        super().__init__(middleware=middleware, codec=codec)
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.name = name
+        self.capacity = capacity
+        self.poll_interval = poll_interval
+        self._dir = os.path.join(tempfile.gettempdir(), f"shunollo-thalamus-{name}")
+        os.makedirs(self._dir, exist_ok=True)
+        self._rings: Dict[str, _Ring] = {}
+        self._rings_lock = threading.Lock()
+
+    # --- Channels ---
+
+    def _segment(self, channel: str) -> str:
+        # POSIX shm names are short (31 chars on macOS) and may not contain '/'
+        digest = hashlib.sha1(f"{self.name}/{channel}".encode()).hexdigest()[:16]
+        return f"shth_{digest}"
+
+    @contextmanager
+    def _directory_locked(self) -> Iterator[None]:
+        with open(os.path.join(self._dir, "registry.lock"), "a+b") as f:
+            lock_file(f)
+            try:
+                yield
+            finally:
+                unlock_file(f)
+
+    def _ring(self, channel: str) -> _Ring:
+        ring = self._rings.get(channel)
+        if ring is not None:
+            return ring
+        with self._rings_lock:
+            ring = self._rings.get(channel)
+            if ring is None:
+                segment = self._segment(channel)
+                with self._directory_locked():
+                    try:
+                        shm = shared_memory.SharedMemory(name=segment)
+                        _untrack(shm)
+                    except FileNotFoundError:
+                        shm = shared_memory.SharedMemory(name=segment, create=True, size=_HEADER_SIZE + self.capacity)
+                        _HEADER.pack_into(shm.buf, 0, _MAGIC, self.capacity, 0, 0, 0)
+                        _untrack(shm)  # outlives this process until unlink()
+                        with open(os.path.join(self._dir, "segments"), "a", encoding="utf-8") as f:
+                            f.write(segment + "\n")
+                if bytes(shm.buf[:8]) != _MAGIC:
+                    shm.close()
+                    raise ValueError(f"Shared memory segment for '{channel}' is not a Thalamus ring")
+                ring = self._rings[channel] = _Ring(shm, os.path.join(self._dir, f"{segment}.lock"))
+        return ring
+
+    # --- Contract ---
+
+    def _encode(self, channel: str, stimulus: Dict[str, Any]) -> bytes:
+        payload = self._apply_publish_middleware(channel, stimulus)
+        if "timestamp" not in payload:
+            payload["timestamp"] = time.time()
+        return self._encode_payload(payload)
+
+    def is_healthy(self) -> bool:
+        """Check if Thalamus is reachable."""
+        return os.path.isdir(self._dir)
+
+    def publish_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Relay a stimulus to a specific synaptic pathway (Queue)."""
+        return self.publish_many(channel, [stimulus]) == 1
+
+    def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """Relay a volley of stimuli under one lock acquisition."""
+        try:
+            records = [self._encode(channel, stimulus) for stimulus in stimuli]
+            ring = self._ring(channel)
+            with ring.locked():
+                written = ring.push(records)
+        except Exception as e:
+            print(f"[SharedMemoryThalamus] [X] Signal Lost: {e}")
+            return 0
+        if written < len(records):
+            print(f"[SharedMemoryThalamus] [X] Ring '{channel}' full: {len(records) - written} stimuli lost")
+        return written
+
+    def consume_stimulus(self, channel: str, timeout: int = 1) -> Dict[str, Any] | None:
+        """Await a stimulus from a synaptic pathway."""
+        batch = self.consume_many(channel, max_items=1, timeout=timeout)
+        return batch[0] if batch else None
+
+    def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        """Await up to max_items stimuli (waits only for the first)."""
+        ring = self._ring(channel)
+        deadline = time.monotonic() + (timeout or 0)
+        delay = 1e-5
+        while True:
+            if len(ring):
+                with ring.locked():
+                    raw = ring.pop(max_items)
+                if raw:
+                    break
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return []
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, self.poll_interval)
+
+        stimuli = []
+        for data in raw:
+            try:
+                stimuli.append(self._apply_receive_middleware(channel, self._decode_payload(data)))
+            except Exception as e:
+                print(f"[SharedMemoryThalamus] [WARN] Dropped malformed stimulus: {e}")
+        return stimuli
+
+    def broadcast_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Broadcast a signal to every subscription on a synaptic pathway."""
+        try:
+            record = self._encode(channel, stimulus)
+            for subscriber in self._read_registry().get(channel, []):
+                ring = self._ring(subscription_channel(channel, subscriber))
+                with ring.locked():
+                    ring.push([record])
+            return True
+        except Exception as e:
+            print(f"[SharedMemoryThalamus] [X] Broadcast Failed: {e}")
+            return False
+
+    # --- Subscriptions (a JSON registry shared through the lock directory) ---
+
+    def _registry_path(self) -> str:
+        return os.path.join(self._dir, "subscribers.json")
+
+    def _read_registry(self) -> Dict[str, List[str]]:
+        try:
+            with open(self._registry_path(), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _update_registry(self, channel: str, subscriber: str, add: bool) -> None:
+        with self._directory_locked():
+            registry = self._read_registry()
+            members = set(registry.get(channel, []))
+            if add:
+                members.add(subscriber)
+            else:
+                members.discard(subscriber)
+            registry[channel] = sorted(members)
+            tmp = self._registry_path() + ".tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(registry, f)
+            os.replace(tmp, self._registry_path())
+
+    def subscribe(self, channel: str, subscriber: str) -> str:
+        """Register for broadcasts on channel; returns the queue channel to consume."""
+        queue_channel = subscription_channel(channel, subscriber)
+        self._ring(queue_channel)
+        self._update_registry(channel, subscriber, add=True)
+        return queue_channel
+
+    def unsubscribe(self, channel: str, subscriber: str) -> None:
+        """Stop receiving broadcasts on channel."""
+        self._update_registry(channel, subscriber, add=False)
+
+    def depth(self, channel: str) -> int:
+        """Stimuli waiting on a channel."""
+        return len(self._ring(channel))
+
+    # --- Lifecycle ---
+
+    def close(self) -> None:
+        """Detach from every segment (they stay available to other processes)."""
+        with self._rings_lock:
+            for ring in self._rings.values():
+                ring.close()
+            self._rings.clear()
+
+    def unlink(self) -> None:
+        """Detach, then destroy every segment in this namespace (for all processes)."""
+        self.close()
+        with self._directory_locked():
+            try:
+                with open(os.path.join(self._dir, "segments"), "r", encoding="utf-8") as f:
+                    segments = set(f.read().split())
+            except FileNotFoundError:
+                segments = set()
+            for segment in segments:
+                try:
+                    shm = shared_memory.SharedMemory(name=segment)
+                    shm.close()
+                    shm.unlink()
+                except FileNotFoundError:
+                    pass
+            for entry in os.listdir(self._dir):
+                if entry != "registry.lock":
+                    os.remove(os.path.join(self._dir, entry))
+        try:
+            os.remove(os.path.join(self._dir, "registry.lock"))
+            os.rmdir(self._dir)
+        except OSError:
+            pass  # another process re-used the namespace meanwhile
+
+
+def _untrack(shm: shared_memory.SharedMemory) -> None:
+    """
+    Stop this process's resource tracker from unlinking a segment at exit
+    (Python < 3.13 tracks even attachments). Rings are shared by agents that
+    come and go, so their lifetime is managed explicitly with unlink().
+    """
+    try:
+        from multiprocessing import resource_tracker
+        resource_tracker.unregister(shm._name, "shared_memory")
+    except Exception:
+        pass
@@ -0,0 +1,313 @@
+"""
+RedisStreamThalamus - Consumer Groups on Redis Streams
+------------------------------------------------------
+Biological Role: A nerve is a bundle of parallel fibres. One logical agent
+runs as N replicas (fibres) that share a pathway without double-firing,
+and a signal carried by a fibre that dies is picked up by another.
+Technical Role: Each channel is a Redis Stream read through a consumer group.
+
+    publish:      XADD (approximately trimmed to maxlen)
+    consume:      XREADGROUP ">" hands every entry to exactly one replica
+    acknowledge:  XACK once the agent has handled (and published) it
+    reclaim:      entries left pending longer than claim_idle seconds (a
+                  crashed or stalled replica) are XCLAIMed by a live one
+    dead letter:  entries delivered max_deliveries times are moved to
+                  "<channel>:dead" instead of being retried forever
+
+Delivery is at-least-once: a replica that crashes after publishing but
+before acknowledging causes a redelivery. Consumed stimuli carry their entry
+id under DELIVERY_KEY, which acknowledge() reads.
+"""
+import os
+import socket
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from .codecs import Codec
+from .interfaces import DELIVERY_KEY, ThalamusMiddleware
+from .thalamus import RedisThalamus
+
+__all__ = ['DEAD_LETTER_SUFFIX', 'RedisStreamThalamus']
+
+DEAD_LETTER_SUFFIX = ":dead"
+
+# Stream entry field holding the encoded stimulus
+_FIELD = b"d"
+
+
+def _text(value: Any) -> Any:
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _next_id(entry_id: Any) -> str:
+    """The smallest stream id after entry_id (an exclusive range start)."""
+    ms, seq = _text(entry_id).split("-")
+    return f"{ms}-{int(seq) + 1}"
+
+
+class RedisStreamThalamus(RedisThalamus):
+    """Redis Streams implementation of the Thalamus with acknowledged delivery."""
+
+    # XPENDING ... IDLE needs Redis 6.2; cleared on first refusal
+    _pending_idle_filter = True
+
+    def __init__(
+        self,
+        host: str = None,
+        port: int = None,
+        db: int = 0,
+        group: str = "shunollo",
+        consumer: Optional[str] = None,
+        claim_idle: float = 30.0,
+        max_deliveries: int = 5,
+        maxlen: Optional[int] = 1_000_000,
+        middleware: List[ThalamusMiddleware] = None,
+        codec: Union[str, Codec] = None
+    ):
+        """
+        Args:
+            host, port, db: Redis server (defaults as for RedisThalamus)
+            group: Consumer group; replicas of one agent share a group
+            consumer: Replica name (defaults to "<hostname>-<pid>")
+            claim_idle: Seconds an entry may stay unacknowledged before
+                        another replica reclaims it
+            max_deliveries: Deliveries before an entry is dead-lettered
+            maxlen: Approximate stream length cap (None keeps everything)
+            middleware: Publish/receive hooks
+            codec: Wire format for published stimuli
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if claim_idle <= 0:
+            raise ValueError("claim_idle must be positive")
+        if max_deliveries <= 0:
+            raise ValueError("max_deliveries must be positive")
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError("maxlen must be positive (or None)")
+        super().__init__(host=host, port=port, db=db, middleware=middleware, codec=codec)
+        self.group = group
+        self.claim_idle = claim_idle
+        self.max_deliveries = max_deliveries
+        self.maxlen = maxlen
+        self._consumer = consumer
+        self._groups: Set[str] = set()  # channels whose group is known to exist
+        self._next_reclaim: Dict[str, float] = {}
+
+    @property
+    def consumer(self) -> str:
+        """This replica's name in the group (resolved per process, so forks differ)."""
+        return self._consumer or f"{socket.gethostname()}-{os.getpid()}"
+
+    # --- Publishing ---
+
+    def _prepare(self, channel: str, stimulus: Dict[str, Any]) -> bytes:
+        payload = self._apply_publish_middleware(channel, stimulus)
+        if DELIVERY_KEY in payload:  # a forwarded stimulus: the old id means nothing here
+            payload = {k: v for k, v in payload.items() if k != DELIVERY_KEY}
+        if "timestamp" not in payload:
+            payload["timestamp"] = time.time()
+        return self._encode_payload(payload)
+
+    def publish_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
+        """Append a stimulus to a synaptic pathway (Stream)."""
+        return self.publish_many(channel, [stimulus]) == 1
+
+    def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """Append a volley of stimuli with one pipelined round trip."""
+        if not self.client or not stimuli:
+            return 0
+
+        try:
+            pipe = self.client.pipeline(transaction=False)
+            for stimulus in stimuli:
+                pipe.xadd(channel, {_FIELD: self._prepare(channel, stimulus)}, maxlen=self.maxlen, approximate=True)
+            pipe.execute()
+            return len(stimuli)
+        except Exception as e:
+            print(f"[RedisStreamThalamus] [X] Volley Lost: {e}")
+            return 0
+
+    # --- Consuming ---
+
+    def _ensure_group(self, channel: str) -> None:
+        """Create the consumer group (and stream) on first use."""
+        if channel in self._groups:
+            return
+        from redis.exceptions import ResponseError
+        try:
+            # From id 0: stimuli published before the first replica started are kept
+            self.client.xgroup_create(channel, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._groups.add(channel)
+
+    def consume_stimulus(self, channel: str, timeout: int = 1) -> Dict[str, Any] | None:
+        """Await a stimulus from a synaptic pathway (acknowledge it when handled)."""
+        batch = self.consume_many(channel, max_items=1, timeout=timeout)
+        return batch[0] if batch else None
+
+    def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        """
+        Await up to max_items stimuli for this replica: first any entries
+        reclaimed from stalled replicas, then new entries (waiting up to
+        timeout only if there is nothing else).
+        """
+        if not self.client:
+            time.sleep(timeout)
+            return []
+
+        try:
+            self._ensure_group(channel)
+            entries = self._reclaim(channel, max_items)
+            if len(entries) < max_items:
+                block = None if entries or not timeout else int(timeout * 1000)
+                response = self.client.xreadgroup(
+                    self.group, self.consumer, {channel: ">"}, count=max_items - len(entries), block=block
+                )
+                streams = response.items() if isinstance(response, dict) else response or []  # RESP3 / RESP2
+                for _, stream_entries in streams:
+                    entries.extend(stream_entries)
+        except Exception as e:
+            if "NOGROUP" in str(e):  # stream was deleted; recreate the group next time
+                self._groups.discard(channel)
+            return []
+
+        stimuli, malformed = [], []
+        for entry_id, fields in entries:
+            try:
+                payload = self._decode_payload(fields[_FIELD])
+                payload[DELIVERY_KEY] = _text(entry_id)
+                stimuli.append(self._apply_receive_middleware(channel, payload))
+            except Exception as e:
+                print(f"[RedisStreamThalamus] [WARN] Dead-lettered malformed stimulus: {e}")
+                malformed.append((entry_id, fields or {}))
+        if malformed:
+            self._dead_letter(channel, malformed, deliveries=1)
+        return stimuli
+
+    def _reclaim(self, channel: str, count: int) -> List[Tuple[bytes, Dict[bytes, bytes]]]:
+        """
+        Claim entries other replicas left pending for claim_idle seconds.
+        Entries out of deliveries are dead-lettered instead. Runs at most
+        every claim_idle / 2 seconds per channel.
+        """
+        now = time.monotonic()
+        if now < self._next_reclaim.get(channel, 0.0):
+            return []
+        self._next_reclaim[channel] = now + self.claim_idle / 2
+
+        idle_ms = int(self.claim_idle * 1000)
+        stale = self._stale_pending(channel, idle_ms, count)
+        if not stale:
+            return []
+        # XCLAIM is atomic: if two replicas race, only one gets each entry
+        claimed = self.client.xclaim(channel, self.group, self.consumer, idle_ms, [p["message_id"] for p in stale])
+        deliveries = {p["message_id"]: p["times_delivered"] for p in stale}
+        live, dead, deleted = [], [], []
+        for entry_id, fields in filter(None, claimed):
+            if not fields:
+                deleted.append(entry_id)  # trimmed away before it was handled
+            elif deliveries.get(entry_id, 0) >= self.max_deliveries:
+                dead.append((entry_id, fields))
+            else:
+                live.append((entry_id, fields))
+        if deleted:
+            self.client.xack(channel, self.group, *deleted)
+        if dead:
+            self._dead_letter(channel, dead, deliveries=self.max_deliveries)
+        if live:
+            print(f"[RedisStreamThalamus] [!] Reclaimed {len(live)} stalled stimuli on '{channel}'")
+        return live
+
+    def _stale_pending(self, channel: str, idle_ms: int, count: int) -> List[Dict[str, Any]]:
+        """
+        Up to count pending entries idle for at least idle_ms, oldest first,
+        wherever they sit in the pending list: entries held by live replicas
+        ahead of them do not hide them.
+        """
+        from redis.exceptions import ResponseError
+        if self._pending_idle_filter:
+            try:
+                return self.client.xpending_range(
+                    channel, self.group, min="-", max="+", count=count, idle=idle_ms
+                )
+            except ResponseError:
+                self._pending_idle_filter = False  # Redis < 6.2: filter client-side
+
+        stale, start = [], "-"
+        page_size = max(count, 100)
+        while len(stale) < count:
+            page = self.client.xpending_range(channel, self.group, min=start, max="+", count=page_size)
+            stale.extend(p for p in page if p["time_since_delivered"] >= idle_ms)
+            if len(page) < page_size:
+                break
+            start = _next_id(page[-1]["message_id"])
+        return stale[:count]
+
+    def _dead_letter(self, channel: str, entries: List[Tuple[bytes, Dict[bytes, bytes]]], deliveries: int) -> None:
+        """Move entries to the channel's dead-letter stream and acknowledge them."""
+        pipe = self.client.pipeline(transaction=False)
+        for entry_id, fields in entries:
+            pipe.xadd(channel + DEAD_LETTER_SUFFIX, {
+                _FIELD: fields.get(_FIELD, b""),
+                b"id": entry_id,
+                b"group": self.group,
+                b"deliveries": deliveries,
+            }, maxlen=self.maxlen, approximate=True)
+        pipe.xack(channel, self.group, *[entry_id for entry_id, _ in entries])
+        pipe.execute()
+
+    def acknowledge(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """Confirm handled stimuli (XACK); unacknowledged ones are eventually redelivered."""
+        ids = [s[DELIVERY_KEY] for s in stimuli if s.get(DELIVERY_KEY)]
+        if not ids or not self.client:
+            return 0
+        try:
+            return self.client.xack(channel, self.group, *ids)
+        except Exception as e:
+            print(f"[RedisStreamThalamus] [WARN] Acknowledge failed: {e}")
+            return 0
+
+    # --- Introspection ---
+
+    def get_lag(self, channel: str) -> Dict[str, Any]:
+        """
+        Backlog of this replica's group on a channel:
+            lag:         entries not yet delivered to any replica
+                         (None on Redis < 7, which does not track it)
+            pending:     delivered but unacknowledged entries
+            consumers:   per replica, its pending count and idle time (ms)
+            length:      entries held in the stream
+            dead_letters: entries in the dead-letter stream
+        """
+        self._ensure_group(channel)
+        group = next(
+            (g for g in self.client.xinfo_groups(channel) if _text(g["name"]) == self.group), {}
+        )
+        consumers = {
+            _text(c["name"]): {"pending": c["pending"], "idle_ms": c["idle"]}
+            for c in self.client.xinfo_consumers(channel, self.group)
+        }
+        return {
+            "group": self.group,
+            "lag": group.get("lag"),
+            "pending": group.get("pending", 0),
+            "consumers": consumers,
+            "length": self.client.xlen(channel),
+            "dead_letters": self.client.xlen(channel + DEAD_LETTER_SUFFIX),
+        }
+
+    def depth(self, channel: str) -> Optional[int]:
+        """
+        Outstanding work for the group: undelivered plus unacknowledged
+        entries, or None if Redis is unreachable.
+        """
+        try:
+            lag = self.get_lag(channel)
+        except Exception:
+            return None
+        if lag["lag"] is None:
+            return lag["length"]
+        return lag["lag"] + lag["pending"]
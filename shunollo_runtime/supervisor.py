@@ -0,0 +1,461 @@
+"""
+AgentSupervisor - The Autonomic Ganglion
+----------------------------------------
+Biological Role: Ganglia keep peripheral circuits firing without the cortex:
+they recruit more motor units under load, release them at rest, and route
+around a neuron that has died.
+Technical Role: Runs pools of agent worker processes on one node.
+
+    pools:     one per agent class; each worker is a process running
+               BaseAgent.run on its own Thalamus connection
+    channels:  a pool's input channels are dealt to its workers round-robin
+    restarts:  a worker that exits without being asked to is restarted, with
+               exponential backoff so a crash loop cannot spin the node
+    health:    workers report BaseAgent.get_statistics() every
+               report_interval; get_statistics() aggregates throughput and
+               latency per pool and per worker
+    scaling:   each supervise() tick resizes a pool toward
+               ceil(depth / target_depth) workers within [min_workers,
+               max_workers]; it grows at once but shrinks one worker per
+               scale_down_ticks consecutive low readings
+
+The Thalamus must be shared across processes (SharedMemoryThalamus,
+RedisThalamus or RedisStreamThalamus). thalamus_factory is called in every
+worker, and once in the supervisor to read queue depth; scaling needs a bus
+whose depth() is known.
+"""
+import math
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from .agents import BaseAgent
+from .interfaces import AbstractThalamus
+
+__all__ = ['AgentPool', 'AgentSupervisor']
+
+
+def _worker_main(
+    thalamus_factory: Callable[[], AbstractThalamus],
+    agent_class: Type[BaseAgent],
+    agent_kwargs: Dict[str, Any],
+    name: str,
+    role: str,
+    channel: str,
+    output_channel: str,
+    batch_size: int,
+    stop_event: Any,
+    reports: Any,
+    report_interval: float
+) -> None:
+    """Worker process body: run one agent and report its statistics until told to stop."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the supervisor handles Ctrl-C
+    thalamus = thalamus_factory()
+    agent = agent_class(
+        name=name, role=role, thalamus=thalamus,
+        input_channel=channel, output_channel=output_channel, **agent_kwargs
+    )
+
+    def report() -> None:
+        while not stop_event.wait(report_interval):
+            reports.put(dict(agent.get_statistics(), pid=os.getpid()))
+        agent.stop()
+
+    threading.Thread(target=report, daemon=True, name=f"{name}-report").start()
+    agent.on_start()
+    try:
+        agent.run(batch_size=batch_size)
+    finally:
+        agent.on_stop()
+        reports.put(dict(agent.get_statistics(), pid=os.getpid()))
+        close = getattr(thalamus, "close", None)
+        if close:
+            close()
+
+
+class _Worker:
+    """Supervisor-side record of one worker slot."""
+
+    def __init__(self, slot: int, channel: str):
+        self.slot = slot
+        self.channel = channel
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.stop_event = None
+        self.stopping = False
+        self.started = 0.0
+        self.crashes = 0           # consecutive; reset once a worker stays up
+        self.restart_at = 0.0      # backoff deadline after a crash
+        self.report: Optional[Dict[str, Any]] = None
+        self.throughput = 0.0      # stimuli/s between the last two reports
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.is_alive()
+
+
+@dataclass
+class AgentPool:
+    """Worker processes for one agent class (see AgentSupervisor.add_pool)."""
+
+    name: str
+    agent_class: Type[BaseAgent]
+    channels: Tuple[str, ...]
+    output_channel: str
+    role: str
+    min_workers: int
+    max_workers: int
+    target_depth: int
+    batch_size: int
+    agent_kwargs: Dict[str, Any] = field(default_factory=dict)
+    desired: int = 0
+    workers: Dict[int, _Worker] = field(default_factory=dict)
+    draining: List[_Worker] = field(default_factory=list)  # scaled down, not yet exited
+    restarts: int = 0
+    depth: Optional[int] = None
+    low_ticks: int = 0
+    retired: Dict[str, float] = field(default_factory=lambda: {"processed": 0, "failed": 0})
+
+
+class AgentSupervisor:
+    """
+    Launches, restarts and scales pools of agent worker processes.
+
+    Usage:
+        supervisor = AgentSupervisor(lambda: SharedMemoryThalamus(name="node"))
+        supervisor.add_pool("analyzers", MyAgent, channels=["stimuli"], max_workers=8)
+        supervisor.run()  # until stop() or Ctrl-C
+    """
+
+    def __init__(
+        self,
+        thalamus_factory: Callable[[], AbstractThalamus],
+        report_interval: float = 1.0,
+        restart_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        scale_down_ticks: int = 5,
+        start_method: Optional[str] = None
+    ):
+        """
+        Args:
+            thalamus_factory: Builds a Thalamus connection (called in each process;
+                              must be picklable for the "spawn" start method)
+            report_interval: Seconds between worker statistics reports
+            restart_backoff: Delay before the first restart of a crashed worker
+                             (doubles per consecutive crash)
+            max_backoff: Cap on the restart delay
+            scale_down_ticks: Consecutive low-depth ticks before a pool shrinks
+            start_method: multiprocessing start method (None for the platform default)
+
+        Raises:
+            ValueError: If an interval or count is not positive
+        """
+        if report_interval <= 0 or restart_backoff <= 0 or max_backoff <= 0:
+            raise ValueError("report_interval, restart_backoff and max_backoff must be positive")
+        if scale_down_ticks <= 0:
+            raise ValueError("scale_down_ticks must be positive")
+        self.thalamus_factory = thalamus_factory
+        self.report_interval = report_interval
+        self.restart_backoff = restart_backoff
+        self.max_backoff = max_backoff
+        self.scale_down_ticks = scale_down_ticks
+        self._ctx = multiprocessing.get_context(start_method)
+        self._reports = self._ctx.Queue()
+        self._pools: Dict[str, AgentPool] = {}
+        self._thalamus: Optional[AbstractThalamus] = None
+        self._lock = threading.RLock()
+        self._running = False
+
+    def __repr__(self) -> str:
+        return f"AgentSupervisor(pools={list(self._pools)}, running={self._running})"
+
+    # --- Configuration ---
+
+    def add_pool(
+        self,
+        name: str,
+        agent_class: Type[BaseAgent],
+        channels: Optional[List[str]] = None,
+        output_channel: str = "qualia",
+        workers: Optional[int] = None,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        target_depth: int = 1000,
+        batch_size: int = 64,
+        role: Optional[str] = None,
+        **agent_kwargs: Any
+    ) -> AgentPool:
+        """
+        Register a pool of workers for one agent class.
+
+        Args:
+            name: Pool name (workers are named "<name>-<slot>")
+            agent_class: BaseAgent subclass, constructed in each worker as
+                         agent_class(name=, role=, thalamus=, input_channel=,
+                         output_channel=, **agent_kwargs)
+            channels: Input channels, dealt to workers round-robin
+            output_channel: Where every worker publishes results
+            workers: Workers to start with (defaults to min_workers)
+            min_workers, max_workers: Scaling bounds (max defaults to the CPU count).
+                         The floor is raised to one worker per channel.
+            target_depth: Queued stimuli per worker the scaler aims for
+            batch_size: Stimuli per worker volley (BaseAgent.run batch_size)
+            role: Agent role (defaults to the pool name)
+
+        Raises:
+            ValueError: If the name is taken or the bounds are inconsistent
+        """
+        channels = tuple(channels or ["stimuli"])
+        max_workers = max_workers or os.cpu_count() or 1
+        if min_workers > 0:
+            min_workers = max(min_workers, len(channels))  # every channel needs a consumer
+        workers = min_workers if workers is None else workers
+        if name in self._pools:
+            raise ValueError(f"Pool '{name}' already exists")
+        if not 0 < min_workers <= workers <= max_workers:
+            raise ValueError("Need 0 < min_workers <= workers <= max_workers")
+        if target_depth <= 0 or batch_size <= 0:
+            raise ValueError("target_depth and batch_size must be positive")
+        pool = AgentPool(
+            name=name,
+            agent_class=agent_class,
+            channels=channels,
+            output_channel=output_channel,
+            role=role or name,
+            min_workers=min_workers,
+            max_workers=max_workers,
+            target_depth=target_depth,
+            batch_size=batch_size,
+            agent_kwargs=agent_kwargs,
+            desired=workers,
+        )
+        with self._lock:
+            self._pools[name] = pool
+            if self._running:
+                self._resize(pool)
+        return pool
+
+    # --- Lifecycle ---
+
+    def start(self) -> None:
+        """Launch every pool at its initial size."""
+        with self._lock:
+            self._running = True
+            for pool in self._pools.values():
+                self._resize(pool)
+
+    def run(self, duration: Optional[float] = None, interval: float = 1.0) -> None:
+        """
+        Start, then supervise every interval seconds until stop(), Ctrl-C or
+        duration elapses. Workers are stopped on the way out.
+        """
+        self.start()
+        deadline = None if duration is None else time.monotonic() + duration
+        try:
+            while self._running and (deadline is None or time.monotonic() < deadline):
+                time.sleep(interval)
+                self.supervise()
+        except KeyboardInterrupt:
+            print("[AgentSupervisor] Interrupted, stopping workers")
+        finally:
+            self.stop()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask every worker to finish its volley and exit; terminate stragglers."""
+        with self._lock:
+            self._running = False
+            workers = [w for pool in self._pools.values() for w in (*pool.workers.values(), *pool.draining)]
+            for worker in workers:
+                if worker.alive:
+                    worker.stopping = True
+                    worker.stop_event.set()
+            deadline = time.monotonic() + timeout
+            for worker in workers:
+                if worker.process is not None:
+                    # A worker cannot exit until its final report reaches the
+                    # pipe, so keep the reports queue drained while waiting
+                    while worker.process.is_alive() and time.monotonic() < deadline:
+                        worker.process.join(min(0.05, max(0.0, deadline - time.monotonic())))
+                        self._drain_reports()
+                    if worker.process.is_alive():
+                        print(f"[AgentSupervisor] [WARN] Terminating unresponsive worker pid {worker.process.pid}")
+                        worker.process.terminate()
+                        worker.process.join(1.0)
+            self._drain_reports()
+            for pool in self._pools.values():
+                for worker in (*pool.workers.values(), *pool.draining):
+                    self._retire(pool, worker)
+                pool.workers.clear()
+                pool.draining.clear()
+            close = getattr(self._thalamus, "close", None)
+            if close:
+                close()
+            self._thalamus = None
+
+    # --- Supervision ---
+
+    def supervise(self) -> None:
+        """One tick: collect reports, restart crashed workers, rescale pools."""
+        with self._lock:
+            if not self._running:
+                return
+            self._drain_reports()
+            now = time.monotonic()
+            for pool in self._pools.values():
+                for worker in [w for w in pool.draining if not w.alive]:
+                    self._retire(pool, worker)
+                    pool.draining.remove(worker)
+                self._restart_crashed(pool, now)
+                self._autoscale(pool)
+                self._resize(pool)
+
+    def _drain_reports(self) -> None:
+        by_pid = {
+            worker.process.pid: worker
+            for pool in self._pools.values() for worker in (*pool.workers.values(), *pool.draining)
+            if worker.process is not None
+        }
+        while True:
+            try:
+                report = self._reports.get_nowait()
+            except queue.Empty:
+                return
+            worker = by_pid.get(report.get("pid"))
+            if worker is None:
+                continue  # from a worker already retired
+            previous = worker.report
+            if previous is not None and report["timestamp"] > previous["timestamp"]:
+                elapsed = report["timestamp"] - previous["timestamp"]
+                worker.throughput = (report["processed"] - previous["processed"]) / elapsed
+            worker.report = report
+
+    def _restart_crashed(self, pool: AgentPool, now: float) -> None:
+        for worker in pool.workers.values():
+            if worker.process is None or worker.alive or worker.stopping:
+                continue
+            if worker.restart_at == 0.0:
+                # Newly found dead: a worker that stayed up a while is not crash-looping
+                if now - worker.started > self.max_backoff:
+                    worker.crashes = 0
+                worker.crashes += 1
+                worker.restart_at = now + min(self.restart_backoff * 2 ** (worker.crashes - 1), self.max_backoff)
+                print(
+                    f"[AgentSupervisor] [X] Worker {pool.name}-{worker.slot} exited with code "
+                    f"{worker.process.exitcode}; restarting in {worker.restart_at - now:.1f}s"
+                )
+            if now >= worker.restart_at:
+                self._retire(pool, worker)
+                pool.restarts += 1
+                self._launch(pool, worker)
+
+    def _autoscale(self, pool: AgentPool) -> None:
+        if self._thalamus is None:
+            self._thalamus = self.thalamus_factory()
+        try:
+            depths = [self._thalamus.depth(channel) for channel in pool.channels]
+        except Exception as e:
+            print(f"[AgentSupervisor] [X] Depth read failed for {pool.name}: {e}")
+            depths = [None]
+        if any(depth is None for depth in depths):
+            pool.depth = None
+            return  # the bus cannot tell: keep the configured size
+        pool.depth = sum(depths)
+        wanted = min(pool.max_workers, max(pool.min_workers, math.ceil(pool.depth / pool.target_depth)))
+        if wanted > pool.desired:
+            print(f"[AgentSupervisor] [!] Scaling {pool.name} up to {wanted} workers (depth {pool.depth})")
+            pool.desired, pool.low_ticks = wanted, 0
+        elif wanted < pool.desired:
+            pool.low_ticks += 1
+            if pool.low_ticks >= self.scale_down_ticks:
+                pool.desired, pool.low_ticks = pool.desired - 1, 0
+                print(f"[AgentSupervisor] Scaling {pool.name} down to {pool.desired} workers (depth {pool.depth})")
+        else:
+            pool.low_ticks = 0
+
+    def _resize(self, pool: AgentPool) -> None:
+        """Start or stop workers until the pool has `desired` of them."""
+        while len(pool.workers) < pool.desired:
+            slot = next(i for i in range(pool.desired) if i not in pool.workers)
+            worker = pool.workers[slot] = _Worker(slot, pool.channels[slot % len(pool.channels)])
+            self._launch(pool, worker)
+        while len(pool.workers) > pool.desired:
+            worker = pool.workers.pop(max(pool.workers))
+            worker.stopping = True
+            worker.stop_event.set()
+            # Retired once it exits: it finishes its volley while we carry on
+            pool.draining.append(worker)
+
+    def _launch(self, pool: AgentPool, worker: _Worker) -> None:
+        worker.stop_event = self._ctx.Event()
+        worker.process = self._ctx.Process(
+            target=_worker_main,
+            args=(
+                self.thalamus_factory, pool.agent_class, pool.agent_kwargs,
+                f"{pool.name}-{worker.slot}", pool.role, worker.channel, pool.output_channel,
+                pool.batch_size, worker.stop_event, self._reports, self.report_interval,
+            ),
+            name=f"{pool.name}-{worker.slot}",
+            daemon=True,
+        )
+        worker.process.start()
+        worker.started = time.monotonic()
+        worker.stopping = False
+        worker.restart_at = 0.0
+        worker.throughput = 0.0
+
+    def _retire(self, pool: AgentPool, worker: _Worker) -> None:
+        """Fold a finished worker's last counters into the pool totals."""
+        if worker.report is not None:
+            pool.retired["processed"] += worker.report["processed"]
+            pool.retired["failed"] += worker.report["failed"]
+            worker.report = None
+        if worker.process is not None and not worker.process.is_alive():
+            worker.process.join()  # reap
+
+    # --- Introspection ---
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Per pool: live and desired workers, restarts, last observed depth,
+        processed/failed totals (including retired workers), throughput
+        (stimuli/s, summed over workers), latency_ms (processed-weighted mean,
+        worst p99) and per-worker detail.
+        """
+        with self._lock:
+            self._drain_reports()
+            now = time.time()
+            stats = {}
+            for pool in self._pools.values():
+                reports = [w.report for w in pool.workers.values() if w.report is not None]
+                reports += [w.report for w in pool.draining if w.report is not None]
+                weight = sum(r["processed"] for r in reports)
+                stats[pool.name] = {
+                    "workers": sum(w.alive for w in pool.workers.values()),
+                    "desired": pool.desired,
+                    "restarts": pool.restarts,
+                    "depth": pool.depth,
+                    "processed": pool.retired["processed"] + weight,
+                    "failed": pool.retired["failed"] + sum(r["failed"] for r in reports),
+                    "throughput": sum(w.throughput for w in pool.workers.values() if w.alive),
+                    "latency_ms": {
+                        "mean": sum(r["latency_ms"]["mean"] * r["processed"] for r in reports) / weight if weight else 0.0,
+                        "p99": max((r["latency_ms"]["p99"] for r in reports), default=0.0),
+                    },
+                    "per_worker": {
+                        f"{pool.name}-{w.slot}": {
+                            "pid": w.process.pid if w.process else None,
+                            "alive": w.alive,
+                            "channel": w.channel,
+                            "processed": w.report["processed"] if w.report else 0,
+                            "throughput": w.throughput,
+                            "latency_ms": w.report["latency_ms"] if w.report else None,
+                            "report_age": now - w.report["timestamp"] if w.report else None,
+                        }
+                        for w in sorted(pool.workers.values(), key=lambda w: w.slot)
+                    },
+                }
+            return stats
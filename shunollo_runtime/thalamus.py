@@ -4,18 +4,28 @@ RedisThalamus - Reference Implementation
 The default, Open Source implementation of the Thalamus using Redis.
 """
 import os
-import json
 import time
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Union
 
+from .codecs import Codec
 from .interfaces import AbstractThalamus, ThalamusMiddleware
 
+# Values per LPUSH in publish_many (bounds the size of one command)
+PUBLISH_CHUNK = 1000
+
 
 class RedisThalamus(AbstractThalamus):
     """Redis-backed implementation of the Thalamus."""
 
-    def __init__(self, host: str = None, port: int = None, db: int = 0, middleware: List[ThalamusMiddleware] = None):
-        super().__init__(middleware=middleware)
+    def __init__(
+        self,
+        host: str = None,
+        port: int = None,
+        db: int = 0,
+        middleware: List[ThalamusMiddleware] = None,
+        codec: Union[str, Codec] = None
+    ):
+        super().__init__(middleware=middleware, codec=codec)
         # Defer import to prevent hard dependency if not using Redis
         import redis
 
@@ -23,6 +33,7 @@ class RedisThalamus(AbstractThalamus):
         self.port = int(port or os.getenv("SHUNOLLO_REDIS_PORT") or os.getenv("REDIS_PORT", 6379))
         self.db = db
         self._pool = None
+        self._rpop_count = True  # server supports RPOP with a count
         self._client: Optional[redis.Redis] = None
         self._connect()
 
@@ -65,7 +76,7 @@ class RedisThalamus(AbstractThalamus):
             if "timestamp" not in payload:
                 payload["timestamp"] = time.time()
 
-            self.client.lpush(channel, json.dumps(payload))
+            self.client.lpush(channel, self._encode_payload(payload))
             return True
         except Exception as e:
             print(f"[RedisThalamus] [X] Signal Lost: {e}")
@@ -81,12 +92,89 @@ class RedisThalamus(AbstractThalamus):
             item = self.client.brpop(channel, timeout=timeout)
             if item:
                 _, data = item
-                payload = json.loads(data)
+                payload = self._decode_payload(data)
                 return self._apply_receive_middleware(channel, payload)
         except Exception:
             pass
         return None
 
+    def publish_many(self, channel: str, stimuli: List[Dict[str, Any]]) -> int:
+        """Relay a volley of stimuli with one pipelined round trip."""
+        if not self.client or not stimuli:
+            return 0
+
+        try:
+            payloads = []
+            for stimulus in stimuli:
+                payload = self._apply_publish_middleware(channel, stimulus)
+                if "timestamp" not in payload:
+                    payload["timestamp"] = time.time()
+                payloads.append(self._encode_payload(payload))
+
+            # One LPUSH carries many values; chunk to keep commands bounded.
+            # Values are pushed left to right, so brpop/rpop stay FIFO.
+            pipe = self.client.pipeline(transaction=False)
+            for start in range(0, len(payloads), PUBLISH_CHUNK):
+                pipe.lpush(channel, *payloads[start:start + PUBLISH_CHUNK])
+            pipe.execute()
+            return len(payloads)
+        except Exception as e:
+            print(f"[RedisThalamus] [X] Volley Lost: {e}")
+            return 0
+
+    def consume_many(self, channel: str, max_items: int = 64, timeout: int = 1) -> List[Dict[str, Any]]:
+        """
+        Await up to max_items stimuli: RPOP with a count takes whatever is
+        queued in one round trip; only an empty queue falls back to brpop.
+        """
+        if not self.client:
+            time.sleep(timeout)
+            return []
+
+        try:
+            raw = self._pop_many(channel, max_items)
+            if not raw:
+                item = self.client.brpop(channel, timeout=timeout)
+                if not item:
+                    return []
+                raw = [item[1]]
+                if max_items > 1:
+                    try:
+                        raw.extend(self._pop_many(channel, max_items - 1))
+                    except Exception:
+                        pass  # brpop already took one off the queue: deliver it
+        except Exception:
+            return []
+
+        stimuli = []
+        for data in raw:
+            try:
+                stimuli.append(self._apply_receive_middleware(channel, self._decode_payload(data)))
+            except Exception as e:
+                print(f"[RedisThalamus] [WARN] Dropped malformed stimulus: {e}")
+        return stimuli
+
+    def _pop_many(self, channel: str, count: int) -> List[bytes]:
+        """Non-blocking pop of up to count raw messages (oldest first)."""
+        from redis.exceptions import ResponseError
+        if self._rpop_count:
+            try:
+                return self.client.rpop(channel, count) or []
+            except ResponseError:
+                # RPOP <key> <count> needs Redis >= 6.2; pipeline single pops instead
+                self._rpop_count = False
+        pipe = self.client.pipeline(transaction=False)
+        for _ in range(count):
+            pipe.rpop(channel)
+        return [data for data in pipe.execute() if data is not None]
+
+    def depth(self, channel: str) -> Optional[int]:
+        """Stimuli waiting on a pathway (LLEN), or None if Redis is unreachable."""
+        try:
+            return self.client.llen(channel)
+        except Exception:
+            return None
+
     def broadcast_stimulus(self, channel: str, stimulus: Dict[str, Any]) -> bool:
         """Broadcast a signal to all listeners on a synaptic pathway (Pub/Sub)."""
         if not self.client:
@@ -97,7 +185,7 @@ class RedisThalamus(AbstractThalamus):
             if "timestamp" not in payload:
                 payload["timestamp"] = time.time()
 
-            self.client.publish(channel, json.dumps(payload))
+            self.client.publish(channel, self._encode_payload(payload))
             return True
         except Exception as e:
             print(f"[RedisThalamus] [X] Broadcast Failed: {e}")
@@ -108,8 +196,8 @@ class RedisThalamus(AbstractThalamus):
 _thalamus_instance: Optional[RedisThalamus] = None
 
 
-def get_thalamus(middleware: List[ThalamusMiddleware] = None) -> RedisThalamus:
+def get_thalamus(middleware: List[ThalamusMiddleware] = None, codec: Union[str, Codec] = None) -> RedisThalamus:
     global _thalamus_instance
     if not _thalamus_instance:
-        _thalamus_instance = RedisThalamus(middleware=middleware)
+        _thalamus_instance = RedisThalamus(middleware=middleware, codec=codec)
     return _thalamus_instance
@@ -0,0 +1,129 @@
+import math
+
+import numpy as np
+import pytest
+
+from shunollo_core.domain_adapter import (
+    DOMAIN_CONFIGS,
+    QUALIA_DTYPE,
+    SCHEME_CONSTANT,
+    SCHEME_LOG,
+    DomainConfig,
+    UniversalAdapter,
+    normalize_value,
+)
+
+
+def _scalar_rows(adapter, data, n):
+    return [adapter.process({k: float(v[i]) for k, v in data.items()}) for i in range(n)]
+
+
+@pytest.mark.parametrize("scheme", ["unipolar", "bipolar", "log", "unbounded", "unknown"])
+@pytest.mark.parametrize("bounds", [(0, 100), (-10, 10), (5, 5), (1, 1e9), (10, 1)])
+def test_normalize_block_matches_scalar(scheme, bounds):
+    values = np.array([-1e3, -1.0, 0.0, 1e-12, 0.5, 5.0, 9.99, 50.0, 1e10, math.nan])
+    expected = [normalize_value(v, *bounds, scheme) for v in values]
+    plan = DomainConfig(name="x", bounds={"x": bounds}, schemes={"x": scheme}).plan(("x",))
+    np.testing.assert_allclose(plan.normalize_block(values[:, np.newaxis])[:, 0], expected, rtol=1e-12, atol=1e-15)
+
+
+@pytest.mark.parametrize("domain", sorted(DOMAIN_CONFIGS) + ["generic"])
+def test_process_batch_matches_process(domain):
+    rng = np.random.default_rng(7)
+    reference = UniversalAdapter(domain)
+    metrics = list(reference.config.bounds) or ["a", "b", "c", "d"]
+    data = {metric: rng.uniform(-0.2, 1.2, 64) * reference.config.bounds.get(metric, (0, 100))[1] for metric in metrics}
+
+    batch = UniversalAdapter(domain).process_batch(data)
+    assert batch.dtype == QUALIA_DTYPE and batch.shape == (64,)
+    for row, qualia in zip(batch, _scalar_rows(reference, data, 64)):
+        for name in QUALIA_DTYPE.names:
+            assert row[name] == pytest.approx(qualia[name], rel=1e-9, abs=1e-12), name
+
+
+def test_nan_matches_process():
+    adapter = UniversalAdapter("network")
+    sample = {"bytes": math.nan, "packets": 5000.0, "latency_ms": 100.0, "errors": math.nan}
+    qualia = adapter.process(sample)
+    row = adapter.process_batch({k: np.array([v]) for k, v in sample.items()})[0]
+    assert qualia["energy"] == 1.0 and qualia["distortion_detected"]
+    for name in QUALIA_DTYPE.names:
+        assert row[name] == pytest.approx(qualia[name], rel=1e-12), name
+
+
+def test_two_dimensional_input_and_custom_normalizers():
+    config = DomainConfig(
+        name="custom",
+        bounds={"a": (0, 10)},
+        schemes={"b": "log"},
+        exponents={"a": 2.0},
+        normalizers={"c": lambda v: 1.0 / (1.0 + math.exp(-v))},
+    )
+    block = np.array([[1.0, 10.0, 0.0], [9.0, 1000.0, 3.0], [5.0, 0.0, -2.0]])
+    batch = UniversalAdapter(custom_config=config).process_batch(block, metrics=["a", "b", "c"])
+    reference = UniversalAdapter(custom_config=config)
+    for row, sample in zip(batch, block):
+        qualia = reference.process(dict(zip("abc", sample)))
+        assert row["energy"] == pytest.approx(qualia["energy"])
+        assert row["dissonance"] == pytest.approx(qualia["dissonance"])
+        assert row["distortion_detected"] == qualia["distortion_detected"]
+
+    names, normalized, perceived = reference.perceive_batch(block, metrics=["a", "b", "c"])
+    assert names == ["a", "b", "c"]
+    np.testing.assert_allclose(perceived[:, 0], normalized[:, 0] ** 2)
+
+
+def test_out_buffer_and_history():
+    adapter = UniversalAdapter("network")
+    out = np.empty(200, dtype=QUALIA_DTYPE)
+    frame = {"bytes": np.linspace(-9e6, 1e6, 200), "latency_ms": np.full(200, 100.0)}
+    assert adapter.process_batch(frame, out=out) is out
+    assert len(adapter._history) == 100
+    assert adapter.get_trend("energy") == "increasing"
+    with pytest.raises(ValueError):
+        adapter.process_batch(frame, out=np.empty(10, dtype=QUALIA_DTYPE))
+
+
+def test_invalid_batches():
+    adapter = UniversalAdapter("network")
+    with pytest.raises(ValueError):
+        adapter.process_batch(np.zeros((4, 2)))  # no metric names
+    with pytest.raises(ValueError):
+        adapter.process_batch(np.zeros(4), metrics=["bytes"])
+    with pytest.raises(ValueError):
+        adapter.process_batch({"bytes": np.zeros(4), "errors": np.zeros(3)})
+    assert adapter.process_batch({"bytes": np.zeros(0)}).shape == (0,)
+
+
+@pytest.mark.parametrize("scheme", ["unipolar", "bipolar", "log", "unbounded", "unknown"])
+@pytest.mark.parametrize("bounds", [(0, 100), (-10, 10), (5, 5), (1, 1e9), (10, 1)])
+def test_compiled_scalar_path_is_exact(scheme, bounds):
+    adapter = UniversalAdapter(custom_config=DomainConfig(name="x", bounds={"x": bounds}, schemes={"x": scheme}))
+    for value in (-1e3, -1.0, 0.0, 1e-12, 0.5, 5.0, 9.99, 50.0, 1e10):
+        assert adapter.normalize("x", value) == normalize_value(value, *bounds, scheme)
+    got, expected = adapter.normalize("x", math.nan), normalize_value(math.nan, *bounds, scheme)
+    assert got == expected or (math.isnan(got) and math.isnan(expected))
+
+
+def test_plans_are_compiled_once_and_cached():
+    config = DomainConfig(
+        name="plans",
+        bounds={"volume": (1, 1e9), "flat": (3, 3), "load": (0, 10)},
+        schemes={"volume": "log"},
+        exponents={"load": 2.0},
+    )
+    declared = config.plan(["volume", "flat", "load"])
+    assert ("volume", "flat", "load") in config._plans  # compiled on construction
+    assert config.plan(("volume", "flat", "load")) is declared
+    assert list(declared.codes[:2]) == [SCHEME_LOG, SCHEME_CONSTANT]
+    assert list(declared.exponents) == [1.0, 1.0, 2.0]
+
+    adapter = UniversalAdapter(custom_config=config)
+    assert adapter.process({"load": 5.0})["perceived"]["load"] == 0.25
+    config.bounds["load"] = (0, 5)
+    config.recompile()
+    assert adapter.process({"load": 5.0})["perceived"]["load"] == 1.0
+
+    for i in range(DomainConfig.MAX_PLANS + 10):
+        config.plan((f"m{i}",))
+    assert len(config._plans) == DomainConfig.MAX_PLANS
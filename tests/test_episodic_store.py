@@ -0,0 +1,153 @@
+"""
+test_episodic_store.py - Unit Tests for the Columnar Episodic Store
+
+Tests the binary long-term episode log:
+- Append/tail round trip across segment boundaries
+- Vectorized normalization matching ShunolloSignal.to_vector()
+- Torn-append recovery and JSONL migration
+- Hippocampus with store="columnar"
+"""
+import json
+import os
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from shunollo_core.models import ShunolloSignal
+from shunollo_core.memory.hippocampus import Hippocampus
+from shunollo_core.memory import episodic_store
+from shunollo_core.memory.episodic_store import (
+    ColumnarEpisodicStore, EpisodeCache, migrate_jsonl, normalize_physics
+)
+
+
+def _signals(n, offset=0):
+    return [
+        ShunolloSignal(
+            input_type="sensor",
+            energy=float(i % 10),
+            frequency=440.0 + i,
+            pan=-0.5,
+            metadata={"seq": offset + i}
+        )
+        for i in range(n)
+    ]
+
+
+class TestColumnarEpisodicStore:
+
+    def test_round_trip_across_segments(self, tmp_path):
+        store = ColumnarEpisodicStore(tmp_path, segment_size=8)
+        signals = _signals(20)
+        store.append(signals[:5])
+        store.append(signals[5:])
+
+        assert len(store) == 20
+        assert len(list(tmp_path.glob("*.seg"))) == 3
+
+        restored = store.tail(12).to_signals()
+        assert [s.metadata["seq"] for s in restored] == list(range(8, 20))
+        for original, copy in zip(signals[8:], restored):
+            assert copy.input_type == original.input_type
+            assert copy.timestamp == original.timestamp
+            assert copy.frequency == pytest.approx(original.frequency)
+            assert copy.pan == original.pan
+
+    def test_normalize_matches_to_vector(self, tmp_path):
+        store = ColumnarEpisodicStore(tmp_path)
+        signals = _signals(10) + [ShunolloSignal(energy=50.0, spatial_x=-3.0)]
+        store.append(signals)
+
+        vectors = normalize_physics(store.tail(len(signals)).physics)
+        np.testing.assert_allclose(vectors, [s.to_vector() for s in signals], atol=1e-6)
+
+    def test_reopen_and_torn_append(self, tmp_path):
+        store = ColumnarEpisodicStore(tmp_path, segment_size=16)
+        store.append(_signals(10))
+        # Simulate a crash after the side file was written but before the commit
+        with open(tmp_path / "episodes-000000.meta.jsonl", "a") as f:
+            f.write(json.dumps({"input_type": "torn", "metadata": {}}) + "\n")
+
+        reopened = ColumnarEpisodicStore(tmp_path, segment_size=16)
+        reopened.append(_signals(2, offset=10))
+        assert len(reopened) == 12
+        assert [s.metadata["seq"] for s in reopened.tail(3).to_signals()] == [9, 10, 11]
+
+    def test_tail_maps_columns_and_caches_metadata(self, tmp_path, monkeypatch):
+        store = ColumnarEpisodicStore(tmp_path, segment_size=32)
+        store.append(_signals(10))
+        columns = store.tail(5)
+        if os.name != "nt":  # Windows copies so segments stay deletable
+            assert not columns.physics.flags.owndata and not columns.physics.flags.writeable
+            assert not columns.timestamps.flags.owndata
+
+        opened = []
+
+        def spy_open(path, *args, **kwargs):
+            opened.append(str(path))
+            return open(path, *args, **kwargs)
+
+        # An unchanged side file is not read again
+        monkeypatch.setattr(episodic_store, "open", spy_open, raising=False)
+        store.tail(5)
+        assert not [p for p in opened if p.endswith(".meta.jsonl")]
+
+        store.append(_signals(3, offset=10))
+        assert [s.metadata["seq"] for s in store.tail(6).to_signals()] == list(range(7, 13))
+
+    def test_migrate_jsonl(self, tmp_path):
+        log = tmp_path / "episodic_memory.jsonl"
+        with open(log, "w") as f:
+            for signal in _signals(25):
+                f.write(signal.model_dump_json() + "\n")
+            f.write("not json\n")
+
+        store = ColumnarEpisodicStore(tmp_path / "episodic", segment_size=10)
+        assert migrate_jsonl(log, store, batch_size=7) == 25
+        assert [s.metadata["seq"] for s in store.tail(25).to_signals()] == list(range(25))
+
+    def test_clear(self, tmp_path):
+        store = ColumnarEpisodicStore(tmp_path, segment_size=4)
+        store.append(_signals(9))
+        store.clear()
+        assert len(store) == 0
+        assert store.tail(5).to_signals() == []
+
+
+class TestHippocampusColumnar:
+
+    @pytest.fixture
+    def hippo(self, tmp_path):
+        with patch.object(Hippocampus, '__init__', lambda self, **kwargs: None):
+            hippo = Hippocampus.__new__(Hippocampus)
+        hippo.storage_path = tmp_path / "episodic_memory.jsonl"
+        hippo.store = ColumnarEpisodicStore(tmp_path / "episodic", segment_size=32)
+        hippo._cache = None
+        hippo._cache_dirty = True
+        hippo._max_cache_size = 50
+        return hippo
+
+    def test_recall_after_cold_start(self, hippo):
+        hippo.remember_batch(_signals(80))
+        hippo.remember(ShunolloSignal(energy=7.5, hue=0.9, metadata={"seq": 80}))
+        assert not hippo.storage_path.exists()
+
+        hippo._cache = None  # restart: reload from the memory-mapped segments
+        cache = hippo._load_cache()
+        assert isinstance(cache, EpisodeCache)
+        assert len(cache) == 50
+        assert cache[-1].metadata["seq"] == 80
+        assert len(list(hippo.dream(batch_size=5))) == 5
+
+        # Trimming drops loaded rows from the front without materializing them
+        hippo.remember_batch(_signals(10, offset=81))
+        assert len(cache) == 50
+        assert [s.metadata["seq"] for s in cache[:2]] == [41, 42]
+
+        query = ShunolloSignal(energy=7.5, hue=0.9).to_vector()
+        matched, distance = hippo.recall_similar(query, k=1)[0]
+        assert matched.metadata["seq"] == 80
+        assert distance == pytest.approx(0.0, abs=1e-6)
+
+        hippo.clear_memory()
+        assert hippo.recall_similar(query) == []
@@ -2,13 +2,26 @@
 import pytest
 import numpy as np
 import tempfile
+import multiprocessing
+import warnings
 import os
 from shunollo_core.memory.holographic import (
     HolographicMemory,
     DistributedHolographicShard,
+    HolographicBank,
     create_holographic_memory,
     shard_memory,
 )
+from shunollo_core.memory.sharded import ShardedHolographicMemory
+
+
+def _process_exited(pid: int) -> bool:
+    """True once a (Linux) process is gone or a zombie awaiting reaping."""
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().rsplit(")", 1)[1].split()[0] in ("Z", "X")
+    except FileNotFoundError:
+        return True
 
 
 class TestHolographicMemoryInit:
@@ -117,6 +130,294 @@ class TestRecall:
         assert strength == 0.0
 
 
+class TestBatch:
+    """Test batched encode/recall."""
+    
+    def test_encode_batch_matches_per_item(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.standard_normal((8, 40))
+        contexts = rng.standard_normal((8, 40))
+        
+        single = HolographicMemory(size=256)
+        for v, k in zip(vectors, contexts):
+            single.encode(v, context=k)
+        
+        batched = HolographicMemory(size=256)
+        batched.encode_batch(vectors, contexts)
+        
+        assert batched.memory_count == single.memory_count
+        np.testing.assert_allclose(batched.M, single.M, atol=1e-10)
+        assert batched._total_energy == pytest.approx(single._total_energy)
+    
+    def test_encode_batch_matches_per_item_with_decay(self):
+        rng = np.random.default_rng(1)
+        vectors = rng.standard_normal((6, 30))
+        
+        single = HolographicMemory(size=128, decay_rate=0.1, require_context=False)
+        single.encode(np.ones(30))
+        for v in vectors:
+            single.encode(v)
+        
+        batched = HolographicMemory(size=128, decay_rate=0.1, require_context=False)
+        batched.encode(np.ones(30))
+        batched.encode_batch(vectors)
+        
+        np.testing.assert_allclose(batched.M, single.M, atol=1e-10)
+        assert batched._total_energy == pytest.approx(single._total_energy)
+    
+    def test_recall_batch_matches_per_item(self):
+        rng = np.random.default_rng(2)
+        mem = HolographicMemory(size=256)
+        mem.encode_batch(rng.standard_normal((5, 20)), rng.standard_normal((5, 20)))
+        cues = rng.standard_normal((4, 20))
+        
+        recalled, strengths = mem.recall_batch(cues)
+        
+        assert recalled.shape == (4, 256)
+        assert strengths.shape == (4,)
+        for i, cue in enumerate(cues):
+            r, s = mem.recall(cue)
+            np.testing.assert_allclose(recalled[i], r, atol=1e-10)
+            assert strengths[i] == pytest.approx(s)
+    
+    def test_recall_batch_empty_memory(self):
+        mem = HolographicMemory(size=64)
+        recalled, strengths = mem.recall_batch(np.ones((3, 8)))
+        assert recalled.shape == (3, 64)
+        assert np.all(strengths == 0.0)
+    
+    def test_encode_batch_requires_context(self):
+        mem = HolographicMemory(require_context=True)
+        with pytest.raises(ValueError, match="Context key required"):
+            mem.encode_batch(np.ones((2, 5)))
+    
+    def test_encode_batch_row_mismatch_raises(self):
+        mem = HolographicMemory(size=64)
+        with pytest.raises(ValueError, match="rows"):
+            mem.encode_batch(np.ones((3, 5)), np.ones((2, 5)))
+    
+    def test_encode_batch_capacity_warning(self):
+        mem = HolographicMemory(size=16, require_context=False)
+        with pytest.warns(UserWarning, match="capacity"):
+            mem.encode_batch(np.ones((5, 10)))
+        assert mem.memory_count == 5
+
+
+class TestSpectralMode:
+    """Test frequency-domain resident holograms."""
+    
+    @staticmethod
+    def _pair(**kwargs):
+        return (
+            HolographicMemory(size=256, spectral=False, **kwargs),
+            HolographicMemory(size=256, spectral=True, **kwargs),
+        )
+    
+    def test_encode_recall_matches_spatial(self):
+        rng = np.random.default_rng(3)
+        spatial, spectral = self._pair(decay_rate=0.05)
+        for _ in range(4):
+            v, k = rng.standard_normal(30), rng.standard_normal(30)
+            spatial.encode(v, context=k)
+            spectral.encode(v, context=k)
+        
+        np.testing.assert_allclose(spectral.M, spatial.M, atol=1e-10)
+        cue = rng.standard_normal(30)
+        r1, s1 = spatial.recall(cue)
+        r2, s2 = spectral.recall(cue)
+        np.testing.assert_allclose(r2, r1, atol=1e-10)
+        assert s2 == pytest.approx(s1)
+    
+    def test_batch_matches_spatial(self):
+        rng = np.random.default_rng(4)
+        spatial, spectral = self._pair()
+        vectors, contexts = rng.standard_normal((6, 20)), rng.standard_normal((6, 20))
+        spatial.encode_batch(vectors, contexts)
+        spectral.encode_batch(vectors, contexts)
+        
+        r1, s1 = spatial.recall_batch(contexts)
+        r2, s2 = spectral.recall_batch(contexts)
+        np.testing.assert_allclose(r2, r1, atol=1e-10)
+        np.testing.assert_allclose(s2, s1)
+    
+    def test_save_load_interchangeable(self):
+        spatial, spectral = self._pair(require_context=False)
+        spectral.encode(np.arange(20.0))
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "spectral_hologram")
+            spectral.save(path)
+            spatial.load(path)
+        
+        np.testing.assert_allclose(spatial.M, spectral.M, atol=1e-10)
+        assert spatial.memory_count == 1
+    
+    def test_shards_and_statistics(self):
+        spatial, spectral = self._pair(require_context=False)
+        for mem in (spatial, spectral):
+            mem.encode(np.ones(20))
+        
+        for a, b in zip(shard_memory(spatial, 4), shard_memory(spectral, 4)):
+            np.testing.assert_allclose(b.shard, a.shard, atol=1e-10)
+        
+        stats = spectral.get_statistics()
+        assert stats["spectral"] is True
+        assert stats["total_bytes"] == spatial.get_statistics()["total_bytes"]
+    
+    def test_spatial_view_is_read_only(self):
+        _, spectral = self._pair(require_context=False)
+        spectral.encode(np.ones(20))
+        
+        # Edits to a materialized snapshot would be silently lost
+        with pytest.raises(ValueError):
+            spectral.M[:4] = 0.0
+        with pytest.raises(ValueError):
+            spectral.M *= 2.0
+        
+        doubled = spectral.M * 2.0
+        spectral.M = doubled
+        np.testing.assert_allclose(spectral.M, doubled, atol=1e-10)
+
+
+class TestRealMode:
+    """Test rfft/irfft real-valued storage."""
+    
+    @pytest.mark.parametrize("spectral", [False, True])
+    def test_matches_complex_path(self, spectral):
+        rng = np.random.default_rng(5)
+        complex_mem = HolographicMemory(size=255, decay_rate=0.05)
+        real_mem = HolographicMemory(size=255, decay_rate=0.05, real=True, spectral=spectral)
+        vectors, contexts = rng.standard_normal((5, 30)), rng.standard_normal((5, 30))
+        complex_mem.encode(vectors[0], context=contexts[0])
+        real_mem.encode(vectors[0], context=contexts[0])
+        complex_mem.encode_batch(vectors[1:], contexts[1:])
+        real_mem.encode_batch(vectors[1:], contexts[1:])
+        
+        assert not np.iscomplexobj(real_mem.M)
+        np.testing.assert_allclose(real_mem.M, np.real(complex_mem.M), atol=1e-10)
+        assert real_mem._total_energy == pytest.approx(complex_mem._total_energy)
+        
+        r1, s1 = complex_mem.recall(contexts[2])
+        r2, s2 = real_mem.recall(contexts[2])
+        np.testing.assert_allclose(r2, r1, atol=1e-10)
+        assert s2 == pytest.approx(s1)
+    
+    def test_halves_storage(self):
+        complex_mem = HolographicMemory(size=1024)
+        real_mem = HolographicMemory(size=1024, real=True)
+        assert real_mem.get_statistics()["total_bytes"] * 2 == complex_mem.get_statistics()["total_bytes"]
+    
+    def test_legacy_file_upgrades_to_real(self):
+        legacy = HolographicMemory(size=128, require_context=False)
+        legacy.encode(np.arange(16.0))
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "legacy")
+            legacy.save(path)
+            upgraded = HolographicMemory(size=128, real=True)
+            upgraded.load(path)
+            
+            # And back: a real-mode file loads into a complex memory
+            upgraded.save(path)
+            roundtrip = HolographicMemory(size=128)
+            roundtrip.load(path)
+        
+        assert upgraded.M.dtype == np.float64
+        np.testing.assert_allclose(upgraded.M, np.real(legacy.M), atol=1e-10)
+        np.testing.assert_allclose(roundtrip.M, legacy.M, atol=1e-10)
+    
+    def test_load_warns_on_complex_content(self):
+        mem = HolographicMemory(size=32)
+        mem.M = np.full(32, 1.0 + 1.0j)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "complex")
+            mem.save(path)
+            with pytest.warns(UserWarning, match="imaginary"):
+                HolographicMemory(size=32, real=True).load(path)
+
+
+class TestHolographicBank:
+    """Test stacked multi-hologram banks."""
+    
+    def test_invalid_args_raise(self):
+        with pytest.raises(ValueError, match="n_banks must be positive"):
+            HolographicBank(n_banks=0)
+        with pytest.raises(ValueError, match="bank ids"):
+            HolographicBank(n_banks=2, size=64).encode_batch(
+                np.ones((1, 4)), np.ones((1, 4)), banks=[5]
+            )
+    
+    def test_routes_to_least_saturated_bank(self):
+        bank = HolographicBank(n_banks=4, size=256, require_context=False)
+        assigned = bank.encode_batch(np.random.randn(10, 20))
+        
+        assert sorted(np.bincount(assigned, minlength=4)) == [2, 2, 3, 3]
+        assert bank.encode(np.ones(20)) in (0, 1, 2, 3)
+        assert bank.memory_counts.max() - bank.memory_counts.min() <= 1
+    
+    def test_banks_match_standalone_memories(self):
+        rng = np.random.default_rng(10)
+        vectors, contexts = rng.standard_normal((9, 30)), rng.standard_normal((9, 30))
+        targets = np.array([0, 1, 2, 0, 0, 2, 1, 0, 2])
+        
+        bank = HolographicBank(n_banks=3, size=128, decay_rate=0.1)
+        bank.encode_batch(vectors, contexts, banks=targets)
+        
+        for b in range(3):
+            reference = HolographicMemory(size=128, decay_rate=0.1)
+            for v, k in zip(vectors[targets == b], contexts[targets == b]):
+                reference.encode(v, context=k)
+            
+            standalone = bank.get_memory(b)
+            assert standalone.memory_count == reference.memory_count
+            np.testing.assert_allclose(standalone.M, np.real(reference.M), atol=1e-10)
+            assert standalone._total_energy == pytest.approx(reference._total_energy)
+            
+            _, ref_strength = reference.recall(contexts[0])
+            assert bank.match_strengths(contexts[0])[b] == pytest.approx(ref_strength)
+    
+    def test_search_finds_owning_bank(self):
+        rng = np.random.default_rng(11)
+        bank = HolographicBank(n_banks=8, size=512)
+        vectors, contexts = rng.standard_normal((8, 64)), rng.standard_normal((8, 64))
+        bank.encode_batch(vectors, contexts, banks=np.arange(8))
+        
+        results = bank.search(contexts[5], k=3)
+        
+        assert len(results) == 3
+        best_bank, pattern, strength = results[0]
+        assert best_bank == 5
+        assert pattern.shape == (512,)
+        assert [r[2] for r in results] == sorted([r[2] for r in results], reverse=True)
+    
+    def test_empty_bank_search(self):
+        bank = HolographicBank(n_banks=3, size=64)
+        results = bank.search(np.ones(8), k=5)
+        assert len(results) == 3
+        assert all(strength == 0.0 for _, _, strength in results)
+    
+    def test_statistics_aggregate(self):
+        bank = HolographicBank(n_banks=4, size=256, require_context=False)
+        bank.encode_batch(np.random.randn(6, 20))
+        
+        stats = bank.get_statistics()
+        assert stats["memory_count"] == 6
+        assert stats["capacity"] == 4 * 16
+        assert stats["capacity_per_bank"] == 16
+        assert stats["utilization"] == pytest.approx(6 / 64)
+        assert stats["total_bytes"] == bank._F.nbytes
+        assert 0.0 < bank.get_interference_estimate() < 1.0
+        
+        bank.clear()
+        assert bank.get_statistics()["memory_count"] == 0
+    
+    def test_capacity_warning(self):
+        bank = HolographicBank(n_banks=2, size=16, require_context=False)
+        with pytest.warns(UserWarning, match="capacity"):
+            bank.encode_batch(np.ones((9, 4)))
+
+
 class TestCheckResonance:
     """Test resonance checking."""
     
@@ -231,6 +532,84 @@ class TestSaveLoad:
             mem.load("/nonexistent/path/hologram.npz")
 
 
+class TestRawPersistence:
+    """Test memory-mapped .holo persistence."""
+    
+    @pytest.mark.parametrize("spectral,real", [(False, False), (True, False), (False, True), (True, True)])
+    def test_roundtrip_all_modes(self, spectral, real):
+        mem = HolographicMemory(size=256, spectral=spectral, real=real, require_context=False)
+        mem.encode_batch(np.random.randn(3, 20))
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = mem.save_raw(os.path.join(tmpdir, "hologram"))
+            assert path.endswith(".holo")
+            loaded = HolographicMemory.open_raw(path)
+            
+            assert isinstance(loaded._M, np.memmap)
+            assert (loaded.spectral, loaded.real) == (spectral, real)
+            assert loaded.memory_count == 3
+            assert loaded._total_energy == pytest.approx(mem._total_energy)
+            np.testing.assert_array_equal(loaded.M, mem.M)
+            cue = np.random.randn(20)
+            np.testing.assert_array_equal(loaded.recall(cue)[0], mem.recall(cue)[0])
+            del loaded
+    
+    def test_copy_on_write_leaves_file_untouched(self):
+        mem = HolographicMemory(size=128, require_context=False)
+        mem.encode(np.ones(10))
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = mem.save_raw(os.path.join(tmpdir, "hologram"))
+            writable = HolographicMemory.open_raw(path)
+            writable.encode(np.arange(10.0))
+            reopened = HolographicMemory.open_raw(path, read_only=True)
+            
+            assert writable.memory_count == 2
+            assert reopened.memory_count == 1
+            np.testing.assert_array_equal(reopened.M, mem.M)
+            del writable, reopened
+    
+    def test_read_only_rejects_encode(self):
+        mem = HolographicMemory(size=64, require_context=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = mem.save_raw(os.path.join(tmpdir, "hologram"))
+            shared = HolographicMemory.open_raw(path, read_only=True)
+            
+            with pytest.raises(ValueError, match="read-only"):
+                shared.encode(np.ones(4))
+            shared.recall(np.ones(4))
+            del shared
+    
+    def test_bank_roundtrip(self):
+        bank = HolographicBank(n_banks=5, size=128, decay_rate=0.1, require_context=False)
+        bank.encode_batch(np.random.randn(12, 16))
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = bank.save_raw(os.path.join(tmpdir, "bank"))
+            loaded = HolographicBank.open_raw(path, read_only=True)
+            
+            assert isinstance(loaded._F, np.memmap)
+            np.testing.assert_array_equal(loaded.memory_counts, bank.memory_counts)
+            cue = np.random.randn(16)
+            np.testing.assert_allclose(loaded.match_strengths(cue), bank.match_strengths(cue))
+            with pytest.raises(ValueError, match="read-only"):
+                loaded.encode(np.ones(4))
+            with pytest.raises(ValueError, match="holds a bank"):
+                HolographicMemory.open_raw(path)
+            del loaded
+    
+    def test_invalid_files_raise(self):
+        with pytest.raises(FileNotFoundError, match="not found"):
+            HolographicMemory.open_raw("/nonexistent/path/hologram")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bogus.holo")
+            with open(path, "wb") as f:
+                f.write(b"not a hologram at all")
+            with pytest.raises(ValueError, match="bad magic"):
+                HolographicMemory.open_raw(path)
+
+
 class TestDecay:
     """Test forgetting/decay functionality."""
     
@@ -244,6 +623,87 @@ class TestDecay:
         energy2_per_mem = mem._total_energy / 2
         
         assert energy2_per_mem < energy1
+    
+    @staticmethod
+    def _eager_reference(vectors, contexts, decay_rate, size):
+        """The pre-lazy algorithm: rescale the whole hologram on every encode."""
+        M = np.zeros(size, dtype=complex)
+        for v, k in zip(vectors, contexts):
+            M *= (1 - decay_rate)
+            v = np.pad(v, (0, size - len(v)))
+            k = np.pad(k, (0, size - len(k)))
+            M += np.fft.ifft(np.fft.fft(v) * np.fft.fft(k))
+        return M
+    
+    @pytest.mark.parametrize("spectral,real", [(False, False), (True, False), (True, True)])
+    def test_lazy_decay_matches_eager(self, spectral, real):
+        rng = np.random.default_rng(12)
+        vectors, contexts = rng.standard_normal((120, 16)), rng.standard_normal((120, 16))
+        mem = HolographicMemory(size=64, decay_rate=0.3, spectral=spectral, real=real)
+        
+        with pytest.warns(UserWarning, match="capacity"):
+            for v, k in zip(vectors[:80], contexts[:80]):
+                mem.encode(v, context=k)
+            mem.encode_batch(vectors[80:], contexts[80:])
+        
+        # 0.7^120 ≈ 2e-19: the scale was renormalized along the way
+        expected = self._eager_reference(vectors, contexts, 0.3, 64)
+        np.testing.assert_allclose(mem.M, np.real(expected) if real else expected, atol=1e-9)
+    
+    def test_encode_defers_decay_to_scale(self):
+        mem = HolographicMemory(size=64, decay_rate=0.5, require_context=False)
+        mem.encode(np.ones(8))
+        stored = mem._M.copy()
+        mem.encode(np.zeros(8))
+        
+        # Only the scalar moved; the stored array was not rewritten
+        assert mem._scale == 0.25
+        np.testing.assert_array_equal(mem._M, stored)
+        
+        r, s = mem.recall(np.ones(8))
+        reference = HolographicMemory(size=64, require_context=False)
+        reference.M = self._eager_reference([np.ones(8), np.zeros(8)], [np.ones(8), np.zeros(8)], 0.5, 64)
+        reference._total_energy = mem._total_energy
+        np.testing.assert_allclose(r, reference.recall(np.ones(8))[0], atol=1e-12)
+    
+    def test_save_raw_applies_pending_scale(self):
+        mem = HolographicMemory(size=64, decay_rate=0.5, require_context=False)
+        mem.encode_batch(np.random.randn(3, 8))
+        with tempfile.TemporaryDirectory() as tmpdir:
+            loaded = HolographicMemory.open_raw(mem.save_raw(os.path.join(tmpdir, "h")))
+            np.testing.assert_allclose(loaded.M, mem.M)
+            del loaded
+    
+    def test_bank_encode_defers_decay_to_scales(self):
+        bank = HolographicBank(n_banks=3, size=64, decay_rate=0.5, require_context=False)
+        bank.encode(np.ones(8), bank=0)
+        stored = bank._F.copy()
+        bank.encode(np.zeros(8), bank=0)
+        
+        # Only bank 0's scalar moved; no spectrum was rewritten
+        np.testing.assert_array_equal(bank._scales, [0.25, 1.0, 1.0])
+        np.testing.assert_array_equal(bank._F, stored)
+    
+    def test_bank_lazy_decay_matches_eager(self):
+        rng = np.random.default_rng(13)
+        vectors, contexts = rng.standard_normal((120, 16)), rng.standard_normal((120, 16))
+        bank = HolographicBank(n_banks=2, size=64, decay_rate=0.3)
+        
+        with pytest.warns(UserWarning, match="capacity"):
+            for v, k in zip(vectors[:80], contexts[:80]):
+                bank.encode(v, context=k, bank=1)
+            bank.encode_batch(vectors[80:], contexts[80:], banks=np.ones(40, dtype=int))
+        
+        # 0.7^120 ≈ 2e-19: bank 1 was renormalized along the way, bank 0 never decayed
+        assert bank._scales[0] == 1.0
+        expected = np.real(self._eager_reference(vectors, contexts, 0.3, 64))
+        np.testing.assert_allclose(bank.get_memory(1).M, expected, atol=1e-9)
+        recalled, _ = bank._correlate(contexts[-1])
+        np.testing.assert_allclose(recalled[1], bank.get_memory(1).recall(contexts[-1])[0], atol=1e-9)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            loaded = HolographicBank.open_raw(bank.save_raw(os.path.join(tmpdir, "b")))
+            np.testing.assert_allclose(loaded.get_memory(1).M, expected, atol=1e-9)
+            del loaded
 
 
 class TestDistributedShards:
@@ -318,3 +778,117 @@ class TestDistributedShards:
         
         assert reconstructed.size == 256
         assert reconstructed.memory_count == 0
+
+
+class TestShardedHolographicMemory:
+    """Test parallel fan-out recall over shards."""
+    
+    @staticmethod
+    def _memory():
+        mem = HolographicMemory(size=512, require_context=False)
+        for _ in range(3):
+            mem.encode(np.random.randn(20))
+        return mem
+    
+    @pytest.mark.parametrize("use_processes", [True, False])
+    def test_matches_serial_partial_recall(self, use_processes):
+        mem = self._memory()
+        cue = np.random.randn(20)
+        expected = [s.partial_recall(cue) for s in shard_memory(mem, 4)]
+        
+        with ShardedHolographicMemory(mem, n_shards=4, n_workers=2,
+                                      use_processes=use_processes) as sharded:
+            recalled, strength = sharded.recall(cue)
+        
+        np.testing.assert_allclose(recalled, np.concatenate([r for r, _ in expected]))
+        assert strength == pytest.approx(np.mean([s for _, s in expected]))
+    
+    def test_timed_out_shard_degrades_gracefully(self, monkeypatch):
+        import time
+        original = DistributedHolographicShard.partial_recall
+        
+        def slow_shard(self, cue):
+            if self.shard_id == 1:
+                time.sleep(0.5)
+            return original(self, cue)
+        
+        monkeypatch.setattr(DistributedHolographicShard, "partial_recall", slow_shard)
+        mem = self._memory()
+        cue = np.random.randn(20)
+        full = [original(s, cue) for s in shard_memory(mem, 4)]
+        
+        with ShardedHolographicMemory(mem, n_shards=4, n_workers=4, timeout=0.1,
+                                      use_processes=False) as sharded:
+            with pytest.warns(UserWarning, match="Missing shards"):
+                recalled, strength = sharded.recall(cue)
+            stats = sharded.get_statistics()
+        
+        assert np.all(recalled[128:256] == 0)
+        np.testing.assert_allclose(recalled[:128], full[0][0])
+        expected = (full[0][1] + full[2][1] + full[3][1]) / 4
+        assert strength == pytest.approx(expected)
+        assert stats["shard_timeouts"] == 1
+    
+    def test_crashed_worker_is_restarted(self):
+        import signal
+        mem = self._memory()
+        cue = np.random.randn(20)
+        
+        with ShardedHolographicMemory(mem, n_shards=2, n_workers=2, timeout=5.0) as sharded:
+            sharded.recall(cue)
+            os.kill(sharded._worker_pids[0].value, signal.SIGKILL)
+            
+            with pytest.warns(UserWarning, match="Missing shards"):
+                sharded.recall(cue)
+            recalled, strength = sharded.recall(cue)
+            stats = sharded.get_statistics()
+        
+        assert stats["shard_failures"] >= 1
+        assert stats["worker_restarts"] == 1
+        assert strength > 0
+    
+    @pytest.mark.skipif(
+        multiprocessing.get_start_method() != "fork", reason="workers must inherit the patched shard"
+    )
+    def test_hung_worker_is_restarted(self, monkeypatch, tmp_path):
+        import time
+        original = DistributedHolographicShard.partial_recall
+        hang = tmp_path / "hang"
+        
+        def hung_shard(self, cue):
+            if self.shard_id == 1 and hang.exists():
+                time.sleep(60)
+            return original(self, cue)
+        
+        monkeypatch.setattr(DistributedHolographicShard, "partial_recall", hung_shard)
+        mem = self._memory()
+        cue = np.random.randn(20)
+        
+        with ShardedHolographicMemory(mem, n_shards=2, n_workers=2, timeout=1.0) as sharded:
+            hang.touch()
+            with pytest.warns(UserWarning, match="Missing shards"):
+                sharded.recall(cue)
+            hang.unlink()
+            
+            # The hung process itself was killed, not just abandoned
+            pid = sharded._worker_pids[1].value
+            deadline = time.monotonic() + 5.0
+            while not _process_exited(pid) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert _process_exited(pid)
+            
+            # The stuck worker was replaced, so shard 1 answers again
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                recalled, strength = sharded.recall(cue)
+            stats = sharded.get_statistics()
+        
+        expected = [original(s, cue) for s in shard_memory(mem, 2)]
+        np.testing.assert_allclose(recalled, np.concatenate([r for r, _ in expected]))
+        assert stats["shard_timeouts"] == 1 and stats["worker_restarts"] == 1
+    
+    def test_closed_coordinator_raises(self):
+        sharded = ShardedHolographicMemory(self._memory(), n_shards=2, use_processes=False)
+        sharded.close()
+        with pytest.raises(RuntimeError, match="closed"):
+            sharded.recall(np.ones(4))
@@ -0,0 +1,192 @@
+"""
+test_journal.py - Unit Tests for the Write-Behind Journal
+
+Tests asynchronous group commit of episodic memory:
+- Size- and time-triggered group commits, flush and close
+- Bounded backlog (back-pressure) and failure accounting
+- Hippocampus(write_behind=True) integration and durability levels
+"""
+import gc
+import sys
+import threading
+import time
+import weakref
+import pytest
+from unittest.mock import patch
+
+from shunollo_core.models import ShunolloSignal
+from shunollo_core.memory.hippocampus import Hippocampus
+from shunollo_core.memory.journal import WriteBehindJournal
+
+
+class TestWriteBehindJournal:
+
+    def test_group_commit_by_size(self):
+        batches = []
+        journal = WriteBehindJournal(batches.append, max_batch=10, max_delay=10.0)
+        for i in range(35):
+            journal.submit([i])
+        assert journal.flush(timeout=5.0)
+        journal.close()
+
+        assert [r for b in batches for r in b] == list(range(35))
+        assert all(len(b) <= 10 for b in batches)
+        stats = journal.get_statistics()
+        assert stats["committed"] == 35 and stats["depth"] == 0
+        assert stats["flush_latency_ms"]["max"] >= 0.0
+
+    def test_group_commit_by_time(self):
+        committed = threading.Event()
+        journal = WriteBehindJournal(lambda batch: committed.set(), max_batch=100, max_delay=0.01)
+        journal.submit(["episode"])
+        assert committed.wait(timeout=2.0)
+        journal.close()
+
+    def test_backpressure_bounds_backlog(self):
+        release = threading.Event()
+        seen = []
+
+        def slow_sink(batch):
+            release.wait(timeout=5.0)
+            seen.extend(batch)
+
+        journal = WriteBehindJournal(slow_sink, max_batch=4, max_delay=0.001, max_backlog=8)
+        producer = threading.Thread(target=lambda: [journal.submit([i]) for i in range(30)])
+        producer.start()
+        time.sleep(0.1)
+        assert producer.is_alive()  # blocked on the full backlog
+        assert journal.depth <= 8 + 4
+        release.set()
+        producer.join(timeout=5.0)
+        journal.close()
+
+        assert seen == list(range(30))
+        stats = journal.get_statistics()
+        assert stats["blocked_submits"] > 0
+        assert stats["max_depth"] <= 8
+
+    def test_failed_commit_is_counted(self):
+        def broken_sink(batch):
+            raise OSError("disk full")
+
+        journal = WriteBehindJournal(broken_sink, max_batch=2)
+        journal.submit([1, 2, 3])
+        journal.flush(timeout=2.0)
+        journal.close()
+        assert journal.get_statistics()["failed"] == 3
+        with pytest.raises(RuntimeError):
+            journal.submit([4])
+
+
+    def test_leftovers_keep_their_deadline(self):
+        committed = {}
+
+        def sink(batch):
+            if not committed:
+                time.sleep(0.3)  # busy while the next records queue up
+            committed.update((r, time.monotonic()) for r in batch)
+
+        journal = WriteBehindJournal(sink, max_batch=2, max_delay=0.4)
+        journal.submit(["a", "b"])
+        time.sleep(0.01)
+        queued = time.monotonic()
+        journal.submit(["c", "d", "e"])  # "e" is left over after the next batch
+        deadline = time.monotonic() + 2.0
+        while "e" not in committed and time.monotonic() < deadline:
+            time.sleep(0.01)
+        journal.close()
+        # Waits max_delay from its own submit, not from the previous commit
+        assert committed["e"] - queued < 0.6
+
+    def test_unreferenced_journal_is_freed(self):
+        batches = []
+        journal = WriteBehindJournal(batches.append, max_delay=0.01)
+        journal.submit([1, 2])
+        assert journal.flush(timeout=2.0)
+        thread, ref = journal._thread, weakref.ref(journal)
+        del journal
+        gc.collect()
+        assert ref() is None
+        thread.join(timeout=2.0)
+        assert not thread.is_alive()
+        assert batches == [[1, 2]]
+
+
+class TestHippocampusWriteBehind:
+
+    def _hippocampus(self, tmp_path, **kwargs):
+        with patch("shunollo_core.memory.hippocampus.config") as cfg:
+            cfg.storage = {"cache_dir": str(tmp_path)}
+            return Hippocampus(**kwargs)
+
+    @pytest.mark.parametrize("store", ["jsonl", "columnar"])
+    @pytest.mark.parametrize("durability", ["none", "flush", "fsync"])
+    def test_remember_is_deferred_and_durable(self, tmp_path, store, durability):
+        hippo = self._hippocampus(
+            tmp_path, store=store, write_behind=True, durability=durability,
+            journal_params={"max_batch": 8, "max_delay": 5.0}
+        )
+        hippo._load_cache()
+        for i in range(20):
+            signal = ShunolloSignal(energy=float(i % 10), metadata={"seq": i})
+            hippo.remember(signal)
+            signal.metadata["visual_analysis"] = "added after remember"
+
+        # Visible to recall before the commit reaches disk
+        assert len(hippo._cache) == 20
+        assert hippo.flush(timeout=5.0)
+        assert hippo.get_statistics()["journal"]["committed"] == 20
+
+        # A fresh Hippocampus reads the snapshot taken at remember() time
+        reader = self._hippocampus(tmp_path, store=store)
+        episodes = list(reader._load_cache())
+        assert [s.metadata["seq"] for s in episodes] == list(range(20))
+        assert all("visual_analysis" not in s.metadata for s in episodes)
+        hippo.close()
+
+    def test_cold_load_flushes_journal(self, tmp_path):
+        hippo = self._hippocampus(
+            tmp_path, write_behind=True, journal_params={"max_delay": 60.0}
+        )
+        hippo.remember(ShunolloSignal(energy=3.0))
+        assert len(hippo._load_cache()) == 1
+        hippo.close()
+
+    def test_concurrent_writers_keep_cache_and_index_aligned(self, tmp_path):
+        hippo = self._hippocampus(tmp_path, write_behind=True)
+        hippo._load_cache()
+
+        def writer(w):
+            for i in range(50):
+                seq = w * 50 + i
+                hippo.remember_batch([ShunolloSignal(energy=w * 2.0, roughness=i / 50.0, metadata={"seq": seq})])
+
+        threads = [threading.Thread(target=writer, args=(w,)) for w in range(4)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # interleave the writers as often as possible
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert len(hippo._cache) == 200
+        for signal in hippo._cache:
+            (match, distance), = hippo.recall_similar(signal.to_vector(normalize=True), k=1)
+            assert match is signal and distance == 0.0
+        hippo.close()
+
+    def test_unreferenced_hippocampus_is_freed(self, tmp_path):
+        hippo = self._hippocampus(tmp_path, write_behind=True, journal_params={"max_delay": 0.01})
+        hippo.remember(ShunolloSignal(energy=1.0))
+        assert hippo.flush(timeout=2.0)
+        ref = weakref.ref(hippo)
+        del hippo
+        gc.collect()
+        assert ref() is None
+
+    def test_invalid_durability(self, tmp_path):
+        with pytest.raises(ValueError):
+            self._hippocampus(tmp_path, durability="sometimes")
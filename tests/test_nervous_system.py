@@ -0,0 +1,261 @@
+"""
+test_nervous_system.py - Unit Tests for the Staged NervousSystem
+
+Tests the parallel cortical pathways:
+- PipelineStage batching, overflow policies and fault isolation
+- Per-stage worker pools and configuration overrides
+- A slow cortex does not hold up the other pathways
+- Bounded ingress: load-shedding policies and drop counters
+- Priority scheduling with aging; RAS salience raises priority
+"""
+import subprocess
+import sys
+import threading
+import time
+import pytest
+from unittest.mock import patch
+
+from shunollo_core.models import ShunolloSignal
+from shunollo_core.perception import nervous_system
+from shunollo_core.perception.nervous_system import NervousSystemEngine
+from shunollo_core.perception.ingress import IngressQueue
+from shunollo_core.perception.pipeline import PipelineStage
+
+
+def _engine(tmp_path, **kwargs) -> NervousSystemEngine:
+    with patch("shunollo_core.memory.hippocampus.config") as cfg:
+        cfg.storage = {"cache_dir": str(tmp_path)}
+        return NervousSystemEngine(**kwargs)
+
+
+class TestPipelineStage:
+
+    def test_batches_and_counts(self):
+        seen = []
+        gate = threading.Event()
+        stage = PipelineStage("test", lambda batch: (gate.wait(2.0), seen.append(list(batch))), max_batch=8)
+        for i in range(20):
+            stage.put(i)
+        gate.set()
+        assert stage.join(time.monotonic() + 5.0)
+        stage.stop(timeout=2.0)
+
+        assert sorted(i for b in seen for i in b) == list(range(20))
+        assert all(len(b) <= 8 for b in seen)
+        assert stage.get_statistics()["processed"] == 20
+
+    def test_drop_policy_sheds_load(self):
+        gate = threading.Event()
+        stage = PipelineStage("slow", lambda batch: gate.wait(5.0), queue_size=2, overflow="drop")
+        results = [stage.put(i) for i in range(10)]
+        gate.set()
+        stage.join(time.monotonic() + 5.0)
+        stage.stop(timeout=2.0)
+
+        stats = stage.get_statistics()
+        assert results.count(False) == stats["dropped"] > 0
+        assert stats["processed"] + stats["dropped"] == 10
+
+    def test_handler_failure_is_isolated(self):
+        def handler(batch):
+            if batch[0] == 1:
+                raise RuntimeError("cortex crash")
+        stage = PipelineStage("flaky", handler)
+        for i in range(3):
+            stage.put(i)
+        assert stage.join(time.monotonic() + 5.0)
+        stage.stop(timeout=2.0)
+        stats = stage.get_statistics()
+        assert stats["failed"] == 1 and stats["processed"] == 2
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            PipelineStage("bad", lambda batch: None, overflow="explode")
+
+
+class TestIngressQueue:
+
+    def _drain(self, q):
+        items = []
+        while not q.empty():
+            items.append(q.get_nowait())
+            q.task_done()
+        return items
+
+    def test_drop_oldest_keeps_freshest(self):
+        q = IngressQueue(maxsize=3, policy="drop_oldest")
+        assert all(q.offer(i) for i in range(5))
+        assert self._drain(q) == [2, 3, 4]
+        stats = q.get_statistics()
+        assert stats["dropped_oldest"] == 2 and stats["dropped"] == 2
+        assert stats["max_depth"] == 3 and stats["depth"] == 0
+
+    def test_drop_newest_rejects(self):
+        q = IngressQueue(maxsize=2, policy="drop_newest")
+        assert [q.offer(i) for i in range(4)] == [True, True, False, False]
+        assert self._drain(q) == [0, 1]
+
+    def test_drop_lowest_priority(self):
+        q = IngressQueue(maxsize=3, policy="drop_lowest_priority")
+        q.offer("bg-1", priority=0)
+        q.offer("alert", priority=5)
+        q.offer("bg-2", priority=0)
+        assert q.offer("normal", priority=1)       # evicts bg-1
+        assert q.offer("bg-3", priority=0)         # ties evict the older (bg-2)
+        assert not q.offer("noise", priority=-1)   # ranks below everything queued
+        assert q.depth_by_priority() == {0: 1, 1: 1, 5: 1}
+        assert self._drain(q) == ["alert", "normal", "bg-3"]
+        assert q.get_statistics()["dropped_lowest_priority"] == 3
+
+    def test_block_waits_for_space(self):
+        q = IngressQueue(maxsize=1, policy="block")
+        q.offer("first")
+        assert not q.offer("timeout", timeout=0.05)
+        threading.Timer(0.05, q.get).start()
+        assert q.offer("second", timeout=5.0)
+        assert q.get_statistics()["blocked"] == 2
+
+    def test_ras_sampling_favours_salience(self):
+        q = IngressQueue(maxsize=100, policy="ras", high_water=0.5, seed=0)
+        baseline = [q.offer(i, mechanism="baseline_arousal") for i in range(100)]
+        assert all(baseline[:50]) and not all(baseline[50:])
+        assert q.get_statistics()["sampled_out"] > 0
+        # Salient events always pass the sampler, evicting background when full
+        depth = q.qsize()
+        assert all(q.offer(i, priority=2, mechanism="salience_conflict") for i in range(100 - depth + 5))
+        assert q.qsize() == 100 and q.depth_by_priority()[2] == 100 - depth + 5
+
+    def test_join_accounts_for_evictions(self):
+        q = IngressQueue(maxsize=2, policy="drop_oldest")
+        for i in range(5):
+            q.offer(i)
+        self._drain(q)
+        q.join()  # would hang if evicted items were still counted as unfinished
+
+    def test_invalid_policy(self):
+        with pytest.raises(ValueError):
+            IngressQueue(policy="panic")
+        with pytest.raises(ValueError):
+            IngressQueue(scheduling="random")
+
+
+class TestPriorityScheduling:
+
+    def test_salient_overtakes_background(self):
+        q = IngressQueue(maxsize=0, aging_seconds=None)
+        for i in range(5):
+            q.offer(f"bg-{i}", priority=0)
+        q.offer("alert", priority=3)
+        q.offer("texture", priority=2)
+        order = [q.get_nowait() for _ in range(7)]
+        assert order == ["alert", "texture"] + [f"bg-{i}" for i in range(5)]
+        assert set(q.get_statistics()["wait_ms"]) == {0, 2, 3}
+
+    def test_fifo_mode_ignores_priority(self):
+        q = IngressQueue(maxsize=0, scheduling="fifo")
+        q.offer("bg", priority=0)
+        q.offer("alert", priority=3)
+        assert [q.get_nowait(), q.get_nowait()] == ["bg", "alert"]
+
+    def test_aging_prevents_starvation(self):
+        q = IngressQueue(maxsize=0, aging_seconds=0.01)
+        q.offer("old-background", priority=0)
+        time.sleep(0.05)  # worth ~5 priority levels
+        for i in range(3):
+            q.offer(f"alert-{i}", priority=2)
+        assert q.get_nowait() == "old-background"
+
+        strict = IngressQueue(maxsize=0, aging_seconds=None)
+        strict.offer("old-background", priority=0)
+        time.sleep(0.02)
+        strict.offer("alert", priority=2)
+        assert strict.get_nowait() == "alert"
+
+    def test_ras_mechanism_sets_priority(self, tmp_path):
+        engine = _engine(tmp_path)
+        engine.shutdown(timeout=5.0)  # keep items in the queue for inspection
+        conflict = ShunolloSignal(energy=0.9, flux=0.9, dissonance=0.9, roughness=0.3)
+        baseline = ShunolloSignal(energy=0.6, flux=0.5, roughness=0.3, frequency=0.7)
+        assert engine.publish_event(baseline)
+        assert engine.publish_event(conflict)
+        assert engine._queue.depth_by_priority() == {1: 1, 3: 1}
+        assert engine._queue.get_nowait() is conflict
+
+
+class TestStagedNervousSystem:
+
+    def test_slow_cortex_does_not_block_others(self, tmp_path):
+        release = threading.Event()
+        visual_seen = []
+
+        with patch.object(nervous_system, "synthesize_audio_event", lambda *a, **kw: release.wait(5.0)), \
+             patch.object(nervous_system, "synthesize_visual_event", lambda data, **kw: visual_seen.append(data)):
+            engine = _engine(tmp_path, stages={"audio": {"queue_size": 4}})
+            for i in range(20):
+                engine.dispatch(f"evt-{i}", {"seq": i})
+
+            # Visual finishes every event while audio is still stuck on its first
+            deadline = time.monotonic() + 5.0
+            while len(visual_seen) < 20 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert [d["seq"] for d in visual_seen] == list(range(20))
+            assert engine.get_statistics()["audio"]["dropped"] > 0
+
+            release.set()
+            assert engine.drain(timeout=5.0)
+            engine.shutdown(timeout=5.0)
+
+    def test_signals_reach_memory_and_cortex(self, tmp_path):
+        visual_seen = []
+        with patch.object(nervous_system, "synthesize_audio_event", lambda *a, **kw: None), \
+             patch.object(nervous_system, "synthesize_visual_event", lambda data, **kw: visual_seen.append(data)):
+            engine = _engine(tmp_path, stages={"visual": {"workers": 3}})
+            for i in range(5):
+                engine._queue.put(ShunolloSignal(energy=0.8, hue=10.0, metadata={"seq": i}))
+            engine._queue.put(ShunolloSignal(energy=0.8, metadata={"is_dream": True}))
+            assert engine.drain(timeout=5.0)
+            engine.shutdown(timeout=5.0)
+
+        assert len(visual_seen) == 6
+        assert all(d["visual_analysis"]["semantic_color"] == "danger" for d in visual_seen[:5] if "seq" in d)
+        # Dreams are perceived but not re-remembered; memory got clean snapshots
+        episodes = list(engine.hippocampus._load_cache())
+        assert sorted(s.metadata["seq"] for s in episodes) == list(range(5))
+        assert all("visual_analysis" not in s.metadata for s in episodes)
+        assert engine.get_statistics()["visual"]["workers"] == 3
+
+    def test_ingress_counters(self, tmp_path):
+        gate = threading.Event()
+        with patch.object(nervous_system, "synthesize_audio_event", lambda *a, **kw: None), \
+             patch.object(nervous_system, "synthesize_visual_event", lambda data, **kw: gate.wait(5.0)):
+            engine = _engine(tmp_path, ingress={"maxsize": 4, "policy": "drop_newest"},
+                             stages={"visual": {"queue_size": 1}})
+            accepted = [engine.dispatch(f"evt-{i}", {"seq": i}) for i in range(50)]
+            assert not engine.publish_event(ShunolloSignal(energy=0.01))
+            stats = engine.get_statistics()
+            assert stats["ingress"]["dropped_newest"] == accepted.count(False) > 0
+            assert stats["ingress"]["depth"] <= 4
+            assert stats["ingress"]["ras_suppressed"] == {"low_energy": 1}
+            gate.set()
+            assert engine.drain(timeout=5.0)
+            engine.shutdown(timeout=5.0)
+
+    def test_unknown_stage(self, tmp_path):
+        with pytest.raises(ValueError):
+            _engine(tmp_path, stages={"olfactory": {"workers": 2}})
+
+    def test_import_starts_no_threads(self):
+        code = (
+            "import threading\n"
+            "import shunollo_core.perception.nervous_system\n"
+            "print(threading.active_count())"
+        )
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        assert out.split()[-1] == "1"
+
+    def test_shared_engine_is_built_once(self, monkeypatch):
+        built = []
+        monkeypatch.setattr(nervous_system, "_nervous_system", None)
+        monkeypatch.setattr(nervous_system, "NervousSystemEngine", lambda: built.append(object()) or built[-1])
+        assert nervous_system.get_nervous_system() is nervous_system.NervousSystem
+        assert len(built) == 1
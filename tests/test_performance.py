@@ -1,3 +1,5 @@
+import json
+import os
 import time
 import numpy as np
 import pytest
@@ -6,6 +8,7 @@ from shunollo_core.physics.thermo import ThermodynamicSystem
 from shunollo_core.cognition.active_inference import ActiveInferenceAgent
 from shunollo_core.memory.holographic import HolographicMemory
 from shunollo_core.brain.autoencoder import Autoencoder
+from shunollo_runtime import BaseAgent
 
 @pytest.fixture
 def agent():
@@ -66,6 +69,498 @@ def test_holographic_retrieval_scalability(memory):
     print(f"\n[Performance] Avg Memory Retrieval: {avg_latency*1e6:.2f}us")
     assert avg_latency < 0.01 # Should be under 10ms
 
+def test_holographic_batch_throughput():
+    """Benchmark batched encode/recall against the per-item loop."""
+    n, width = 2000, 24
+    vectors = np.random.randn(n, width)
+    contexts = np.random.randn(n, width)
+    
+    looped = HolographicMemory(size=1024, require_context=False)
+    start = time.perf_counter()
+    for v, k in zip(vectors, contexts):
+        looped.encode(v, context=k)
+    for k in contexts:
+        looped.recall(k)
+    loop_time = time.perf_counter() - start
+    
+    batched = HolographicMemory(size=1024, require_context=False)
+    start = time.perf_counter()
+    batched.encode_batch(vectors, contexts)
+    batched.recall_batch(contexts)
+    batch_time = time.perf_counter() - start
+    
+    print(f"\n[Performance] Holographic per-item: {loop_time / n * 1e6:.2f}us, "
+          f"batched: {batch_time / n * 1e6:.2f}us ({loop_time / batch_time:.1f}x)")
+    assert batch_time < loop_time
+
+def test_holographic_bank_search_latency():
+    """Benchmark top-k search across a bank against looping over memories."""
+    from shunollo_core.memory.holographic import HolographicBank
+    n_banks, vector_size = 128, 24
+    vectors = np.random.randn(n_banks * 8, vector_size)
+    contexts = np.random.randn(n_banks * 8, vector_size)
+    
+    bank = HolographicBank(n_banks=n_banks, size=1024)
+    assigned = bank.encode_batch(vectors, contexts)
+    memories = [HolographicMemory(size=1024) for _ in range(n_banks)]
+    for b, v, k in zip(assigned, vectors, contexts):
+        memories[b].encode(v, context=k)
+    
+    query = contexts[0]
+    start = time.perf_counter()
+    for _ in range(10):
+        max(range(n_banks), key=lambda b: memories[b].recall(query)[1])
+    loop_time = (time.perf_counter() - start) / 10
+    
+    start = time.perf_counter()
+    for _ in range(10):
+        bank.search(query, k=5)
+    bank_time = (time.perf_counter() - start) / 10
+    
+    print(f"\n[Performance] Bank search over {n_banks} holograms: {bank_time*1e3:.2f}ms "
+          f"(looped: {loop_time*1e3:.2f}ms)")
+    assert len(bank.search(query, k=5)) == 5
+    assert bank_time < 0.1
+
+def test_holographic_raw_load_latency(tmp_path):
+    """Benchmark memory-mapped .holo load against .npz decompression."""
+    memory = HolographicMemory(size=2 ** 18, require_context=False)
+    memory.encode_batch(np.random.randn(16, 256))
+    memory.save(str(tmp_path / "hologram"))
+    raw_path = memory.save_raw(str(tmp_path / "hologram"))
+    
+    start = time.perf_counter()
+    HolographicMemory(size=2 ** 18).load(str(tmp_path / "hologram"))
+    npz_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    HolographicMemory.open_raw(raw_path, read_only=True)
+    raw_time = time.perf_counter() - start
+    
+    print(f"\n[Performance] Hologram load (4 MB): npz {npz_time*1e3:.2f}ms, mmap {raw_time*1e3:.3f}ms")
+    assert raw_time < npz_time
+
+def test_sharded_recall_scaling():
+    """Benchmark sharded recall throughput against the number of worker processes."""
+    import os
+    from shunollo_core.memory.sharded import ShardedHolographicMemory
+    memory = HolographicMemory(size=2 ** 18, require_context=False)
+    memory.encode_batch(np.random.randn(8, 256))
+    cue = np.random.randn(256)
+    
+    cores = os.cpu_count() or 1
+    throughput = {}
+    for workers in sorted({1, min(2, cores), min(4, cores)}):
+        with ShardedHolographicMemory(memory, n_shards=8, n_workers=workers, timeout=10.0) as sharded:
+            sharded.recall(cue)  # Warm up worker processes
+            best = float("inf")
+            for _ in range(3):  # best of three: one CPU hiccup must not decide the claim
+                start = time.perf_counter()
+                for _ in range(10):
+                    _, strength = sharded.recall(cue)
+                best = min(best, time.perf_counter() - start)
+            throughput[workers] = 10 / best
+        assert strength > 0
+    
+    print(f"\n[Performance] Sharded recall ({cores} cores): " + ", ".join(
+        f"{workers} workers: {rate:.1f} recalls/s" for workers, rate in throughput.items()
+    ))
+    # The coordinator merges partial results serially, so only claim
+    # scaling where there are cores to spare for it
+    if cores >= 4:
+        assert throughput[4] > 1.3 * throughput[1]
+
+def test_episodic_recall_latency():
+    """Benchmark vectorized k-NN recall over a full 10k-episode index."""
+    from shunollo_core.memory.episodic_index import ExactIndex
+    index = ExactIndex(capacity=10000)
+    index.add_batch(np.random.rand(10000, 18))
+    query = np.random.rand(18)
+    
+    start = time.perf_counter()
+    for _ in range(100):
+        positions, _ = index.search(query, k=3)
+    avg_time = (time.perf_counter() - start) / 100
+    
+    print(f"\n[Performance] Episodic recall (10k episodes): {avg_time*1e3:.3f}ms/query")
+    assert len(positions) == 3
+    assert avg_time < 0.05
+
+LARGE_BENCH = pytest.mark.skipif(
+    not os.environ.get("SHUNOLLO_LARGE_BENCH"),
+    reason="set SHUNOLLO_LARGE_BENCH=1 for 1e6/1e7 episode benchmarks"
+)
+
+@pytest.mark.parametrize("n_episodes", [
+    100_000,
+    pytest.param(1_000_000, marks=LARGE_BENCH),
+    pytest.param(10_000_000, marks=LARGE_BENCH),
+])
+def test_episodic_ann_scaling(n_episodes):
+    """Benchmark IVF build, insert and query against exact search, with recall@10."""
+    from shunollo_core.memory.episodic_index import ExactIndex, IVFIndex, recall_at_k
+    rng = np.random.default_rng(0)
+    data = rng.random((n_episodes, 18), dtype=np.float32)
+    queries = rng.random((50, 18))
+    nlist = int(np.sqrt(n_episodes))
+    
+    index = IVFIndex(capacity=n_episodes + 1000, nlist=nlist, nprobe=16)
+    start = time.perf_counter()
+    index.add_batch(data)
+    build_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for vector in rng.random((1000, 18)):
+        index.add(vector)
+    insert_time = (time.perf_counter() - start) / 1000
+    
+    start = time.perf_counter()
+    for q in queries:
+        index.search(q, k=10)
+    ivf_time = (time.perf_counter() - start) / len(queries)
+    
+    start = time.perf_counter()
+    for q in queries[:10]:
+        ExactIndex.search(index, q, k=10)
+    exact_time = (time.perf_counter() - start) / 10
+    
+    recall = recall_at_k(index, queries[:20], k=10)
+    print(
+        f"\n[Performance] Episodic ANN ({n_episodes:.0e}): build {build_time:.2f}s, "
+        f"insert {insert_time*1e6:.1f}us, query {ivf_time*1e3:.2f}ms "
+        f"(exact {exact_time*1e3:.2f}ms), recall@10 {recall:.3f}"
+    )
+    assert ivf_time < exact_time
+    assert recall >= 0.7
+
+def test_episodic_store_ingest_and_cold_start(tmp_path):
+    """Benchmark JSONL vs columnar episodic storage: ingest rate and cold-start load."""
+    from shunollo_core.models import ShunolloSignal
+    from shunollo_core.memory.episodic_store import ColumnarEpisodicStore, EpisodeCache, normalize_physics
+    n = 20000
+    signals = [
+        ShunolloSignal(energy=float(i % 10), entropy=float(i % 8), frequency=float(i), metadata={"i": i})
+        for i in range(n)
+    ]
+    
+    # Per-signal remember() on the JSONL log: open + flock + write each time
+    jsonl = tmp_path / "episodic_memory.jsonl"
+    start = time.perf_counter()
+    for s in signals:
+        with open(jsonl, "a", encoding="utf-8") as f:
+            f.write(s.model_dump_json() + "\n")
+    jsonl_ingest = n / (time.perf_counter() - start)
+    
+    store = ColumnarEpisodicStore(tmp_path / "episodic")
+    start = time.perf_counter()
+    for i in range(0, n, 1000):
+        store.append(signals[i:i + 1000])
+    columnar_ingest = n / (time.perf_counter() - start)
+    
+    # Cold start: what Hippocampus._load_cache does for 10k episodes
+    start = time.perf_counter()
+    lines = jsonl.read_text(encoding="utf-8").splitlines()[-10000:]
+    cache = [ShunolloSignal(**json.loads(line)) for line in lines]
+    np.array([s.to_vector() for s in cache], dtype=np.float32)
+    jsonl_load = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    columns = ColumnarEpisodicStore(tmp_path / "episodic").tail(10000)
+    EpisodeCache(columns)
+    normalize_physics(columns.physics)
+    columnar_load = time.perf_counter() - start
+    
+    print(
+        f"\n[Performance] Episodic ingest: JSONL {jsonl_ingest:.0f}/s, columnar {columnar_ingest:.0f}/s; "
+        f"cold start (10k): JSONL {jsonl_load*1e3:.1f}ms, columnar {columnar_load*1e3:.1f}ms"
+    )
+    assert columnar_load < jsonl_load
+
+def test_hippocampus_tail_cold_start(tmp_path):
+    """Benchmark JSONL cold start: reverse tail read vs reading the whole log."""
+    from unittest.mock import patch
+    from shunollo_core.models import ShunolloSignal
+    from shunollo_core.memory.hippocampus import Hippocampus
+    line = ShunolloSignal(energy=1.0, metadata={"payload": "x" * 200}).model_dump_json() + "\n"
+    log = tmp_path / "episodic_memory.jsonl"
+    log.write_text(line * 100000, encoding="utf-8")  # ~70 MB of history
+    
+    with patch.object(Hippocampus, '__init__', lambda self, **kwargs: None):
+        hippo = Hippocampus.__new__(Hippocampus)
+    hippo.storage_path = log
+    hippo._cache = None
+    hippo._cache_dirty = True
+    hippo._max_cache_size = 1000
+    
+    start = time.perf_counter()
+    lines = log.read_text(encoding="utf-8").splitlines()[-1000:]
+    [ShunolloSignal(**json.loads(entry)) for entry in lines]
+    full_time = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    cache = hippo._load_cache()
+    tail_time = time.perf_counter() - start
+    
+    print(f"\n[Performance] Cold start (1k of 100k episodes): full read {full_time*1e3:.1f}ms, tail read {tail_time*1e3:.1f}ms")
+    assert len(cache) == 1000
+    assert tail_time < full_time
+
+def test_hippocampus_write_behind_latency(tmp_path):
+    """Benchmark remember() latency: synchronous append vs write-behind journal."""
+    from unittest.mock import patch
+    from shunollo_core.models import ShunolloSignal
+    from shunollo_core.memory.hippocampus import Hippocampus
+    signals = [ShunolloSignal(energy=float(i % 10), metadata={"i": i}) for i in range(2000)]
+    
+    report = {}
+    for mode in ("sync", "write_behind"):
+        with patch("shunollo_core.memory.hippocampus.config") as cfg:
+            cfg.storage = {"cache_dir": str(tmp_path / mode)}
+            hippo = Hippocampus(write_behind=(mode == "write_behind"))
+        start = time.perf_counter()
+        for s in signals:
+            hippo.remember(s)
+        report[mode] = (time.perf_counter() - start) / len(signals)
+        assert hippo.flush(timeout=10.0)
+        hippo.close()
+    
+    print(
+        f"\n[Performance] remember(): sync {report['sync']*1e6:.1f}us, "
+        f"write-behind {report['write_behind']*1e6:.1f}us"
+    )
+    assert report["write_behind"] < report["sync"]
+
+def test_ingress_salient_tail_latency():
+    """Benchmark p99 queue wait of salient signals behind a deep backlog: FIFO vs priority."""
+    import threading
+    from shunollo_core.perception.ingress import IngressQueue
+    
+    report = {}
+    for mode in ("fifo", "priority"):
+        q = IngressQueue(maxsize=0, scheduling=mode, aging_seconds=5.0)
+        done = threading.Event()
+        
+        def cortex():
+            # ~20us of work per event
+            while True:
+                item = q.get()
+                if item is None:
+                    break
+                end = time.perf_counter() + 2e-5
+                while time.perf_counter() < end:
+                    pass
+            done.set()
+        
+        worker = threading.Thread(target=cortex, daemon=True)
+        worker.start()
+        # Burst faster than the cortex drains, so the backlog grows
+        for i in range(10000):
+            q.offer(i, priority=0 if i % 100 else 3)
+        q.offer(None, priority=-1)
+        assert done.wait(30.0)
+        report[mode] = q.get_statistics()["wait_ms"][3]["p99"]
+    
+    print(
+        f"\n[Performance] Salient p99 queue wait: fifo {report['fifo']:.2f}ms, "
+        f"priority {report['priority']:.2f}ms"
+    )
+    assert report["priority"] < report["fifo"] / 4
+
+def _thalamus_buses(tmp_name):
+    """Every Thalamus implementation usable here (Redis only if a server answers)."""
+    from shunollo_runtime import InMemoryThalamus, SharedMemoryThalamus
+    buses = {
+        "in_memory": InMemoryThalamus(),
+        "shared_memory": SharedMemoryThalamus(name=tmp_name, capacity=1 << 24),
+    }
+    try:
+        from shunollo_runtime import RedisThalamus
+        redis_bus = RedisThalamus()
+        if redis_bus.is_healthy():
+            buses["redis"] = redis_bus
+    except ImportError:
+        pass
+    return buses
+
+def test_thalamus_throughput():
+    """Benchmark messages/s per Thalamus: single publish/consume vs 256-message volleys."""
+    import uuid
+    from shunollo_core.models import PHYSICS_FIELDS
+    stimulus = {name: 0.5 for name, _, _ in PHYSICS_FIELDS}
+    stimulus.update(source="bench", metadata={"domain": "network"})
+    channel = f"bench-{uuid.uuid4().hex[:8]}"
+    
+    buses = _thalamus_buses(f"bench-{uuid.uuid4().hex[:8]}")
+    report = {}
+    try:
+        for kind, bus in buses.items():
+            n_single, n_batch = 2000, 20000
+            single = batched = 0.0
+            for _ in range(3):  # best of 3: one CPU makes single runs noisy
+                start = time.perf_counter()
+                for _ in range(n_single):
+                    bus.publish_stimulus(channel, dict(stimulus))
+                for _ in range(n_single):
+                    assert bus.consume_stimulus(channel, timeout=1) is not None
+                single = max(single, n_single / (time.perf_counter() - start))
+                
+                start = time.perf_counter()
+                for _ in range(0, n_batch, 256):
+                    bus.publish_many(channel, [dict(stimulus) for _ in range(256)])
+                received = 0
+                while received < n_batch // 256 * 256:
+                    received += len(bus.consume_many(channel, max_items=256, timeout=1))
+                batched = max(batched, received / (time.perf_counter() - start))
+            report[kind] = (single, batched)
+    finally:
+        if "shared_memory" in buses:
+            buses["shared_memory"].unlink()
+    
+    print("\n[Performance] Thalamus msgs/s (single, batched): " + ", ".join(
+        f"{kind} {single:,.0f} / {batched:,.0f}" for kind, (single, batched) in report.items()
+    ))
+    assert report["in_memory"][1] > report["shared_memory"][1]
+    assert all(batched > single for single, batched in report.values())
+
+def test_thalamus_codec_cost():
+    """Benchmark bytes/message and encode/decode cost per codec for adapter qualia."""
+    from shunollo_core.domain_adapter import UniversalAdapter
+    from shunollo_runtime.codecs import decode_message, get_codec
+    qualia = UniversalAdapter(domain="network").process(
+        {"bytes": 50000, "latency_ms": 150, "errors": 2, "packets": 40}
+    )
+    stimulus = dict(qualia, source="bench", timestamp=time.time(), metadata={"domain": "network"})
+    
+    n = 5000
+    report = {}
+    for name in ("json", "binary", "somatic"):
+        codec = get_codec(name)
+        start = time.perf_counter()
+        for _ in range(n):
+            data = codec.encode(stimulus)
+        encode_us = (time.perf_counter() - start) / n * 1e6
+        start = time.perf_counter()
+        for _ in range(n):
+            decode_message(data)
+        decode_us = (time.perf_counter() - start) / n * 1e6
+        report[name] = (len(data), encode_us, decode_us)
+    
+    print("\n[Performance] Codec bytes/msg, encode/decode us: " + ", ".join(
+        f"{name} {size}B {enc:.1f}/{dec:.1f}" for name, (size, enc, dec) in report.items()
+    ))
+    assert report["binary"][0] < report["json"][0]
+    assert report["somatic"][0] < report["binary"][0]
+
+class _BurnAgent(BaseAgent):
+    """CPU-bound agent for the supervisor benchmark (~200us per stimulus)."""
+    
+    def analyze(self, stimulus):
+        end = time.perf_counter() + 2e-4
+        while time.perf_counter() < end:
+            pass
+        return {"n": stimulus["n"]}
+
+def test_supervisor_worker_scaling():
+    """Benchmark stimuli/s through AgentSupervisor with 1 worker vs one per core."""
+    import functools
+    import uuid
+    from shunollo_runtime import AgentSupervisor, SharedMemoryThalamus
+    
+    cores = os.cpu_count() or 1
+    report = {}
+    for workers in sorted({1, cores}):
+        bus = SharedMemoryThalamus(name=f"bench-{uuid.uuid4().hex[:8]}", capacity=1 << 22)
+        supervisor = AgentSupervisor(
+            functools.partial(SharedMemoryThalamus, name=bus.name, capacity=1 << 22), report_interval=0.05
+        )
+        supervisor.add_pool("burn", _BurnAgent, workers=workers, min_workers=workers, max_workers=workers, batch_size=64)
+        n = 2000 * workers
+        try:
+            supervisor.start()
+            # Time the steady state, not process start-up: wait for every worker's first report
+            deadline = time.perf_counter() + 30
+            while not all(w["report_age"] is not None for w in supervisor.get_statistics()["burn"]["per_worker"].values()):
+                assert time.perf_counter() < deadline
+                time.sleep(0.01)
+            start = time.perf_counter()
+            bus.publish_many("stimuli", [{"n": i} for i in range(n)])
+            received = 0
+            while received < n and time.perf_counter() - start < 60:
+                received += len(bus.consume_many("qualia", max_items=512, timeout=1))
+            report[workers] = received / (time.perf_counter() - start)
+        finally:
+            supervisor.stop()
+            bus.unlink()
+        assert received == n
+    
+    print("\n[Performance] Supervisor stimuli/s: " + ", ".join(
+        f"{workers} worker(s) {rate:,.0f}" for workers, rate in report.items()
+    ))
+    # The consumer here shares the cores with the workers, so only claim
+    # scaling where there is headroom for it
+    if cores >= 4:
+        assert report[cores] > 1.5 * report[1]
+
+def test_adapter_batch_throughput():
+    """Benchmark UniversalAdapter samples/s: process() per dict vs process_batch() on columns."""
+    from shunollo_core.domain_adapter import QUALIA_DTYPE, UniversalAdapter
+    rng = np.random.default_rng(0)
+    n = 50_000
+    frame = {
+        "bytes": rng.uniform(0, 1e6, n),
+        "packets": rng.uniform(0, 1e4, n),
+        "latency_ms": rng.uniform(0, 2000, n),
+        "errors": rng.uniform(0, 100, n),
+    }
+    adapter = UniversalAdapter("network")
+    
+    rows = [{k: float(v[i]) for k, v in frame.items()} for i in range(2000)]
+    start = time.perf_counter()
+    for row in rows:
+        adapter.process(row)
+    scalar = len(rows) / (time.perf_counter() - start)
+    
+    out = np.empty(n, dtype=QUALIA_DTYPE)
+    start = time.perf_counter()
+    adapter.process_batch(frame, out=out)
+    batched = n / (time.perf_counter() - start)
+    
+    print(f"\n[Performance] Adapter samples/s: process {scalar:,.0f}, process_batch {batched:,.0f}")
+    assert batched > 5 * scalar
+
+def test_adapter_normalization_plan_latency():
+    """Benchmark per-sample normalization: compiled plan vs per-metric lookups and scheme dispatch."""
+    from shunollo_core.domain_adapter import DOMAIN_CONFIGS, normalize_value
+    config = DOMAIN_CONFIGS["financial"]
+    raw = {"price_delta_pct": 2.0, "volume": 5e5, "volatility": 20.0, "order_imbalance": 0.1, "spread_bps": 5.0}
+    
+    def lookups():
+        out = {}
+        for metric, value in raw.items():
+            low, high = config.bounds.get(metric, (0, 100))
+            v = normalize_value(value, low, high, config.schemes.get(metric, "unipolar"))
+            out[metric] = v ** config.exponents[metric] if metric in config.exponents else v
+        return out
+    
+    def compiled():
+        plan = config.plan(raw.keys())
+        return dict(zip(plan.metrics, plan.perceive_row(plan.normalize_row(raw.values()))))
+    
+    assert compiled() == lookups()
+    n = 20000
+    report = {}
+    for name, fn in (("lookups", lookups), ("plan", compiled)):
+        best = float("inf")
+        for _ in range(3):
+            start = time.perf_counter()
+            for _ in range(n):
+                fn()
+            best = min(best, (time.perf_counter() - start) / n)
+        report[name] = best * 1e6
+    
+    print(f"\n[Performance] Normalize 5 metrics: lookups {report['lookups']:.2f}us, plan {report['plan']:.2f}us")
+    assert report["plan"] < report["lookups"]
+
 def test_thermodynamic_update_throughput():
     """Benchmark stress testing for thermodynamic updates."""
     system = ThermodynamicSystem()
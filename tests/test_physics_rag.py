@@ -5,6 +5,7 @@ Tests the core episodic memory recall capabilities:
 - to_vector(): 18-dimensional normalized physics fingerprint export
 - recall_similar(): Euclidean distance-based similarity search
 """
+import numpy as np
 import pytest
 import tempfile
 import os
@@ -12,7 +13,10 @@ from pathlib import Path
 from unittest.mock import patch
 
 from shunollo_core.models import ShunolloSignal
-from shunollo_core.memory.hippocampus import Hippocampus
+from shunollo_core.memory.hippocampus import Hippocampus, _iter_tail_lines
+from shunollo_core.memory.episodic_index import (
+    ExactIndex, IVFIndex, create_episodic_index, recall_at_k
+)
 
 
 class TestToVector:
@@ -168,3 +172,180 @@ class TestRecallSimilar:
         temp_hippocampus.clear_memory()
         query = [0.5] * 18
         assert temp_hippocampus.get_novelty_score(query) == float('inf')
+
+    def test_recall_matches_brute_force(self, temp_hippocampus):
+        """Indexed recall should agree with a per-signal Euclidean scan."""
+        rng = np.random.default_rng(7)
+        for _ in range(50):
+            temp_hippocampus.remember(ShunolloSignal(
+                energy=float(rng.uniform(0, 10)),
+                entropy=float(rng.uniform(0, 1)),
+                roughness=float(rng.uniform(0, 1))
+            ))
+        temp_hippocampus._load_cache()  # loads the file and builds the index
+
+        # New episodes must reach the index without a file re-read
+        temp_hippocampus.remember(ShunolloSignal(energy=2.0, entropy=0.3))
+        assert not temp_hippocampus._cache_dirty
+        assert len(temp_hippocampus._index) == 51
+
+        query = ShunolloSignal(energy=2.5, entropy=0.4).to_vector(normalize=True)
+        expected = sorted(
+            (float(np.linalg.norm(np.subtract(query, s.to_vector(normalize=True)))), i)
+            for i, s in enumerate(temp_hippocampus._cache)
+        )[:5]
+        result = temp_hippocampus.recall_similar(query, k=5, threshold=10.0)
+
+        assert [s for s, _ in result] == [temp_hippocampus._cache[i] for _, i in expected]
+        np.testing.assert_allclose([d for _, d in result], [d for d, _ in expected], atol=1e-5)
+        assert temp_hippocampus.get_novelty_score(query) == pytest.approx(expected[0][0], abs=1e-5)
+
+    def test_index_trims_with_cache(self, temp_hippocampus):
+        """The index should evict in step with the bounded cache."""
+        temp_hippocampus._max_cache_size = 4
+        temp_hippocampus._load_cache()
+        for i in range(10):
+            temp_hippocampus.remember(ShunolloSignal(energy=float(i)))
+
+        assert len(temp_hippocampus._cache) == len(temp_hippocampus._index) == 4
+        query = temp_hippocampus._cache[0].to_vector(normalize=True)
+        matched, distance = temp_hippocampus.recall_similar(query, k=1)[0]
+        assert matched.energy == 6.0
+        assert distance == 0.0
+
+
+class TestExactIndex:
+    """Tests for the episodic vector index."""
+
+    def test_sliding_window(self):
+        index = ExactIndex(capacity=50, dim=3)
+        rng = np.random.default_rng(0)
+        added = []
+        for i in range(500):
+            if i % 7 == 0:
+                batch = rng.random((5, 3))
+                index.add_batch(batch)
+                added.extend(batch)
+            vector = rng.random(3)
+            index.add(vector)
+            added.append(vector)
+
+        assert len(index) == 50
+        np.testing.assert_array_equal(index.vectors, np.array(added[-50:], dtype=np.float32))
+
+    def test_search_threshold_and_order(self):
+        index = ExactIndex(capacity=10, dim=2)
+        index.add_batch([[3.0, 0.0], [1.0, 0.0], [2.0, 0.0], [1.0, 0.0]])
+
+        positions, distances = index.search([0.0, 0.0], k=3, threshold=2.5)
+        assert positions.tolist() == [1, 3, 2]  # ties keep insertion order
+        assert distances.tolist() == [1.0, 1.0, 2.0]
+
+        index.clear()
+        assert len(index.search([0.0, 0.0], k=3)[0]) == 0
+
+
+class TestIVFIndex:
+    """Tests for the approximate (IVF) episodic index."""
+
+    @staticmethod
+    def _clustered(n, seed=0):
+        rng = np.random.default_rng(seed)
+        centers = rng.random((32, 18))
+        return (centers[rng.integers(0, 32, n)] + 0.02 * rng.standard_normal((n, 18))).astype(np.float32)
+
+    def test_untrained_falls_back_to_exact(self):
+        index = IVFIndex(capacity=100, nlist=4, train_size=50)
+        data = self._clustered(20)
+        index.add_batch(data)
+        assert not index.is_trained
+        assert recall_at_k(index, data[:5], k=3) == 1.0
+
+    def test_recall_at_k(self):
+        data = self._clustered(5000)
+        index = IVFIndex(capacity=5000, nlist=32, nprobe=4)
+        index.add_batch(data)
+        assert index.is_trained
+
+        queries = self._clustered(50, seed=1)
+        assert recall_at_k(index, queries, k=5) >= 0.9
+        positions, distances = index.search(data[123], k=1)
+        assert positions[0] == 123 and distances[0] == 0.0
+
+    def test_sliding_window_eviction(self):
+        data = self._clustered(3000)
+        index = IVFIndex(capacity=500, nlist=8, nprobe=8)
+        for vector in data:
+            index.add(vector)
+
+        assert len(index) == 500
+        np.testing.assert_array_equal(index.vectors, data[-500:])
+        # nprobe == nlist scans every live entry: identical to exact search
+        assert recall_at_k(index, data[:20], k=10) == 1.0
+        assert index.search(data[-500], k=1)[0][0] == 0
+
+    def test_factory(self):
+        assert isinstance(create_episodic_index("ivf", 100, nlist=4), IVFIndex)
+        assert type(create_episodic_index("exact", 100)) is ExactIndex
+        with pytest.raises(ValueError):
+            create_episodic_index("hnsw", 100)
+
+    def test_hippocampus_ivf_backend(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with patch.object(Hippocampus, '__init__', lambda self, **kwargs: None):
+                hippo = Hippocampus.__new__(Hippocampus)
+            hippo.storage_path = Path(tmpdir) / "episodic_memory.jsonl"
+            hippo._cache = None
+            hippo._cache_dirty = True
+            hippo._max_cache_size = 1000
+            hippo._index_kind = "ivf"
+            hippo._index_params = {"nlist": 4, "train_size": 20}
+
+            for i in range(40):
+                hippo.remember(ShunolloSignal(energy=float(i % 10), entropy=0.1 * (i % 7)))
+            hippo._load_cache()
+            assert isinstance(hippo._index, IVFIndex) and hippo._index.is_trained
+
+            target = hippo._cache[17]
+            matched, distance = hippo.recall_similar(target.to_vector(normalize=True), k=1)[0]
+            assert distance == 0.0
+            assert hippo.get_novelty_score(target.to_vector(normalize=True)) == 0.0
+
+
+class TestTailLoad:
+    """Tests for the reverse-seeking cold start of the JSONL log."""
+
+    @pytest.mark.parametrize("content", [
+        b"a\nbb\n\nccc\n",
+        b"a\nbb\n\nccc",
+        b"\n\xc3\xa9\xc3\xa9\nlast\n",
+        b"only",
+        b"\n",
+        b"",
+    ])
+    @pytest.mark.parametrize("block_size", [1, 2, 3, 64])
+    def test_matches_splitlines(self, tmp_path, content, block_size):
+        path = tmp_path / "log.jsonl"
+        path.write_bytes(content)
+        expected = content.splitlines()
+        for n in (1, 2, 10):
+            tail = list(_iter_tail_lines(path, n, block_size=block_size))
+            assert tail[::-1] == expected[-n:]
+
+    def test_load_cache_reads_only_tail(self, tmp_path):
+        with patch.object(Hippocampus, '__init__', lambda self, **kwargs: None):
+            hippo = Hippocampus.__new__(Hippocampus)
+        hippo.storage_path = tmp_path / "episodic_memory.jsonl"
+        hippo._cache = None
+        hippo._cache_dirty = True
+        hippo._max_cache_size = 5
+
+        with open(hippo.storage_path, "w", encoding="utf-8") as f:
+            for i in range(100):
+                f.write(ShunolloSignal(energy=float(i), metadata={"note": "é" * i}).model_dump_json() + "\n")
+            f.write("corrupt line\n")
+
+        cache = hippo._load_cache()
+        # The corrupt line counts toward the window, as with the full read
+        assert [s.energy for s in cache] == [96.0, 97.0, 98.0, 99.0]
+        assert cache[-1].metadata["note"] == "é" * 99
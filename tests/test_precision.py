@@ -0,0 +1,107 @@
+"""
+test_precision.py - Single-precision policy (utils.precision)
+
+Runs the memory/brain hot paths in float32 and reports the accuracy drift
+against the float64 reference.
+"""
+import numpy as np
+import pytest
+
+from shunollo_core.config import config
+from shunollo_core.utils.precision import float_dtype, complex_dtype
+from shunollo_core.memory.holographic import HolographicMemory
+from shunollo_core.brain.autoencoder import Autoencoder
+from shunollo_core.brain.neural_net import LinearAssociativeMemory
+
+
+def _relative_drift(single, double) -> float:
+    double = np.asarray(double, dtype=np.float64)
+    scale = max(np.max(np.abs(double)), 1e-12)
+    return float(np.max(np.abs(np.asarray(single, dtype=np.float64) - double)) / scale)
+
+
+class TestPolicy:
+    
+    def test_default_is_double(self):
+        assert float_dtype() == np.float64
+        assert complex_dtype() == np.complex128
+    
+    def test_config_selects_single(self, monkeypatch):
+        monkeypatch.setitem(config._config, "precision", {"dtype": "float32"})
+        assert float_dtype() == np.float32
+        assert complex_dtype() == np.complex64
+        assert HolographicMemory(size=64).M.dtype == np.complex64
+        assert Autoencoder().W_enc1.dtype == np.float32
+        assert LinearAssociativeMemory().W_res.dtype == np.float32
+    
+    def test_explicit_override_wins(self, monkeypatch):
+        monkeypatch.setitem(config._config, "precision", {"dtype": "float32"})
+        assert float_dtype("float64") == np.float64
+    
+    def test_invalid_dtype_raises(self):
+        with pytest.raises(ValueError, match="float32 or float64"):
+            float_dtype("int32")
+
+
+class TestAccuracyDrift:
+    """float32 vs float64 reference on identical inputs."""
+    
+    @pytest.mark.parametrize("real", [False, True])
+    def test_holographic_drift(self, real):
+        rng = np.random.default_rng(7)
+        vectors, contexts = rng.standard_normal((32, 64)), rng.standard_normal((32, 64))
+        memories = {
+            dtype: HolographicMemory(size=1024, real=real, dtype=dtype)
+            for dtype in ("float32", "float64")
+        }
+        for mem in memories.values():
+            mem.encode_batch(vectors, contexts)
+        
+        single, double = memories["float32"], memories["float64"]
+        assert single.get_statistics()["total_bytes"] * 2 == double.get_statistics()["total_bytes"]
+        
+        r32, s32 = single.recall_batch(contexts)
+        r64, s64 = double.recall_batch(contexts)
+        assert r32.dtype == np.float32
+        drift = _relative_drift(r32, r64)
+        strength_drift = _relative_drift(s32, s64)
+        print(f"\n[Precision] Holographic (real={real}) recall drift: {drift:.2e}, "
+              f"strength drift: {strength_drift:.2e}")
+        assert drift < 1e-4
+        assert strength_drift < 1e-4
+    
+    def test_autoencoder_drift(self):
+        single, double = Autoencoder(dtype="float32"), Autoencoder(dtype="float64")
+        rng = np.random.default_rng(8)
+        samples = rng.random((50, 18))
+        for x in samples:
+            single.train_on_normal(x)
+            double.train_on_normal(x)
+        
+        assert single.W_enc1.dtype == np.float32
+        drift = _relative_drift(single.W_dec2, double.W_dec2)
+        score_drift = _relative_drift(
+            [single.calculate_anomaly_score(x) for x in samples[:10]],
+            [double.calculate_anomaly_score(x) for x in samples[:10]],
+        )
+        print(f"\n[Precision] Autoencoder weight drift: {drift:.2e}, score drift: {score_drift:.2e}")
+        assert drift < 1e-4
+        assert score_drift < 1e-3
+    
+    def test_reservoir_drift(self):
+        single = LinearAssociativeMemory(dtype="float32")
+        double = LinearAssociativeMemory(dtype="float64")
+        rng = np.random.default_rng(9)
+        for x in rng.random((50, 18)):
+            single.train(x, 1.0)
+            double.train(x, 1.0)
+        
+        assert single.state.dtype == np.float32
+        drift = _relative_drift(single.state, double.state)
+        score_drift = abs(
+            single.forward(np.full(18, 0.5))["classification_score"]
+            - double.forward(np.full(18, 0.5))["classification_score"]
+        )
+        print(f"\n[Precision] Reservoir state drift: {drift:.2e}, score drift: {score_drift:.2e}")
+        assert drift < 1e-4
+        assert score_drift < 1e-4
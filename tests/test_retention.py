@@ -0,0 +1,149 @@
+"""
+test_retention.py - Unit Tests for Episodic Segments, Retention and Consolidation
+
+Tests the Forgetting Curve of long-running nodes:
+- Size- and time-rotated segments (JSONL log and columnar store)
+- Retention deleting whole expired segments
+- Downsampling old episodes into k-means centroid episodes
+"""
+import time
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+from shunollo_core.models import ShunolloSignal
+from shunollo_core.memory.hippocampus import Hippocampus
+from shunollo_core.memory.episodic_store import ColumnarEpisodicStore
+
+NOW = 1_800_000_000.0
+
+
+def _episodes(start, n, age_start):
+    """n episodes, one second apart, the first age_start seconds before NOW."""
+    return [
+        ShunolloSignal(
+            energy=float(i % 5),
+            timestamp=datetime.fromtimestamp(NOW - age_start + i, timezone.utc),
+            metadata={"seq": start + i}
+        )
+        for i in range(n)
+    ]
+
+
+class TestStoreRetention:
+
+    def test_drop_before_removes_whole_segments(self, tmp_path):
+        store = ColumnarEpisodicStore(tmp_path, segment_size=10)
+        store.append(_episodes(0, 35, age_start=100))  # ages 100 .. 66
+
+        # Segment 0 (ages 100-91) and 1 (90-81) expire; segment 2 still holds age 75
+        assert store.drop_before(NOW - 80) == 20
+        assert len(store) == 15
+        assert store.tail(1).to_signals()[0].metadata["seq"] == 34
+
+    def test_consolidate_into_centroids(self, tmp_path):
+        store = ColumnarEpisodicStore(tmp_path, segment_size=10)
+        store.append(_episodes(0, 40, age_start=100))
+
+        removed = store.consolidate(before=NOW - 70, n_clusters=5)
+        assert removed == 25  # segments 0-2 (30 episodes) -> 5 centroids
+        assert len(store) == 15
+        assert sorted(p.name for p in tmp_path.glob("*.seg")) == [
+            "episodes-000002.c1.seg", "episodes-000003.seg"
+        ]
+
+        gist = store.tail(15).to_signals()[:5]
+        assert all(s.input_type == "consolidated" for s in gist)
+        assert sum(s.metadata["consolidated_count"] for s in gist) == 30
+        assert {s.energy for s in gist} <= {0.0, 1.0, 2.0, 3.0, 4.0}
+
+        # Consolidating again folds the earlier centroids in with their weight
+        store.consolidate(before=NOW, n_clusters=3)
+        gist = store.tail(15).to_signals()
+        assert sum(s.metadata.get("consolidated_count", 1) for s in gist) == 40
+
+    def test_time_rotation(self, tmp_path):
+        store = ColumnarEpisodicStore(tmp_path, segment_size=100, segment_seconds=0.05)
+        store.append(_episodes(0, 3, age_start=10))
+        time.sleep(0.06)
+        store.append(_episodes(3, 3, age_start=5))
+        assert len(list(tmp_path.glob("*.seg"))) == 2
+
+
+class TestHippocampusRetention:
+
+    def _hippocampus(self, tmp_path, **kwargs):
+        with patch("shunollo_core.memory.hippocampus.config") as cfg:
+            cfg.storage = {"cache_dir": str(tmp_path)}
+            return Hippocampus(**kwargs)
+
+    def test_jsonl_rotation_and_retention(self, tmp_path):
+        hippo = self._hippocampus(tmp_path, segment_bytes=4096, retention_seconds=50)
+        for signal in _episodes(0, 60, age_start=100):
+            hippo.remember(signal)
+
+        sealed = hippo._log_segments()
+        assert len(sealed) >= 2
+
+        # The cold start reads across the active log and sealed segments
+        reader = self._hippocampus(tmp_path, max_cache_size=40)
+        assert [s.metadata["seq"] for s in reader._load_cache()] == list(range(20, 60))
+
+        result = hippo.enforce_retention(now=NOW)
+        assert result["dropped"] > 0
+        assert len(hippo._log_segments()) < len(sealed)
+        remaining = list(self._hippocampus(tmp_path, max_cache_size=100)._load_cache())
+        assert len(remaining) == 60 - result["dropped"]
+        # Only whole segments that ended before the cutoff were removed
+        assert remaining[0].timestamp.timestamp() > NOW - 100
+        assert remaining[-1].metadata["seq"] == 59
+
+    def test_columnar_downsampling_and_background_pass(self, tmp_path):
+        hippo = self._hippocampus(
+            tmp_path, store="columnar", downsample_after=30,
+            consolidation_clusters=4, compact_interval=0.01
+        )
+        hippo.store.segment_size = 10
+        with patch("shunollo_core.memory.hippocampus.time.time", return_value=NOW):
+            hippo.remember_batch(_episodes(0, 50, age_start=100))
+            deadline = time.monotonic() + 5.0
+            while hippo.get_statistics()["retention"]["consolidated"] == 0:
+                assert time.monotonic() < deadline
+                time.sleep(0.01)
+        hippo.close()
+
+        cache = hippo._load_cache()
+        assert cache[0].input_type == "consolidated"
+        assert cache[-1].metadata["seq"] == 49
+
+    def test_cache_load_skips_vanished_segment(self, tmp_path):
+        from shunollo_core.memory import hippocampus as module
+        hippo = self._hippocampus(tmp_path, segment_bytes=4096)
+        for signal in _episodes(0, 60, age_start=100):
+            hippo.remember(signal)
+        oldest = hippo._log_segments()[0]
+        read = module._iter_tail_lines
+
+        def deleted_before_open(path, n):
+            if path == oldest:  # another node's retention pass wins the race
+                path.unlink()
+            return read(path, n)
+
+        with patch.object(module, "_iter_tail_lines", side_effect=deleted_before_open):
+            cache = self._hippocampus(tmp_path, max_cache_size=100)._load_cache()
+        assert cache and cache[-1].metadata["seq"] == 59
+
+    def test_retention_is_opt_in(self, tmp_path):
+        from shunollo_core.config import DEFAULT_CONFIG
+        assert DEFAULT_CONFIG["storage"]["retention_seconds"] is None
+        hippo = self._hippocampus(tmp_path, compact_interval=0.01)
+        assert hippo._compactor is None  # nothing to enforce: no thread deleting files
+        hippo.close()
+
+    def test_undated_active_log_still_rotates(self, tmp_path):
+        hippo = self._hippocampus(tmp_path, segment_seconds=0.05)
+        hippo.storage_path.write_text('{"legacy": true}\n', encoding="utf-8")
+        hippo.remember(ShunolloSignal(energy=1.0))
+        assert hippo._log_segments() == []
+        time.sleep(0.1)
+        hippo.remember(ShunolloSignal(energy=2.0))
+        assert len(hippo._log_segments()) == 1
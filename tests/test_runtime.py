@@ -0,0 +1,729 @@
+"""
+test_runtime.py - Unit Tests for the Runtime (Thalamus + Agents)
+
+Tests the agent loop and bus contracts without a Redis server:
+- AsyncThalamus middleware (plain and awaitable hooks)
+- Sync <-> async Thalamus adapters
+- BaseAgent.run_async keeps several stimuli in flight
+- Batched publish_many/consume_many and micro-batch agent loops
+- InMemoryThalamus and SharedMemoryThalamus (including across processes)
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict, deque
+from typing import Any, Dict
+
+import pytest
+
+from shunollo_runtime import (
+    AbstractThalamus,
+    AgentSupervisor,
+    AsyncThalamus,
+    AsyncThalamusAdapter,
+    AsyncThalamusMiddleware,
+    AsyncRedisThalamus,
+    DELIVERY_KEY,
+    BaseAgent,
+    BinaryCodec,
+    InMemoryThalamus,
+    RedisStreamThalamus,
+    RedisThalamus,
+    SharedMemoryThalamus,
+    SyncThalamusAdapter,
+    ThalamusMiddleware,
+    decode_message,
+    get_codec,
+)
+
+
+class _LocalThalamus(AbstractThalamus):
+    """Blocking bus over per-channel deques (test double for Redis)."""
+
+    def __init__(self, middleware=None):
+        super().__init__(middleware=middleware)
+        self.queues = defaultdict(deque)
+        self.cond = threading.Condition()
+        self.round_trips = 0
+
+    def publish_stimulus(self, channel, stimulus):
+        return self.publish_many(channel, [stimulus]) == 1
+
+    def publish_many(self, channel, stimuli):
+        payloads = [self._apply_publish_middleware(channel, s) for s in stimuli]
+        with self.cond:
+            self.round_trips += 1
+            self.queues[channel].extendleft(payloads)
+            self.cond.notify_all()
+        return len(payloads)
+
+    def consume_stimulus(self, channel, timeout=1):
+        batch = self.consume_many(channel, max_items=1, timeout=timeout)
+        return batch[0] if batch else None
+
+    def consume_many(self, channel, max_items=64, timeout=1):
+        with self.cond:
+            self.round_trips += 1
+            if not self.cond.wait_for(lambda: self.queues[channel], timeout):
+                return []
+            queued = self.queues[channel]
+            raw = [queued.pop() for _ in range(min(max_items, len(queued)))]
+        return [self._apply_receive_middleware(channel, p) for p in raw]
+
+    def broadcast_stimulus(self, channel, stimulus):
+        return self.publish_stimulus(channel, stimulus)
+
+    def is_healthy(self):
+        return True
+
+
+class _LocalAsyncThalamus(AsyncThalamus):
+    """asyncio bus over per-channel queues (test double for redis.asyncio)."""
+
+    def __init__(self, middleware=None):
+        super().__init__(middleware=middleware)
+        self.queues = defaultdict(asyncio.Queue)
+
+    async def publish_stimulus(self, channel, stimulus):
+        await self.queues[channel].put(await self._apply_publish_middleware(channel, stimulus))
+        return True
+
+    async def consume_stimulus(self, channel, timeout=1):
+        try:
+            payload = await asyncio.wait_for(self.queues[channel].get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        return await self._apply_receive_middleware(channel, payload)
+
+    async def broadcast_stimulus(self, channel, stimulus):
+        return await self.publish_stimulus(channel, stimulus)
+
+    async def is_healthy(self):
+        return True
+
+
+class _Tagger(ThalamusMiddleware):
+    def on_publish(self, channel, payload):
+        return dict(payload, tagged=True)
+
+    def on_receive(self, channel, payload):
+        return payload
+
+
+class _AsyncAudit(AsyncThalamusMiddleware):
+    def __init__(self):
+        self.seen = []
+
+    async def on_publish(self, channel, payload):
+        await asyncio.sleep(0)
+        return payload
+
+    async def on_receive(self, channel, payload):
+        await asyncio.sleep(0)
+        self.seen.append(payload["n"])
+        return payload
+
+
+class _SlowAgent(BaseAgent):
+    def analyze(self, stimulus: Dict[str, Any]) -> Dict[str, Any]:
+        return {"n": stimulus["n"]}
+
+    async def analyze_async(self, stimulus: Dict[str, Any]) -> Dict[str, Any]:
+        await asyncio.sleep(0.05)  # e.g. a remote enrichment call
+        return self.analyze(stimulus)
+
+
+class TestAsyncThalamus:
+
+    def test_mixed_middleware_is_awaited(self):
+        audit = _AsyncAudit()
+
+        async def scenario():
+            bus = _LocalAsyncThalamus(middleware=[_Tagger(), audit])
+            await bus.publish_stimulus("stimuli", {"n": 7})
+            return await bus.consume_stimulus("stimuli")
+
+        payload = asyncio.run(scenario())
+        assert payload == {"n": 7, "tagged": True}
+        assert audit.seen == [7]
+
+    def test_sync_adapter_round_trip(self):
+        adapter = SyncThalamusAdapter(_LocalAsyncThalamus())
+        try:
+            assert adapter.publish_stimulus("stimuli", {"n": 1})
+            assert adapter.consume_stimulus("stimuli", timeout=1) == {"n": 1}
+            assert adapter.consume_stimulus("stimuli", timeout=0.05) is None
+            assert adapter.is_healthy()
+        finally:
+            adapter.close()
+
+    def test_async_adapter_round_trip(self):
+        async def scenario():
+            bus = AsyncThalamusAdapter(_LocalThalamus(middleware=[_Tagger()]))
+            await bus.publish_stimulus("stimuli", {"n": 2})
+            return await bus.consume_stimulus("stimuli", timeout=1)
+
+        assert asyncio.run(scenario()) == {"n": 2, "tagged": True}
+
+
+class TestBaseAgentAsync:
+
+    def test_stimuli_are_processed_concurrently(self):
+        async def scenario():
+            bus = _LocalAsyncThalamus()
+            for n in range(20):
+                await bus.publish_stimulus("stimuli", {"n": n})
+            agent = _SlowAgent("slow", "test", thalamus=bus)
+            start = time.perf_counter()
+            await agent.run_async(max_iterations=20, concurrency=20)
+            elapsed = time.perf_counter() - start
+            results = [await bus.consume_stimulus("qualia", timeout=0.1) for _ in range(20)]
+            return elapsed, results
+
+        elapsed, results = asyncio.run(scenario())
+        assert sorted(r["n"] for r in results) == list(range(20))
+        assert all(r["_agent"] == "slow" for r in results)
+        assert elapsed < 20 * 0.05 / 2  # serial processing would take 1s
+
+    def test_run_async_over_blocking_thalamus(self):
+        bus = _LocalThalamus()
+        for n in range(5):
+            bus.publish_stimulus("stimuli", {"n": n})
+        agent = _SlowAgent("adapted", "test", thalamus=bus)
+        asyncio.run(agent.run_async(max_iterations=5, concurrency=5))
+        assert sorted(bus.consume_stimulus("qualia", timeout=0.1)["n"] for _ in range(5)) == list(range(5))
+
+    def test_blocking_run_over_async_thalamus(self):
+        async_bus = _LocalAsyncThalamus()
+        agent = _SlowAgent("legacy", "test", thalamus=async_bus)
+        adapter = agent._blocking_thalamus()
+        adapter.publish_stimulus("stimuli", {"n": 3})
+        agent.run(max_iterations=1)
+        assert adapter.consume_stimulus("qualia", timeout=1)["n"] == 3
+        adapter.close()
+
+    def test_invalid_concurrency(self):
+        agent = _SlowAgent("bad", "test")
+        with pytest.raises(ValueError):
+            asyncio.run(agent.run_async(concurrency=0))
+
+
+class _BatchAgent(BaseAgent):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.batch_sizes = []
+
+    def analyze(self, stimulus):
+        if stimulus["n"] == 13:
+            raise ValueError("unlucky stimulus")
+        return {"n": stimulus["n"] * 2}
+
+    def analyze_batch(self, stimuli):
+        self.batch_sizes.append(len(stimuli))
+        return [self.analyze(s) for s in stimuli]
+
+
+class TestBatchedThalamus:
+
+    def test_default_volley_contract(self):
+        async def scenario():
+            bus = _LocalAsyncThalamus(middleware=[_Tagger()])
+            assert await bus.publish_many("stimuli", [{"n": i} for i in range(3)]) == 3
+            return await bus.consume_many("stimuli", max_items=10, timeout=0.1)
+
+        # The fallback takes one stimulus per call, with middleware per message
+        assert asyncio.run(scenario()) == [{"n": 0, "tagged": True}]
+
+    def test_micro_batch_run(self):
+        bus = _LocalThalamus(middleware=[_Tagger()])
+        bus.publish_many("stimuli", [{"n": i} for i in range(20)])
+        agent = _BatchAgent("batch", "test", thalamus=bus)
+        bus.round_trips = 0
+        agent.run(max_iterations=3, batch_size=8)
+
+        assert agent.batch_sizes[:2] == [8, 8]
+        assert bus.round_trips == 3 + 3  # one consume and one publish per volley
+        results = bus.consume_many("qualia", max_items=100, timeout=0.1)
+        # A failing stimulus falls back to per-stimulus isolation; the rest survive
+        assert sorted(r["n"] for r in results) == [2 * i for i in range(20) if i != 13]
+        assert all(r["tagged"] and r["_agent"] == "batch" for r in results)
+
+    def test_async_micro_batches(self):
+        async def scenario():
+            agent = _SlowAgent("async-batch", "test", thalamus=AsyncThalamusAdapter(_LocalThalamus()))
+            inner = agent.thalamus.thalamus
+            inner.publish_many("stimuli", [{"n": i} for i in range(10)])
+            await agent.run_async(max_iterations=1, concurrency=10, batch_size=10)
+            return inner.consume_many("qualia", max_items=100, timeout=0.1)
+
+        results = asyncio.run(scenario())
+        assert sorted(r["n"] for r in results) == list(range(10))
+
+    def test_invalid_batch_size(self):
+        with pytest.raises(ValueError):
+            _BatchAgent("bad", "test").run(batch_size=0)
+
+    def test_blocking_pop_survives_failed_follow_up(self):
+        pytest.importorskip("redis")
+        payload = b'{"n": 1}'
+
+        class FlakyClient:
+            """The queue was empty, brpop got one message, then the link dropped."""
+            def __init__(self):
+                self.rpops = 0
+
+            def rpop(self, channel, count):
+                self.rpops += 1
+                if self.rpops > 1:
+                    raise ConnectionError("link dropped")
+                return None
+
+            def brpop(self, channel, timeout):
+                return (channel.encode(), payload)
+
+        class AsyncFlakyClient(FlakyClient):
+            async def rpop(self, channel, count):
+                return FlakyClient.rpop(self, channel, count)
+
+            async def brpop(self, channel, timeout):
+                return FlakyClient.brpop(self, channel, timeout)
+
+        bus = RedisThalamus()
+        bus._client = FlakyClient()
+        assert bus.consume_many("stimuli", max_items=10) == [{"n": 1}]
+
+        async def scenario():
+            bus = AsyncRedisThalamus()
+            bus._client = AsyncFlakyClient()
+            return await bus.consume_many("stimuli", max_items=10)
+
+        assert asyncio.run(scenario()) == [{"n": 1}]
+
+
+@pytest.fixture
+def shm_thalamus():
+    bus = SharedMemoryThalamus(name=f"test-{uuid.uuid4().hex[:8]}", capacity=1 << 16)
+    yield bus
+    bus.unlink()
+
+
+def _doubling_worker(name: str, count: int) -> None:
+    bus = SharedMemoryThalamus(name=name, capacity=1 << 16)
+    agent = _BatchAgent("worker", "test", thalamus=bus)
+    handled = 0
+    while handled < count:
+        stimuli = agent.consume_stimuli(64, timeout=5)
+        handled += len(stimuli)
+        agent.publish_results(agent._analyze_volley(stimuli))
+    bus.close()
+
+
+class TestLocalThalamus:
+
+    @pytest.mark.parametrize("kind", ["memory", "shared"])
+    def test_contract(self, kind, shm_thalamus):
+        if kind == "memory":
+            bus = InMemoryThalamus(middleware=[_Tagger()])
+        else:
+            bus = SharedMemoryThalamus(name=shm_thalamus.name, middleware=[_Tagger()])
+
+        assert bus.is_healthy()
+        assert bus.publish_stimulus("stimuli", {"n": 0})
+        assert bus.publish_many("stimuli", [{"n": i} for i in range(1, 10)]) == 9
+        first = bus.consume_stimulus("stimuli", timeout=1)
+        rest = bus.consume_many("stimuli", max_items=100, timeout=1)
+        assert [first["n"]] + [r["n"] for r in rest] == list(range(10))
+        assert all(r["tagged"] and "timestamp" in r for r in rest)
+        assert bus.consume_many("stimuli", timeout=0.05) == []
+        assert bus.depth("stimuli") == 0
+
+        queue_a = bus.subscribe("alerts", "a")
+        queue_b = bus.subscribe("alerts", "b")
+        assert bus.broadcast_stimulus("alerts", {"level": 3})
+        assert bus.consume_stimulus(queue_a, timeout=1)["level"] == 3
+        assert bus.consume_stimulus(queue_b, timeout=1)["level"] == 3
+        bus.unsubscribe("alerts", "b")
+        bus.broadcast_stimulus("alerts", {"level": 1})
+        assert bus.consume_stimulus(queue_b, timeout=0.05) is None
+        assert bus.consume_stimulus(queue_a, timeout=1)["level"] == 1
+        if kind == "shared":
+            bus.close()
+
+    def test_in_memory_wakes_sleeping_consumer(self):
+        bus = InMemoryThalamus()
+        threading.Timer(0.05, bus.publish_stimulus, args=("stimuli", {"n": 1})).start()
+        start = time.perf_counter()
+        assert bus.consume_stimulus("stimuli", timeout=5)["n"] == 1
+        assert time.perf_counter() - start < 1.0
+
+    def test_shared_ring_wraps_and_reports_full(self, shm_thalamus):
+        small = SharedMemoryThalamus(name=shm_thalamus.name + "-small", capacity=512)
+        try:
+            for round_ in range(20):  # many times the ring size: offsets wrap
+                sent = small.publish_many("stimuli", [{"round": round_, "i": i} for i in range(5)])
+                received = small.consume_many("stimuli", max_items=10, timeout=1)
+                assert [r["i"] for r in received] == list(range(sent))
+            assert small.publish_many("stimuli", [{"pad": "x" * 100}] * 10) < 10
+        finally:
+            small.unlink()
+
+    def test_shared_memory_across_processes(self, shm_thalamus):
+        ctx = multiprocessing.get_context("fork")
+        worker = ctx.Process(target=_doubling_worker, args=(shm_thalamus.name, 200))
+        worker.start()
+        shm_thalamus.publish_many("stimuli", [{"n": i} for i in range(200)])
+        results = []
+        deadline = time.monotonic() + 10
+        while len(results) < 199 and time.monotonic() < deadline:
+            results.extend(shm_thalamus.consume_many("qualia", max_items=256, timeout=1))
+        worker.join(10)
+        assert worker.exitcode == 0
+        # n == 13 raises in the worker's analyze and is isolated
+        assert sorted(r["n"] for r in results) == [2 * i for i in range(200) if i != 13]
+
+
+
+_PAYLOAD = {
+    "energy": 0.25,
+    "entropy": 3,
+    "roughness": "n/a",  # non-numeric physics values travel in the remainder
+    "source": "sensor-7",
+    "ok": True,
+    "none": None,
+    "count": -123456789012,
+    "vector": [0.1, 0.2, 0.3, 0.4, 0.5],
+    "mixed": [1, "two", 3.0, [False]],
+    "metadata": {"domain": "network", "tags": ["a", "b"], "nested": {"x": 1.5}},
+}
+
+
+class TestCodecs:
+
+    @pytest.mark.parametrize("name", ["json", "binary"])
+    def test_lossless_round_trip(self, name):
+        codec = get_codec(name)
+        data = codec.encode(_PAYLOAD)
+        assert codec.decode(data) == _PAYLOAD
+        assert decode_message(data) == _PAYLOAD
+
+    def test_binary_is_smaller_than_json(self):
+        assert len(get_codec("binary").encode(_PAYLOAD)) < len(get_codec("json").encode(_PAYLOAD))
+
+    def test_somatic_packs_physics_as_float32(self):
+        payload = dict(_PAYLOAD, frequency=0.1)
+        decoded = decode_message(get_codec("somatic").encode(payload))
+        assert decoded["frequency"] == pytest.approx(0.1, rel=1e-6)
+        assert decoded["frequency"] != 0.1  # float32-rounded
+        assert decoded["energy"] == 0.25 and decoded["entropy"] == 3.0
+        assert decoded["roughness"] == "n/a"
+        assert "viscosity" not in decoded
+        assert {k: v for k, v in decoded.items() if k not in ("frequency", "entropy")} == \
+            {k: v for k, v in _PAYLOAD.items() if k != "entropy"}
+
+    def test_somatic_keeps_values_beyond_float32(self):
+        payload = {"energy": 1e39, "entropy": -1e300, "frequency": float("inf"), "roughness": 2.5}
+        decoded = decode_message(get_codec("somatic").encode(payload))
+        # Out of float32 range: carried exactly in the remainder, not dropped
+        assert decoded["energy"] == 1e39 and decoded["entropy"] == -1e300
+        assert decoded["frequency"] == float("inf") and decoded["roughness"] == 2.5
+        nan = decode_message(get_codec("somatic").encode({"energy": float("nan")}))["energy"]
+        assert nan != nan
+
+    def test_numpy_values_encode(self):
+        np = pytest.importorskip("numpy")
+        decoded = decode_message(get_codec("binary").encode({"v": np.arange(4.0), "n": np.int64(7)}))
+        assert decoded == {"v": [0.0, 1.0, 2.0, 3.0], "n": 7}
+
+    def test_legacy_json_and_errors(self):
+        assert decode_message(b' {"a": 1}') == {"a": 1}
+        assert decode_message('{"a": 1}') == {"a": 1}
+        with pytest.raises(ValueError):
+            decode_message(b"\xff\x00")
+        with pytest.raises(ValueError):
+            decode_message(b"")
+        with pytest.raises(ValueError):
+            get_codec("protobuf")
+        assert isinstance(get_codec(BinaryCodec()), BinaryCodec)
+
+    @pytest.mark.parametrize("name", ["binary", "somatic"])
+    def test_truncated_binary_is_value_error(self, name):
+        data = get_codec(name).encode(dict(_PAYLOAD, vector=[0.5] * 8, raw=b"xyz"))
+        for end in range(1, len(data)):
+            with pytest.raises(ValueError, match="Corrupt binary payload"):
+                decode_message(data[:end])
+
+    def test_mixed_codecs_share_a_bus(self, shm_thalamus):
+        binary = SharedMemoryThalamus(name=shm_thalamus.name, codec="binary")
+        somatic = SharedMemoryThalamus(name=shm_thalamus.name, codec="somatic")
+        try:
+            shm_thalamus.publish_stimulus("stimuli", {"n": 0, "energy": 0.5})
+            binary.publish_stimulus("stimuli", {"n": 1, "energy": 0.5})
+            somatic.publish_stimulus("stimuli", {"n": 2, "energy": 0.5})
+            received = shm_thalamus.consume_many("stimuli", max_items=10, timeout=1)
+            assert [(r["n"], r["energy"]) for r in received] == [(0, 0.5), (1, 0.5), (2, 0.5)]
+        finally:
+            binary.close()
+            somatic.close()
+
+
+class _AckingThalamus(_LocalThalamus):
+    """_LocalThalamus with acknowledged delivery: tags stimuli and records acks."""
+
+    def __init__(self, publish_ok=True):
+        super().__init__()
+        self.publish_ok = publish_ok
+        self.acked = []
+        self._ids = 0
+
+    def publish_many(self, channel, stimuli):
+        return super().publish_many(channel, stimuli) if self.publish_ok else 0
+
+    def consume_many(self, channel, max_items=64, timeout=1):
+        stimuli = super().consume_many(channel, max_items, timeout)
+        for stimulus in stimuli:
+            self._ids += 1
+            stimulus[DELIVERY_KEY] = f"{self._ids}-0"
+        return stimuli
+
+    def acknowledge(self, channel, stimuli):
+        self.acked.extend((channel, s[DELIVERY_KEY]) for s in stimuli)
+        return len(stimuli)
+
+
+class TestAcknowledgedDelivery:
+
+    @pytest.mark.parametrize("batch_size", [1, 8])
+    def test_acknowledges_after_publishing(self, batch_size):
+        bus = _AckingThalamus()
+        bus.queues["stimuli"].extendleft({"n": i} for i in range(16))
+        agent = _BatchAgent("acker", "test", thalamus=bus)
+        agent.run(max_iterations=16 // batch_size, batch_size=batch_size)
+        # The failing stimulus (n == 13) is acknowledged too: it was handled
+        assert sorted(int(i.split("-")[0]) for _, i in bus.acked) == list(range(1, 17))
+        assert {channel for channel, _ in bus.acked} == {"stimuli"}
+        stats = agent.get_statistics()
+        assert (stats["processed"], stats["failed"]) == (15, 1)
+        assert stats["volleys"] == 16 // batch_size
+
+    def test_unpublished_results_stay_unacknowledged(self):
+        bus = _AckingThalamus(publish_ok=False)
+        bus.queues["stimuli"].extendleft({"n": i} for i in range(4))
+        agent = _BatchAgent("acker", "test", thalamus=bus)
+        agent.run(max_iterations=1, batch_size=4)
+        agent.run(max_iterations=1)
+        assert bus.acked == []
+
+    def test_async_acknowledges_each_stimulus(self):
+        bus = _AckingThalamus()
+        bus.queues["stimuli"].extendleft({"n": i} for i in range(5))
+        agent = _SlowAgent("async-acker", "test", thalamus=bus)
+        asyncio.run(agent.run_async(max_iterations=1, batch_size=5))
+        assert len(bus.acked) == 5
+
+    def test_list_buses_acknowledge_nothing(self):
+        assert InMemoryThalamus().acknowledge("stimuli", [{"n": 1}]) == 0
+
+    def test_invalid_stream_limits(self):
+        with pytest.raises(ValueError):
+            RedisStreamThalamus(claim_idle=0)
+        with pytest.raises(ValueError):
+            RedisStreamThalamus(max_deliveries=0)
+
+
+    def test_stream_depth_is_none_when_unreachable(self):
+        pytest.importorskip("redis")
+
+        class DownClient:
+            def __getattr__(self, name):
+                def fail(*args, **kwargs):
+                    raise ConnectionError("link dropped")
+                return fail
+
+        bus = RedisStreamThalamus()
+        bus._client = DownClient()
+        assert bus.depth("stimuli") is None
+
+    @pytest.mark.parametrize("idle_filter", [True, False])
+    def test_reclaim_finds_stale_entries_behind_live_ones(self, idle_filter):
+        redis = pytest.importorskip("redis")
+        # 150 entries held by a live replica, then 150 left by a crashed one
+        pending = [
+            {"message_id": f"1-{i}".encode(), "consumer": b"live" if i < 150 else b"crashed",
+             "time_since_delivered": 10 if i < 150 else 60_000, "times_delivered": 1}
+            for i in range(300)
+        ]
+
+        class PendingClient:
+            def xpending_range(self, channel, group, min, max, count, idle=None):
+                if idle is not None:
+                    if not idle_filter:
+                        raise redis.exceptions.ResponseError("syntax error")  # Redis < 6.2
+                    return [p for p in pending if p["time_since_delivered"] >= idle][:count]
+                start = 0 if min == "-" else int(min.split("-")[1])
+                return [p for p in pending if int(p["message_id"].split(b"-")[1]) >= start][:count]
+
+            def xclaim(self, channel, group, consumer, min_idle, ids):
+                return [(entry_id, {b"d": b'{"n": 1}'}) for entry_id in ids]
+
+        bus = RedisStreamThalamus(claim_idle=30.0)
+        bus._client = PendingClient()
+        reclaimed = bus._reclaim("stimuli", 64)
+        assert [entry_id for entry_id, _ in reclaimed] == [f"1-{i}".encode() for i in range(150, 214)]
+
+@pytest.fixture
+def stream_channel():
+    pytest.importorskip("redis")
+    if not RedisStreamThalamus().is_healthy():
+        pytest.skip("no Redis server")
+    channel = f"test-stream-{uuid.uuid4().hex[:8]}"
+    yield channel
+    RedisStreamThalamus().client.delete(channel, channel + ":dead")
+
+
+class TestRedisStreams:
+
+    def test_replicas_share_a_channel(self, stream_channel):
+        a = RedisStreamThalamus(consumer="a")
+        b = RedisStreamThalamus(consumer="b")
+        a.consume_many(stream_channel, timeout=0)  # creates the group
+        assert a.publish_many(stream_channel, [{"n": i} for i in range(10)]) == 10
+        got_a = a.consume_many(stream_channel, max_items=5, timeout=1)
+        got_b = b.consume_many(stream_channel, max_items=10, timeout=1)
+        assert sorted(s["n"] for s in got_a + got_b) == list(range(10))
+        assert len(got_a) == 5 and len(got_b) == 5
+
+        lag = a.get_lag(stream_channel)
+        assert lag["pending"] == 10
+        assert lag["consumers"]["a"]["pending"] == 5
+        assert a.acknowledge(stream_channel, got_a) == 5
+        assert b.acknowledge(stream_channel, got_b) == 5
+        assert a.depth(stream_channel) == 0
+
+    def test_crashed_replica_is_reclaimed_then_dead_lettered(self, stream_channel):
+        crashed = RedisStreamThalamus(consumer="crashed", claim_idle=0.05, max_deliveries=2)
+        survivor = RedisStreamThalamus(consumer="survivor", claim_idle=0.05, max_deliveries=2)
+        crashed.publish_stimulus(stream_channel, {"n": 1})
+        assert crashed.consume_stimulus(stream_channel, timeout=1)["n"] == 1  # never acknowledged
+
+        time.sleep(0.1)
+        redelivered = survivor.consume_stimulus(stream_channel, timeout=0)
+        assert redelivered["n"] == 1
+        assert survivor.get_lag(stream_channel)["consumers"]["survivor"]["pending"] == 1
+
+        time.sleep(0.1)  # the survivor stalls too: two deliveries is the limit
+        assert survivor.consume_stimulus(stream_channel, timeout=0) is None
+        lag = survivor.get_lag(stream_channel)
+        assert lag["pending"] == 0 and lag["dead_letters"] == 1
+
+
+class _PacedAgent(BaseAgent):
+    """Takes ~2ms per stimulus; a {"crash": True} stimulus kills the process."""
+
+    def analyze(self, stimulus):
+        if stimulus.get("crash"):
+            os._exit(3)
+        time.sleep(0.002)
+        return {"n": stimulus["n"], "channel": self.input_channel}
+
+
+def _collect(bus, supervisor, expected, timeout=20.0):
+    results = []
+    deadline = time.monotonic() + timeout
+    while len(results) < expected and time.monotonic() < deadline:
+        results.extend(bus.consume_many("qualia", max_items=256, timeout=0.1))
+        supervisor.supervise()
+    return results
+
+
+class TestAgentSupervisor:
+
+    @pytest.fixture
+    def supervised(self, shm_thalamus):
+        factory = functools.partial(SharedMemoryThalamus, name=shm_thalamus.name, capacity=1 << 16)
+        supervisor = AgentSupervisor(factory, report_interval=0.05, restart_backoff=0.05, scale_down_ticks=2)
+        yield shm_thalamus, supervisor
+        supervisor.stop()
+
+    def test_pool_spreads_channels_and_reports(self, supervised):
+        bus, supervisor = supervised
+        supervisor.add_pool("paced", _PacedAgent, channels=["left", "right"], workers=2, max_workers=2, batch_size=8)
+        bus.publish_many("left", [{"n": i} for i in range(40)])
+        bus.publish_many("right", [{"n": i} for i in range(40)])
+        supervisor.start()
+        results = _collect(bus, supervisor, 80)
+        assert sorted((r["channel"], r["n"]) for r in results) == sorted(
+            (channel, i) for channel in ("left", "right") for i in range(40)
+        )
+
+        time.sleep(0.15)  # one more report round
+        stats = supervisor.get_statistics()["paced"]
+        assert stats["workers"] == 2 and stats["restarts"] == 0
+        assert stats["processed"] == 80 and stats["failed"] == 0
+        assert stats["latency_ms"]["mean"] > 0
+        assert {w["channel"] for w in stats["per_worker"].values()} == {"left", "right"}
+        supervisor.stop()
+        assert supervisor.get_statistics()["paced"]["processed"] == 80
+
+    def test_crashed_worker_is_restarted(self, supervised):
+        bus, supervisor = supervised
+        supervisor.add_pool("paced", _PacedAgent, workers=1, max_workers=1, batch_size=1)
+        bus.publish_many("stimuli", [{"crash": True}] + [{"n": i} for i in range(20)])
+        supervisor.start()
+        results = _collect(bus, supervisor, 20)
+        assert sorted(r["n"] for r in results) == list(range(20))
+        stats = supervisor.get_statistics()["paced"]
+        assert stats["restarts"] == 1 and stats["workers"] == 1
+
+    def test_scales_with_queue_depth(self, supervised):
+        bus, supervisor = supervised
+        supervisor.add_pool("paced", _PacedAgent, min_workers=1, max_workers=3, target_depth=20, batch_size=1)
+        bus.publish_many("stimuli", [{"n": i} for i in range(300)])
+        supervisor.start()
+        supervisor.supervise()
+        assert supervisor.get_statistics()["paced"]["desired"] == 3
+
+        results = _collect(bus, supervisor, 300)
+        assert len(results) == 300
+        for _ in range(10):  # idle ticks: shrink one worker per scale_down_ticks
+            supervisor.supervise()
+        assert supervisor.get_statistics()["paced"]["desired"] == 1
+
+    def test_stop_without_supervise_keeps_final_reports(self, shm_thalamus, capsys):
+        factory = functools.partial(SharedMemoryThalamus, name=shm_thalamus.name, capacity=1 << 16)
+        supervisor = AgentSupervisor(factory, report_interval=0.001)
+        supervisor.add_pool("paced", _PacedAgent, workers=1, max_workers=1, batch_size=8)
+        shm_thalamus.publish_many("stimuli", [{"n": i} for i in range(20)])
+        supervisor.start()
+        time.sleep(1.0)  # never supervised: reports pile up beyond the pipe buffer
+        supervisor.stop(timeout=5.0)
+        assert "Terminating" not in capsys.readouterr().out
+        assert supervisor.get_statistics()["paced"]["processed"] == 20
+
+    def test_depth_errors_keep_supervising(self, supervised, capsys):
+        bus, supervisor = supervised
+
+        class _Blip(InMemoryThalamus):
+            def depth(self, channel):
+                raise ConnectionError("link dropped")
+
+        supervisor.thalamus_factory = _Blip
+        supervisor.add_pool("paced", _PacedAgent, min_workers=1, max_workers=3, batch_size=1)
+        supervisor.start()
+        supervisor.supervise()
+        stats = supervisor.get_statistics()["paced"]
+        assert stats["desired"] == 1 and stats["depth"] is None
+        assert "Depth read failed" in capsys.readouterr().out
+
+    def test_invalid_pools(self, supervised):
+        _, supervisor = supervised
+        with pytest.raises(ValueError):
+            supervisor.add_pool("bad", _PacedAgent, min_workers=0)
+        with pytest.raises(ValueError):
+            supervisor.add_pool("bad", _PacedAgent, workers=4, max_workers=2)
+        supervisor.add_pool("ok", _PacedAgent, max_workers=1)
+        with pytest.raises(ValueError):
+            supervisor.add_pool("ok", _PacedAgent, max_workers=1)